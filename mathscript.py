@@ -11,6 +11,12 @@ debug_modes_list_str = ', '.join(f"'{mode}'" for mode in debug_modes_list[:-1])
 version = {'major': 1, 'minor': 0, 'build': 1, 'revision': None}
 version_str = f'{version['major']}{f'.{version['minor']}{f'.{version['build']}{f'.{version['revision']}' if version['revision'] is not None else ''}' if version['build'] is not None else ''}' if version['minor'] is not None else ''}'
 debug_mode = False
+default_precision = 50
+numeric_modes_list = ['precise', 'fast']
+numeric_mode = 'precise'
+exact_division = False
+persistent_cache_file = '.mathscript_cache.sqlite3'
+persistent_cache_max_entries = 100000
 
 ##########################################################
 # IMPORTS
@@ -20,11 +26,29 @@ import re
 from strings_with_arrows import *
 from mpmath import mpf, mpc, mp # type: ignore
 from colorama import just_fix_windows_console # type: ignore
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from fractions import Fraction
+import hashlib
+import weakref
+import bisect
+import itertools
+import sqlite3
+import time
+import atexit
+import ast
+try:
+	import numpy as np # type: ignore
+except ImportError:
+	np = None
+import operator
 import string
+import math
+import cmath
 import sys
 
 just_fix_windows_console()
-mp.dps = 1000
+mp.dps = default_precision
 
 ##########################################################
 # CONSTANTS
@@ -33,6 +57,8 @@ mp.dps = 1000
 DIGITS = '0123456789'
 LETTERS = string.ascii_letters
 LETTERS_DIGITS = LETTERS + DIGITS
+SMALL_INTEGER_MIN = -256
+SMALL_INTEGER_MAX = 1024
 
 ##########################################################
 # ERRORS
@@ -66,8 +92,10 @@ class Error:
 		self.details = formatted_text
 	
 	def as_string(self):
-		result  = f'{self.error_name}: {self.details}\n'
-		result += f'File {self.pos_start.fn}, line {self.pos_start.ln + 1} at column {self.pos_start.col}'
+		result  = f'{self.error_name}: {self.details}'
+		if self.pos_start is None or self.pos_end is None: return result
+
+		result += f'\nFile {self.pos_start.fn}, line {self.pos_start.ln + 1} at column {self.pos_start.col}'
 		result += f'\n\n{string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)}'
 
 		return result
@@ -84,6 +112,12 @@ class InvalidSyntaxError(Error):
 	def __init__(self, pos_start, pos_end, details=''):
 		super().__init__(pos_start, pos_end, 'Invalid Syntax', details)
 
+class IterationError(Exception):
+	# Raised while a lazy sequence is being consumed and one of its elements fails to compute
+	def __init__(self, error):
+		super().__init__(error.details)
+		self.error = error
+
 class RTError(Error):
 	def __init__(self, pos_start, pos_end, details, context):
 		super().__init__(pos_start, pos_end, 'Runtime Error', details)
@@ -92,7 +126,8 @@ class RTError(Error):
 	def as_string(self):
 		result  = self.generate_traceback()
 		result += f'{self.error_name}: {self.details}'
-		result += f'\n\n{string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)}'
+		if self.pos_start is not None and self.pos_end is not None:
+			result += f'\n\n{string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)}'
 
 		return result
 	
@@ -102,7 +137,8 @@ class RTError(Error):
 		ctx = self.context
 
 		while ctx:
-			result = f'  File {pos.fn}, line {str(pos.ln + 1)}, in {ctx.display_name}\n' + result
+			if pos is not None:
+				result = f'  File {pos.fn}, line {str(pos.ln + 1)}, in {ctx.display_name}\n' + result
 			pos = ctx.parent_entry_pos
 			ctx = ctx.parent
 
@@ -155,6 +191,9 @@ TT_LPAREN       = 'LPAREN'
 TT_RPAREN       = 'RPAREN'
 TT_LSQUARE      = 'LSQUARE'
 TT_RSQUARE      = 'RSQUARE'
+TT_LBRACE       = 'LBRACE'
+TT_RBRACE       = 'RBRACE'
+TT_COLON        = 'COLON'
 TT_EE           = 'EE'
 TT_NE           = 'NE'
 TT_LT           = 'LT'
@@ -166,6 +205,20 @@ TT_ARROW        = 'ARROW'
 TT_NEWLINE      = 'NEWLINE'
 TT_EOF          = 'EOF'
 
+OPERATOR_SYMBOLS = {
+	TT_PLUS: '+',
+	TT_MINUS: '-',
+	TT_MUL: '*',
+	TT_DIV: '/',
+	TT_POW: '^',
+	TT_EE: '==',
+	TT_NE: '!=',
+	TT_LT: '<',
+	TT_GT: '>',
+	TT_LTE: '<=',
+	TT_GTE: '>='
+}
+
 KEYWORDS = [
 	'and',
 	'or',
@@ -176,6 +229,7 @@ KEYWORDS = [
 	'for',
 	'to',
 	'step',
+	'in',
 	'while',
 	'func',
 	'then',
@@ -183,7 +237,9 @@ KEYWORDS = [
 	'end',
 	'return',
 	'break',
-	'continue'
+	'continue',
+	'precision',
+	'yield'
 ]
 
 class Token:
@@ -203,7 +259,7 @@ class Token:
 		return self.type == type_ and self.value == value
 
 	def __repr__(self):
-		if isinstance(self.value, complex): return repr(self.value).replace('j', 'i')
+		if self.type == TT_COMPLEX: return f'{self.value}i'
 		if self.value is not None: return f'{self.type}:{self.value}'
 		return f'{self.type}'
 
@@ -272,6 +328,15 @@ class Lexer:
 			elif self.current_char == ']':
 				tokens.append(Token(TT_RSQUARE, pos_start=self.pos))
 				self.advance()
+			elif self.current_char == '{':
+				tokens.append(Token(TT_LBRACE, pos_start=self.pos))
+				self.advance()
+			elif self.current_char == '}':
+				tokens.append(Token(TT_RBRACE, pos_start=self.pos))
+				self.advance()
+			elif self.current_char == ':':
+				tokens.append(Token(TT_COLON, pos_start=self.pos))
+				self.advance()
 			elif self.current_char == '!':
 				token, error = self.make_not_equals()
 				if error: return [], error
@@ -305,18 +370,20 @@ class Lexer:
 				if dot_count == 1: break
 				dot_count += 1
 			if self.current_char == 'i':
-				if i_count == 1: break
 				i_count += 1
-			num_str += self.current_char.replace('i', 'j')
+				self.advance()
+				break
+			num_str += self.current_char
 
 			self.advance()
 		
+		# Decimal and complex tokens keep their source digits so they are parsed once, without a float detour
 		if i_count == 1:
-			return Token(TT_COMPLEX, complex(num_str), pos_start, self.pos)
+			return Token(TT_COMPLEX, num_str, pos_start, self.pos)
 
 		if dot_count == 0:
 			return Token(TT_INTEGER, int(num_str), pos_start, self.pos)
-		else: return Token(TT_DECIMAL, float(num_str), pos_start, self.pos)
+		else: return Token(TT_DECIMAL, num_str, pos_start, self.pos)
 
 	def make_string(self, quote):
 		string = ''
@@ -433,6 +500,7 @@ class Lexer:
 class IntegerNode:
 	def __init__(self, tok):
 		self.tok = tok
+		self.value = Integer(self.tok.value).intern()
 
 		self.pos_start = self.tok.pos_start
 		self.pos_end = self.tok.pos_end
@@ -443,6 +511,9 @@ class IntegerNode:
 class DecimalNode:
 	def __init__(self, tok):
 		self.tok = tok
+		# Built on first evaluation, and rebuilt only if the precision or the numeric mode changes
+		self.value = None
+		self.value_key = None
 
 		self.pos_start = self.tok.pos_start
 		self.pos_end = self.tok.pos_end
@@ -453,6 +524,8 @@ class DecimalNode:
 class ComplexNode:
 	def __init__(self, tok):
 		self.tok = tok
+		self.value = None
+		self.value_key = None
 
 		self.pos_start = self.tok.pos_start
 		self.pos_end = self.tok.pos_end
@@ -463,6 +536,7 @@ class ComplexNode:
 class StringNode:
 	def __init__(self, tok):
 		self.tok = tok
+		self.value = String(self.tok.value).intern()
 
 		self.pos_start = self.tok.pos_start
 		self.pos_end = self.tok.pos_end
@@ -475,12 +549,22 @@ class ListNode:
 		self.element_nodes = element_nodes
 		self.pos_start = pos_start
 		self.pos_end = pos_end
+		self.should_return_null = False
 
 	def __repr__(self):
 		if len(self.element_nodes) == 0:
 			return 'LIST:()'
 		return f"LIST:({self.element_nodes[0]},{','.join(' ' + str(x) for x in self.element_nodes[1:])})"
 	
+class MapNode:
+	def __init__(self, pair_nodes, pos_start, pos_end):
+		self.pair_nodes = pair_nodes
+		self.pos_start = pos_start
+		self.pos_end = pos_end
+
+	def __repr__(self):
+		return f"MAP:{{{', '.join(f'{key}: {value}' for key, value in self.pair_nodes)}}}"
+
 class PassNode:
 	def __init__(self, pos_start, pos_end):
 		self.pos_start = pos_start
@@ -552,6 +636,8 @@ class ForNode:
 		self.step_value_node = step_value_node
 		self.body_node = body_node
 		self.should_return_null = should_return_null
+		# Whether the body may read the counter, worked out the first time the loop runs
+		self.body_reads_counter = None
 
 		self.pos_start = self.var_name_tok.pos_start
 		self.pos_end = self.body_node.pos_end
@@ -559,6 +645,19 @@ class ForNode:
 	def __repr__(self):
 		return f"FOR:({self.var_name_tok.value}: {self.start_value_node} -> {self.end_value_node} {f'({self.step_value_node})' if self.step_value_node else '\b'} => {self.body_node})"
 
+class ForInNode:
+	def __init__(self, var_name_tok, iterable_node, body_node, should_return_null):
+		self.var_name_tok = var_name_tok
+		self.iterable_node = iterable_node
+		self.body_node = body_node
+		self.should_return_null = should_return_null
+
+		self.pos_start = self.var_name_tok.pos_start
+		self.pos_end = self.body_node.pos_end
+
+	def __repr__(self):
+		return f"FOR:({self.var_name_tok.value} in {self.iterable_node} => {self.body_node})"
+
 class WhileNode:
 	def __init__(self, condition_node, body_node, should_return_null):
 		self.condition_node = condition_node
@@ -571,12 +670,25 @@ class WhileNode:
 	def __repr__(self):
 		return f"WHILE:({self.condition_node}? {self.body_node})"
 
+class PrecisionNode:
+	def __init__(self, digits_node, body_node, should_return_null, pos_start):
+		self.digits_node = digits_node
+		self.body_node = body_node
+		self.should_return_null = should_return_null
+
+		self.pos_start = pos_start
+		self.pos_end = (self.body_node or self.digits_node).pos_end
+
+	def __repr__(self):
+		return f"PRECISION:({self.digits_node}{f' => {self.body_node}' if self.body_node else ''})"
+
 class FuncDefNode:
-	def __init__(self, var_name_tok, arg_name_toks, body_node, should_auto_return):
+	def __init__(self, var_name_tok, arg_name_toks, body_node, should_auto_return, is_generator=False):
 		self.var_name_tok = var_name_tok
 		self.arg_name_toks = arg_name_toks
 		self.body_node = body_node
 		self.should_auto_return = should_auto_return
+		self.is_generator = is_generator
 
 		if self.var_name_tok is not None:
 			self.pos_start = self.var_name_tok.pos_start
@@ -602,6 +714,16 @@ class CallNode:
 	def __repr__(self):
 		return f"FUNC_CALL:{self.node_to_call.var_name_tok.value}({', '.join(repr(x) for x in self.arg_nodes)})"
 
+class YieldNode:
+	def __init__(self, node_to_yield, pos_start, pos_end):
+		self.node_to_yield = node_to_yield
+
+		self.pos_start = pos_start
+		self.pos_end = pos_end
+
+	def __repr__(self):
+		return f"YIELD:({self.node_to_yield})"
+
 class ReturnNode:
 	def __init__(self, node_to_return, pos_start, pos_end):
 		self.node_to_return = node_to_return
@@ -628,6 +750,85 @@ class BreakNode:
 	def __repr__(self):
 		return f"BREAK"
 
+##########################################################
+# USAGE ANALYSIS
+##########################################################
+
+def iter_child_nodes(node):
+	def nodes_in(value):
+		if isinstance(value, (list, tuple)):
+			for item in value: yield from nodes_in(item)
+		elif type(value).__name__.endswith('Node'):
+			yield value
+
+	for value in vars(node).values():
+		yield from nodes_in(value)
+
+def mark_unused_results(node, used=True):
+	# Sets should_return_null on the loops and statement lists whose value is never read, so the interpreter
+	# doesn't keep one value per iteration or statement alive only to throw the List away
+	if isinstance(node, (ListNode, ForNode, ForInNode, WhileNode)):
+		if not used: node.should_return_null = True
+		body_used = not node.should_return_null
+
+		if isinstance(node, ListNode):
+			for element_node in node.element_nodes: mark_unused_results(element_node, body_used)
+			return
+		for child in iter_child_nodes(node):
+			mark_unused_results(child, body_used if child is node.body_node else True)
+	elif isinstance(node, IfNode):
+		for condition, expr, should_return_null in node.cases:
+			mark_unused_results(condition)
+			mark_unused_results(expr, used and not should_return_null)
+		if node.else_case:
+			expr, should_return_null = node.else_case
+			mark_unused_results(expr, used and not should_return_null)
+	elif isinstance(node, PrecisionNode):
+		mark_unused_results(node.digits_node)
+		if node.body_node: mark_unused_results(node.body_node, used and not node.should_return_null)
+	elif isinstance(node, FuncDefNode):
+		mark_unused_results(node.body_node, node.should_auto_return and not node.is_generator)
+	else:
+		for child in iter_child_nodes(node):
+			mark_unused_results(child)
+
+def may_read_variable(node, name):
+	# Calls are counted as reads since the function called could read the variable from an outer scope
+	if isinstance(node, VarAccessNode) and node.var_name_tok.value == name: return True
+	if isinstance(node, CallNode): return True
+	return any(may_read_variable(child, name) for child in iter_child_nodes(node))
+
+def contains_yield(node):
+	# Whether running this node can run a 'yield', not counting the bodies of the functions it defines
+	if not hasattr(node, 'yields'):
+		if isinstance(node, (YieldNode, FuncDefNode)):
+			node.yields = isinstance(node, YieldNode)
+		else:
+			node.yields = any(contains_yield(child) for child in iter_child_nodes(node))
+	return node.yields
+
+def misplaced_yield(node, is_statement=True):
+	# The first 'yield' a generator can't suspend at: one inside an expression instead of a statement of the
+	# body, a loop, an if or a precision block
+	if isinstance(node, FuncDefNode) or not contains_yield(node): return None
+	if isinstance(node, YieldNode):
+		return misplaced_yield(node.node_to_yield, False) if is_statement else node
+
+	statement_nodes = []
+	if is_statement:
+		if isinstance(node, ListNode):
+			statement_nodes = node.element_nodes
+		elif isinstance(node, IfNode):
+			statement_nodes = [expr for condition, expr, should_return_null in node.cases]
+			if node.else_case: statement_nodes.append(node.else_case[0])
+		elif isinstance(node, (ForNode, ForInNode, WhileNode, PrecisionNode)):
+			statement_nodes = [node.body_node]
+
+	for child in iter_child_nodes(node):
+		found = misplaced_yield(child, any(child is statement_node for statement_node in statement_nodes))
+		if found: return found
+	return None
+
 ##########################################################
 # PARSE RESULT
 ##########################################################
@@ -673,6 +874,8 @@ class Parser:
 	def __init__(self, tokens):
 		self.tokens = tokens
 		self.tok_idx = -1
+		# One entry per function being parsed, set once its body contains a 'yield'
+		self.function_yields = []
 		self.advance()
 
 	def advance(self, count=1):
@@ -744,6 +947,22 @@ class Parser:
 			if not expr: self.advance(-res.to_reverse_count)
 
 			return res.success(ReturnNode(expr, pos_start, self.current_tok.pos_start.copy()))
+
+		if self.current_tok.matches(TT_KEYWORD, 'yield'):
+			if not self.function_yields:
+				return res.failure(InvalidSyntaxError(
+					self.current_tok.pos_start, self.current_tok.pos_end,
+					"'yield' can only be used inside a function"
+				))
+			self.function_yields[-1] = True
+
+			res.register_advancement()
+			self.advance()
+
+			expr = res.register(self.expr())
+			if res.error: return res
+
+			return res.success(YieldNode(expr, pos_start, self.current_tok.pos_start.copy()))
 		
 		if self.current_tok.matches(TT_KEYWORD, 'continue'):
 			res.register_advancement()
@@ -891,38 +1110,49 @@ class Parser:
 		res.register_advancement()
 		self.advance()
 
-		if self.current_tok.type != TT_EQ:
-			return res.failure(InvalidSyntaxError(
-				self.current_tok.pos_start, self.current_tok.pos_end,
-				f"Expected '='"
-			))
-		
-		res.register_advancement()
-		self.advance()
+		if self.current_tok.matches(TT_KEYWORD, 'in'):
+			res.register_advancement()
+			self.advance()
 
-		start_value = res.register(self.expr())
-		if res.error: return res
+			iterable = res.register(self.expr())
+			if res.error: return res
 
-		if not self.current_tok.matches(TT_KEYWORD, 'to'):
-			return res.failure(InvalidSyntaxError(
-				self.current_tok.pos_start, self.current_tok.pos_end,
-				f"Expected 'to'"
-			))
-		
-		res.register_advancement()
-		self.advance()
+			make_node = lambda body, should_return_null: ForInNode(var_name, iterable, body, should_return_null)
+		else:
+			if self.current_tok.type != TT_EQ:
+				return res.failure(InvalidSyntaxError(
+					self.current_tok.pos_start, self.current_tok.pos_end,
+					f"Expected '=' or 'in'"
+				))
+			
+			res.register_advancement()
+			self.advance()
 
-		end_value = res.register(self.expr())
-		if res.error: return res
+			start_value = res.register(self.expr())
+			if res.error: return res
 
-		if self.current_tok.matches(TT_KEYWORD, 'step'):
+			if not self.current_tok.matches(TT_KEYWORD, 'to'):
+				return res.failure(InvalidSyntaxError(
+					self.current_tok.pos_start, self.current_tok.pos_end,
+					f"Expected 'to'"
+				))
+			
 			res.register_advancement()
 			self.advance()
 
-			step_value = res.register(self.expr())
+			end_value = res.register(self.expr())
 			if res.error: return res
-		else:
-			step_value = None
+
+			if self.current_tok.matches(TT_KEYWORD, 'step'):
+				res.register_advancement()
+				self.advance()
+
+				step_value = res.register(self.expr())
+				if res.error: return res
+			else:
+				step_value = None
+
+			make_node = lambda body, should_return_null: ForNode(var_name, start_value, end_value, step_value, body, should_return_null)
 
 		if not self.current_tok.matches(TT_KEYWORD, 'then'):
 			return res.failure(InvalidSyntaxError(
@@ -949,12 +1179,12 @@ class Parser:
 			res.register_advancement()
 			self.advance()
 
-			return res.success(ForNode(var_name, start_value, end_value, step_value, body, True))
+			return res.success(make_node(body, True))
 
 		body = res.register(self.statement())
 		if res.error: return res
 
-		return res.success(ForNode(var_name, start_value, end_value, step_value, body, False))
+		return res.success(make_node(body, False))
 
 	def while_expr(self):
 		res = ParseResult()
@@ -1003,6 +1233,51 @@ class Parser:
 
 		return res.success(WhileNode(condition, body, False))
 
+	def precision_expr(self):
+		res = ParseResult()
+		pos_start = self.current_tok.pos_start.copy()
+
+		if not self.current_tok.matches(TT_KEYWORD, 'precision'):
+			return res.failure(InvalidSyntaxError(
+				self.current_tok.pos_start, self.current_tok.pos_end,
+				f"Expected 'precision'"
+			))
+
+		res.register_advancement()
+		self.advance()
+
+		digits = res.register(self.expr())
+		if res.error: return res
+
+		if not self.current_tok.matches(TT_KEYWORD, 'then'):
+			return res.success(PrecisionNode(digits, None, True, pos_start))
+
+		res.register_advancement()
+		self.advance()
+
+		if self.current_tok.type == TT_NEWLINE:
+			res.register_advancement()
+			self.advance()
+
+			body = res.register(self.statements())
+			if res.error: return res
+
+			if not self.current_tok.matches(TT_KEYWORD, 'end'):
+				return res.failure(InvalidSyntaxError(
+					self.current_tok.pos_start, self.current_tok.pos_end,
+					f"Expected 'end'"
+				))
+
+			res.register_advancement()
+			self.advance()
+
+			return res.success(PrecisionNode(digits, body, True, pos_start))
+
+		body = res.register(self.statement())
+		if res.error: return res
+
+		return res.success(PrecisionNode(digits, body, False, pos_start))
+
 	def atom(self):
 		res = ParseResult()
 		tok = self.current_tok
@@ -1036,6 +1311,10 @@ class Parser:
 			if self.current_tok.type == TT_SUBSCRIPT:
 				return res.success(res.register(self.bin_op(self.list_expr, (TT_SUBSCRIPT, ), self.expr, list_expr)))
 			return res.success(list_expr)
+		elif tok.type == TT_LBRACE:
+			map_expr = res.register(self.map_expr())
+			if res.error: return res
+			return res.success(map_expr)
 		elif tok.matches(TT_KEYWORD, 'if'):
 			if_expr = res.register(self.if_expr())
 			if res.error: return res
@@ -1052,10 +1331,63 @@ class Parser:
 			func_def = res.register(self.func_def())
 			if res.error: return res
 			return res.success(func_def)
+		elif tok.matches(TT_KEYWORD, 'precision'):
+			precision_expr = res.register(self.precision_expr())
+			if res.error: return res
+			return res.success(precision_expr)
 
 		return res.failure(InvalidSyntaxError(
 			tok.pos_start, tok.pos_end,
-			"Expected integer, decimal, identifier, '+', '-', '(', '()', 'if', 'for', 'while' or 'func'"
+			"Expected integer, decimal, identifier, '+', '-', '(', '()', '{', 'if', 'for', 'while' or 'func'"
+		))
+
+	def map_expr(self):
+		res = ParseResult()
+		pair_nodes = []
+		pos_start = self.current_tok.pos_start.copy()
+
+		if self.current_tok.type != TT_LBRACE:
+			return res.failure(InvalidSyntaxError(
+				self.current_tok.pos_start, self.current_tok.pos_end,
+				"Expected '{'"
+			))
+
+		res.register_advancement()
+		self.advance()
+
+		while self.current_tok.type != TT_RBRACE:
+			key = res.register(self.expr())
+			if res.error: return res
+
+			if self.current_tok.type != TT_COLON:
+				return res.failure(InvalidSyntaxError(
+					self.current_tok.pos_start, self.current_tok.pos_end,
+					"Expected ':'"
+				))
+
+			res.register_advancement()
+			self.advance()
+
+			value = res.register(self.expr())
+			if res.error: return res
+			pair_nodes.append((key, value))
+
+			if self.current_tok.type == TT_COMMA:
+				res.register_advancement()
+				self.advance()
+			elif self.current_tok.type != TT_RBRACE:
+				return res.failure(InvalidSyntaxError(
+					self.current_tok.pos_start, self.current_tok.pos_end,
+					"Expected ',' or '}'"
+				))
+
+		res.register_advancement()
+		self.advance()
+
+		return res.success(MapNode(
+			pair_nodes,
+			pos_start,
+			self.current_tok.pos_end.copy()
 		))
 
 	def list_expr(self):
@@ -1334,18 +1666,35 @@ class Parser:
 		res.register_advancement()
 		self.advance()
 
+		self.function_yields.append(False)
+		body = res.register(self.func_body())
+		is_generator = self.function_yields.pop()
+		if res.error: return res
+
+		yield_node = misplaced_yield(body[0]) if is_generator else None
+		if yield_node:
+			return res.failure(InvalidSyntaxError(
+				yield_node.pos_start, yield_node.pos_end,
+				"'yield' can only be used as a statement, not inside an expression"
+			))
+
+		return res.success(FuncDefNode(
+			var_name_tok,
+			arg_name_toks,
+			*body,
+			is_generator
+		))
+
+	def func_body(self):
+		res = ParseResult()
+
 		if self.current_tok.type == TT_ARROW:
 			res.register_advancement()
 			self.advance()
 			node_to_return = res.register(self.expr())
 			if res.error: return res
 
-			return res.success(FuncDefNode(
-				var_name_tok,
-				arg_name_toks,
-				node_to_return,
-				True
-			))
+			return res.success((node_to_return, True))
 
 		if self.current_tok.type != TT_NEWLINE:
 			return res.failure(InvalidSyntaxError(
@@ -1368,12 +1717,7 @@ class Parser:
 		res.register_advancement()
 		self.advance()
 		
-		return res.success(FuncDefNode(
-			var_name_tok,
-			arg_name_toks,
-			body,
-			False
-		))
+		return res.success((body, False))
 
 	######################################################
 
@@ -1454,20 +1798,36 @@ class RTResult:
 # VALUES
 ##########################################################
 
+small_integers = {}
+boolean_singletons = {}
+null_singletons = {}
+
 class Value:
+	# Interned values are shared between every place that produces them, so they never store a position or a context
+	interned = False
+	# Values that apply operators elementwise also handle operators whose left operand is a plain value
+	broadcasts = False
+
 	def __init__(self):
 		self.set_pos()
 		self.set_context()
 
 	def set_pos(self, pos_start=None, pos_end=None):
+		if self.interned: return self
 		self.pos_start = pos_start
 		self.pos_end = pos_end
 		return self
 
 	def set_context(self, context=None):
+		if self.interned: return self
 		self.context = context
 		return self
 
+	def intern(self):
+		self.pos_start = self.pos_end = self.context = None
+		self.interned = True
+		return self
+
 	def added_to(self, other):
 		return None, self.illegal_operation('+', other)
 
@@ -1522,6 +1882,9 @@ class Value:
 	def is_true(self):
 		return False
 
+	def hash_key(self):
+		return None
+
 	def illegal_operation(self, op=None, other=None):
 		if op is not None:
 			if other is None:
@@ -1542,14 +1905,180 @@ class Value:
 			self.context
 		)
 
+def make_number(value):
+	if isinstance(value, (mpc, complex)):
+		return Complex(value)
+	if isinstance(value, Fraction):
+		return Rational(value)
+	if isinstance(value, int):
+		return Integer(value)
+	return Decimal(value)
+
+def real_power(base, exponent):
+	if numeric_mode == 'fast':
+		return float(base) ** float(exponent)
+	return mpf(base) ** exponent
+
+def divide_integers(numerator, denominator):
+	# Exact quotients stay integers, only genuinely inexact ones are promoted
+	if numerator % denominator == 0:
+		return Integer(numerator // denominator)
+	if exact_division:
+		return Rational(Fraction(numerator, denominator))
+	if numeric_mode == 'fast':
+		return Decimal(numerator / denominator)
+	return Decimal(mpf(numerator) / denominator)
+
+def chunked(values, size=4096):
+	iterator = iter(values)
+	while True:
+		chunk = list(itertools.islice(iterator, size))
+		if not chunk: return
+		yield chunk
+
+def sum_numbers(numbers):
+	if isinstance(numbers, list):
+		return sum_chunk(numbers)
+
+	# Lazy sequences are summed a chunk at a time, so they take constant memory
+	partials = []
+	for chunk in chunked(numbers):
+		partials.append(sum_chunk(chunk))
+		if len(partials) == 4096: partials = [sum_chunk(partials)]
+	return sum_chunk(partials)
+
+def multiply_numbers(numbers):
+	if isinstance(numbers, list):
+		return multiply_chunk(numbers)
+
+	partials = []
+	for chunk in chunked(numbers):
+		partials.append(multiply_chunk(chunk))
+		if len(partials) == 4096: partials = [multiply_chunk(partials)]
+	return multiply_chunk(partials)
+
+def sum_chunk(numbers):
+	numbers = list(numbers)
+	values = [number.value for number in numbers]
+
+	if all(isinstance(number, (Integer, Boolean)) for number in numbers):
+		return Integer(sum(int(value) for value in values))
+	if all(isinstance(number, (Integer, Boolean, Rational)) for number in numbers):
+		return make_number(sum(values, Fraction(0)))
+	if numeric_mode == 'fast':
+		# Compensated summation, so long sums don't accumulate rounding errors
+		if any(isinstance(number, Complex) for number in numbers):
+			values = [complex(value) for value in values]
+			return Complex(complex(math.fsum(value.real for value in values), math.fsum(value.imag for value in values)))
+		return Decimal(math.fsum(float(value) for value in values))
+	return make_number(mp.fsum(values))
+
+def multiply_chunk(numbers):
+	numbers = list(numbers)
+	values = [number.value for number in numbers]
+
+	if all(isinstance(number, (Integer, Boolean)) for number in numbers):
+		return Integer(math.prod(int(value) for value in values))
+	if all(isinstance(number, (Integer, Boolean, Rational)) for number in numbers):
+		return make_number(math.prod(values, start=Fraction(1)))
+	if numeric_mode == 'fast':
+		return make_number(math.prod(complex(value) if isinstance(value, (mpc, complex)) else float(value) for value in values))
+	return make_number(mp.fprod(values))
+
+def iterable_elements(value):
+	# The elements of a value that can be iterated over, or None if it can't be
+	if isinstance(value, List):
+		return value.elements
+	if isinstance(value, String):
+		return [String(character) for character in value.value]
+	if isinstance(value, Vector):
+		return [Vector.box(item) for item in value.value]
+	if isinstance(value, Map):
+		return [key for key, _ in value.entries.values()]
+	if isinstance(value, (Range, Generator)):
+		return list(iterate(value))
+	return None
+
+# Returned by next() once an iterator is exhausted, since None could be an element of a Python generator
+NO_ELEMENT = object()
+
+def iterate(value):
+	# An iterator over the elements of a value that computes lazy sequences on demand, or None if it can't be iterated
+	if isinstance(value, Range):
+		return value.iterate()
+	if isinstance(value, Generator):
+		return value.iterator
+	elements = iterable_elements(value)
+	return iter(elements) if elements is not None else None
+
+def sort_key(value):
+	# A key that orders values like the comparison operators, or None for values that can't be ordered
+	if isinstance(value, (Integer, Boolean, Decimal, Rational)):
+		return (0, value.value)
+	if isinstance(value, String):
+		return (1, value.value)
+	return None
+
+def equality_key(value):
+	# A hashable key that is the same for equal values, or None for values that can't be hashed
+	if isinstance(value, Rational):
+		# '==' compares a Rational with a Decimal at the current precision, so 1/10 and 0.1 must share a key
+		return (0, mpf(value.value))
+	if isinstance(value, (Integer, Boolean, Decimal, Complex)):
+		return (0, value.value)
+	if isinstance(value, String):
+		return (1, value.value)
+	if isinstance(value, List):
+		keys = tuple(equality_key(element) for element in value.elements)
+		return None if None in keys else ('List', keys)
+	key = value.hash_key()
+	if key is None: return None
+	return (value.__class__.__name__, key)
+
+def values_equal(a, b):
+	# Equality as '==' sees it, extended to whole Lists, which '==' refuses, and whole Vectors, which '==' compares element-wise
+	if a is b: return True
+	if isinstance(a, List) and isinstance(b, List):
+		return len(a.elements) == len(b.elements) and all(values_equal(x, y) for x, y in zip(a.elements, b.elements))
+	if isinstance(a, Vector) or isinstance(b, Vector):
+		return isinstance(a, Vector) and isinstance(b, Vector) and a.value.shape == b.value.shape and bool(np.all(a.value == b.value))
+	result, error = a.get_comparison_eq(b)
+	return error is None and result.is_true()
+
+def make_slice(value):
+	# A Python slice from a List of one to three Integers or nulls (start, stop, step), or None if it isn't one
+	if not isinstance(value, List) or not 1 <= len(value.elements) <= 3:
+		return None
+	if not all(isinstance(element, (Integer, Boolean, NullType)) for element in value.elements):
+		return None
+
+	slice_ = slice(*[None if isinstance(element, NullType) else int(element.value) for element in value.elements])
+	return None if slice_.step == 0 else slice_
+
+def slice_error(other, context):
+	return RTError(
+		other.pos_start, other.pos_end,
+		'A slice must be a List of one to three Integers or nulls (start, stop, step) with a non-zero step',
+		context
+	)
+
 class Integer(Value):
+	def __new__(cls, value):
+		if type(value) is int:
+			cached = small_integers.get(value)
+			if cached is not None: return cached
+		return super().__new__(cls)
+
 	def __init__(self, value):
+		if self.interned: return
 		super().__init__()
 		self.value = int(value)
 
 	def added_to(self, other):
 		if isinstance(other, (Integer, Boolean)):
 			return Integer(self.value + other.value).set_context(self.context), None
+		elif isinstance(other, Rational):
+			return Rational(self.value + other.value).set_context(self.context), None
 		elif isinstance(other, Decimal):
 			return Decimal(self.value + other.value).set_context(self.context), None
 		elif isinstance(other, Complex):
@@ -1560,6 +2089,8 @@ class Integer(Value):
 	def subbed_by(self, other):
 		if isinstance(other, (Integer, Boolean)):
 			return Integer(self.value - other.value).set_context(self.context), None
+		elif isinstance(other, Rational):
+			return Rational(self.value - other.value).set_context(self.context), None
 		elif isinstance(other, Decimal):
 			return Decimal(self.value - other.value).set_context(self.context), None
 		elif isinstance(other, Complex):
@@ -1570,6 +2101,8 @@ class Integer(Value):
 	def multed_by(self, other):
 		if isinstance(other, (Integer, Boolean)):
 			return Integer(self.value * other.value).set_context(self.context), None
+		elif isinstance(other, Rational):
+			return Rational(self.value * other.value).set_context(self.context), None
 		elif isinstance(other, Decimal):
 			return Decimal(self.value * other.value).set_context(self.context), None
 		elif isinstance(other, Complex):
@@ -1580,7 +2113,7 @@ class Integer(Value):
 			return None, Value.illegal_operation(self, '*', other)
 
 	def dived_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
 			if other.value == 0:
 				return None, RTError(
 					other.pos_start, other.pos_end,
@@ -1588,8 +2121,10 @@ class Integer(Value):
 					self.context
 				)
 
-			if isinstance(other, Boolean):
-				return Integer(self.value / other.value).set_context(self.context), None
+			if isinstance(other, (Integer, Boolean)):
+				return divide_integers(self.value, other.value).set_context(self.context), None
+			elif isinstance(other, Rational):
+				return Rational(self.value / other.value).set_context(self.context), None
 			elif isinstance(other, Complex):
 				return Complex(self.value / other.value).set_context(self.context), None
 			return Decimal(self.value / other.value).set_context(self.context), None
@@ -1597,62 +2132,62 @@ class Integer(Value):
 			return None, Value.illegal_operation(self, '/', other)
 
 	def powed_by(self, other):
-		if isinstance(other, (Integer, Decimal)):
-			if self.value < 0:
-				return Complex(self.value ** other.value).set_context(self.context), None
-			return other.__class__(self.value ** other.value).set_context(self.context), None
-		elif isinstance(other, Boolean):
-			return Integer(self.value ** other.value).set_context(self.context), None
+		if isinstance(other, (Integer, Boolean)):
+			if other.value >= 0:
+				return Integer(self.value ** other.value).set_context(self.context), None
+			return divide_integers(1, self.value ** -other.value).set_context(self.context), None
+		elif isinstance(other, (Decimal, Rational)):
+			return make_number(real_power(self.value, other.value)).set_context(self.context), None
 		elif isinstance(other, Complex):
 			return Complex(self.value ** other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '^', other)
 			
 	def get_comparison_eq(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List)):
-			return Boolean(int(self.value == other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, Rational)):
+			return Boolean(self.value == other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '==', other)
 
 	def get_comparison_ne(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List)):
-			return Boolean(int(self.value != other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, Rational)):
+			return Boolean(self.value != other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '!=', other)
 
 	def get_comparison_lt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value < other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value < other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>', other)
 
 	def get_comparison_gt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value > other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value > other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<', other)
 
 	def get_comparison_lte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value <= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value <= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>=', other)
 
 	def get_comparison_gte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value >= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value >= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<=', other)
 
 	def anded_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value and other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, 'and', other)
 
 	def ored_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value or other.value).set_context(self.context), None
 		else:
@@ -1662,6 +2197,7 @@ class Integer(Value):
 		return Boolean(1 if self.value == 0 else 0).set_context(self.context), None
 
 	def copy(self):
+		if self.interned: return self
 		copy = Integer(self.value)
 		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
@@ -1671,16 +2207,27 @@ class Integer(Value):
 	def is_true(self):
 		return self.value != 0
 
+	def hash_key(self):
+		return self.value
+
 	def __repr__(self):
 		return f'{self.value}'
 
+for value in range(SMALL_INTEGER_MIN, SMALL_INTEGER_MAX + 1):
+	small_integers[value] = Integer(value).intern()
+
 class Decimal(Value):
 	def __init__(self, value):
 		super().__init__()
-		self.value = mpf(str(value))
+		if numeric_mode == 'fast':
+			self.value = float(value)
+		elif isinstance(value, mpf):
+			self.value = value
+		else:
+			self.value = mpf(value)
 
 	def added_to(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean)):
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
 			return Decimal(self.value + other.value).set_context(self.context), None
 		elif isinstance(other, Complex):
 			return Complex(self.value + other.value).set_context(self.context), None
@@ -1688,7 +2235,7 @@ class Decimal(Value):
 			return None, Value.illegal_operation(self, '+', other)
 
 	def subbed_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean)):
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
 			return Decimal(self.value - other.value).set_context(self.context), None
 		elif isinstance(other, Complex):
 			return Complex(self.value - other.value).set_context(self.context), None
@@ -1696,7 +2243,7 @@ class Decimal(Value):
 			return None, Value.illegal_operation(self, '-', other)
 
 	def multed_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean)):
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
 			return Decimal(self.value * other.value).set_context(self.context), None
 		elif isinstance(other, Complex):
 			return Complex(self.value * other.value).set_context(self.context), None
@@ -1706,7 +2253,7 @@ class Decimal(Value):
 			return None, Value.illegal_operation(self, '*', other)
 
 	def dived_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
 			if other.value == 0:
 				return None, RTError(
 					other.pos_start, other.pos_end,
@@ -1714,8 +2261,6 @@ class Decimal(Value):
 					self.context
 				)
 			
-			if isinstance(other, Boolean):
-				return Integer(self.value / other.value).set_context(self.context), None
 			if isinstance(other, Complex):
 				return Complex(self.value / other.value).set_context(self.context), None
 			return Decimal(self.value / other.value).set_context(self.context), None
@@ -1723,60 +2268,58 @@ class Decimal(Value):
 			return None, Value.illegal_operation(self, '/', other)
 
 	def powed_by(self, other):
-		if isinstance(other, (Integer, Decimal, Complex)):
-			if self.value < 0 or isinstance(other, Complex):
-				return Complex(self.value ** other.value).set_context(self.context), None
-			return Decimal(self.value ** other.value).set_context(self.context), None
-		elif isinstance(other, Boolean):
-			return Decimal(self.value ** other.value).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
+			return make_number(real_power(self.value, other.value)).set_context(self.context), None
+		elif isinstance(other, Complex):
+			return Complex(self.value ** other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '^', other)
 			
 	def get_comparison_eq(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value == other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value == other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '==', other)
 
 	def get_comparison_ne(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value != other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value != other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '!=', other)
 
 	def get_comparison_lt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value < other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value < other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>', other)
 
 	def get_comparison_gt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value > other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value > other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<', other)
 
 	def get_comparison_lte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value <= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value <= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>=', other)
 
 	def get_comparison_gte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value >= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value >= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<=', other)
 
 	def anded_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value and other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, 'and', other)
 
 	def ored_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value or other.value).set_context(self.context), None
 		else:
@@ -1786,6 +2329,7 @@ class Decimal(Value):
 		return Boolean(1 if self.value == 0 else 0).set_context(self.context), None
 
 	def copy(self):
+		if self.interned: return self
 		copy = Decimal(self.value)
 		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
@@ -1795,107 +2339,134 @@ class Decimal(Value):
 	def is_true(self):
 		return self.value != 0
 
+	def hash_key(self):
+		return self.value
+
 	def __repr__(self):
 		return f'{self.value}'
 
-class Complex(Value):
+class Rational(Value):
+	def __new__(cls, value):
+		if Fraction(value).denominator == 1:
+			return Integer(Fraction(value).numerator)
+		return super().__new__(cls)
+
 	def __init__(self, value):
 		super().__init__()
-		if not isinstance(value, mpc):
-			value = complex(value)
-		self.value = mpc(str(float(value.real)), str(float(value.imag)))
+		self.value = Fraction(value)
 
 	def added_to(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Boolean, Rational)):
+			return Rational(self.value + other.value).set_context(self.context), None
+		elif isinstance(other, Decimal):
+			return Decimal(self.value + other.value).set_context(self.context), None
+		elif isinstance(other, Complex):
 			return Complex(self.value + other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '+', other)
 
 	def subbed_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Boolean, Rational)):
+			return Rational(self.value - other.value).set_context(self.context), None
+		elif isinstance(other, Decimal):
+			return Decimal(self.value - other.value).set_context(self.context), None
+		elif isinstance(other, Complex):
 			return Complex(self.value - other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '-', other)
 
 	def multed_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Boolean, Rational)):
+			return Rational(self.value * other.value).set_context(self.context), None
+		elif isinstance(other, Decimal):
+			return Decimal(self.value * other.value).set_context(self.context), None
+		elif isinstance(other, Complex):
 			return Complex(self.value * other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '*', other)
 
 	def dived_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
 			if other.value == 0:
 				return None, RTError(
 					other.pos_start, other.pos_end,
 					"Division by zero (cause undefined, it approach -inf when we're approaching 0 from the negative and it approach +inf when we're approaching 0 from the positive)",
 					self.context
 				)
-			return Complex(self.value / other.value).set_context(self.context), None
+
+			if isinstance(other, (Integer, Boolean, Rational)):
+				return Rational(self.value / other.value).set_context(self.context), None
+			elif isinstance(other, Complex):
+				return Complex(self.value / other.value).set_context(self.context), None
+			return Decimal(self.value / other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '/', other)
 
 	def powed_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Boolean)):
+			return Rational(self.value ** int(other.value)).set_context(self.context), None
+		elif isinstance(other, (Decimal, Rational)):
+			return make_number(real_power(self.value, other.value)).set_context(self.context), None
+		elif isinstance(other, Complex):
 			return Complex(self.value ** other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '^', other)
-			
+
 	def get_comparison_eq(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value == other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational, String, List, NullType)):
+			return Boolean(self.value == other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '==', other)
 
 	def get_comparison_ne(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value != other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational, String, List, NullType)):
+			return Boolean(self.value != other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '!=', other)
 
 	def get_comparison_lt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value < other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
+			return Boolean(self.value < other.value).set_context(self.context), None
 		else:
-			return None, Value.illegal_operation(self, '>', other)
+			return None, Value.illegal_operation(self, '<', other)
 
 	def get_comparison_gt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value > other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
+			return Boolean(self.value > other.value).set_context(self.context), None
 		else:
-			return None, Value.illegal_operation(self, '<', other)
+			return None, Value.illegal_operation(self, '>', other)
 
 	def get_comparison_lte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value <= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
+			return Boolean(self.value <= other.value).set_context(self.context), None
 		else:
-			return None, Value.illegal_operation(self, '>=', other)
+			return None, Value.illegal_operation(self, '<=', other)
 
 	def get_comparison_gte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value >= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Rational)):
+			return Boolean(self.value >= other.value).set_context(self.context), None
 		else:
-			return None, Value.illegal_operation(self, '<=', other)
+			return None, Value.illegal_operation(self, '>=', other)
 
 	def anded_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational, NullType)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value and other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, 'and', other)
 
 	def ored_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational, NullType)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value or other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, 'or', other)
 
 	def notted(self):
-		return Boolean(1 if self.value == 0 else 0).set_context(self.context), None
+		return Boolean(self.value == 0).set_context(self.context), None
 
 	def copy(self):
-		copy = Complex(self.value)
+		copy = Rational(self.value)
 		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
 
@@ -1904,37 +2475,185 @@ class Complex(Value):
 	def is_true(self):
 		return self.value != 0
 
+	def hash_key(self):
+		return self.value
+
 	def __repr__(self):
-		return f'{self.value}'.replace('j', 'i')
+		return f'{self.value.numerator}/{self.value.denominator}'
 
-class Boolean(Value):
+class Constant(Decimal):
+	def __init__(self, mp_constant, float_value):
+		Value.__init__(self)
+		self.mp_constant = mp_constant
+		self.float_value = float_value
+		self.cache = {}
+
+	@property
+	def value(self):
+		if numeric_mode == 'fast': return self.float_value
+
+		# Computed on first use at the active precision, so changing the precision never reuses a stale value
+		value = self.cache.get(mp.prec)
+		if value is None:
+			value = self.cache[mp.prec] = +self.mp_constant
+		return value
+
+class Complex(Value):
 	def __init__(self, value):
 		super().__init__()
-		self.value = False if value == 0 else True
+		if numeric_mode == 'fast':
+			self.value = complex(value)
+		elif isinstance(value, mpc):
+			self.value = value
+		else:
+			self.value = mpc(value)
 
 	def added_to(self, other):
-		if isinstance(other, (Integer, Boolean)):
-			return Integer(self.value + other.value).set_context(self.context), None
-		elif isinstance(other, Decimal):
-			return Decimal(self.value + other.value).set_context(self.context), None
-		elif isinstance(other, Complex):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
 			return Complex(self.value + other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '+', other)
 
 	def subbed_by(self, other):
-		if isinstance(other, (Integer, Boolean)):
-			return Integer(self.value - other.value).set_context(self.context), None
-		elif isinstance(other, Decimal):
-			return Decimal(self.value - other.value).set_context(self.context), None
-		elif isinstance(other, Complex):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
 			return Complex(self.value - other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '-', other)
 
 	def multed_by(self, other):
-		if isinstance(other, (Integer, Boolean)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
+			return Complex(self.value * other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '*', other)
+
+	def dived_by(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
+			if other.value == 0:
+				return None, RTError(
+					other.pos_start, other.pos_end,
+					"Division by zero (cause undefined, it approach -inf when we're approaching 0 from the negative and it approach +inf when we're approaching 0 from the positive)",
+					self.context
+				)
+			return Complex(self.value / other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '/', other)
+
+	def powed_by(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
+			return Complex(self.value ** other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '^', other)
+			
+	def get_comparison_eq(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value == other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '==', other)
+
+	def get_comparison_ne(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value != other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '!=', other)
+
+	def get_comparison_lt(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value < other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '>', other)
+
+	def get_comparison_gt(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value > other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '<', other)
+
+	def get_comparison_lte(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value <= other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '>=', other)
+
+	def get_comparison_gte(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value >= other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '<=', other)
+
+	def anded_by(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
+			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
+			return class_(self.value and other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, 'and', other)
+
+	def ored_by(self, other):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
+			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
+			return class_(self.value or other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, 'or', other)
+
+	def notted(self):
+		return Boolean(1 if self.value == 0 else 0).set_context(self.context), None
+
+	def copy(self):
+		if self.interned: return self
+		copy = Complex(self.value)
+		copy.set_pos(self.pos_start, self.pos_end)
+		copy.set_context(self.context)
+
+		return copy
+
+	def is_true(self):
+		return self.value != 0
+
+	def hash_key(self):
+		return self.value
+
+	def __repr__(self):
+		return f'{self.value}'.replace('j', 'i')
+
+class Boolean(Value):
+	def __new__(cls, value):
+		cached = boolean_singletons.get(False if value == 0 else True)
+		if cached is not None: return cached
+		return super().__new__(cls)
+
+	def __init__(self, value):
+		if self.interned: return
+		super().__init__()
+		self.value = False if value == 0 else True
+
+	def added_to(self, other):
+		if isinstance(other, (Integer, Boolean)):
+			return Integer(self.value + other.value).set_context(self.context), None
+		elif isinstance(other, Rational):
+			return Rational(self.value + other.value).set_context(self.context), None
+		elif isinstance(other, Decimal):
+			return Decimal(self.value + other.value).set_context(self.context), None
+		elif isinstance(other, Complex):
+			return Complex(self.value + other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '+', other)
+
+	def subbed_by(self, other):
+		if isinstance(other, (Integer, Boolean)):
+			return Integer(self.value - other.value).set_context(self.context), None
+		elif isinstance(other, Rational):
+			return Rational(self.value - other.value).set_context(self.context), None
+		elif isinstance(other, Decimal):
+			return Decimal(self.value - other.value).set_context(self.context), None
+		elif isinstance(other, Complex):
+			return Complex(self.value - other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '-', other)
+
+	def multed_by(self, other):
+		if isinstance(other, (Integer, Boolean)):
 			return Integer(self.value * other.value).set_context(self.context), None
+		elif isinstance(other, Rational):
+			return Rational(self.value * other.value).set_context(self.context), None
 		elif isinstance(other, Decimal):
 			return Decimal(self.value * other.value).set_context(self.context), None
 		elif isinstance(other, Complex):
@@ -1945,7 +2664,7 @@ class Boolean(Value):
 			return None, Value.illegal_operation(self, '*', other)
 
 	def dived_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, Rational)):
 			if other.value == 0:
 				return None, RTError(
 					other.pos_start, other.pos_end,
@@ -1953,7 +2672,11 @@ class Boolean(Value):
 					self.context
 				)
 
-			if isinstance(other, Complex):
+			if isinstance(other, (Integer, Boolean)):
+				return divide_integers(int(self.value), other.value).set_context(self.context), None
+			elif isinstance(other, Rational):
+				return Rational(self.value / other.value).set_context(self.context), None
+			elif isinstance(other, Complex):
 				return Complex(self.value / other.value).set_context(self.context), None
 			return Decimal(self.value / other.value).set_context(self.context), None
 		else:
@@ -1961,59 +2684,61 @@ class Boolean(Value):
 
 	def powed_by(self, other):
 		if isinstance(other, (Integer, Boolean)):
-			return Integer(self.value ** other.value).set_context(self.context), None
-		elif isinstance(other, Decimal):
-			return Decimal(self.value ** other.value).set_context(self.context), None
+			if other.value >= 0:
+				return Integer(self.value ** other.value).set_context(self.context), None
+			return divide_integers(1, int(self.value) ** -other.value).set_context(self.context), None
+		elif isinstance(other, (Decimal, Rational)):
+			return make_number(real_power(self.value, other.value)).set_context(self.context), None
 		elif isinstance(other, Complex):
 			return Complex(self.value ** other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '^', other)
 			
 	def get_comparison_eq(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value == other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value == other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '==', other)
 
 	def get_comparison_ne(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value != other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value != other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '!=', other)
 
 	def get_comparison_lt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value < other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value < other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>', other)
 
 	def get_comparison_gt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value > other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value > other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<', other)
 
 	def get_comparison_lte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value <= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value <= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>=', other)
 
 	def get_comparison_gte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value >= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value >= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<=', other)
 
 	def anded_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value and other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, 'and', other)
 
 	def ored_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, NullType, Rational)):
 			class_ = self.__class__ if (self.value and other.value) == self else other.__class__
 			return class_(self.value or other.value).set_context(self.context), None
 		else:
@@ -2023,6 +2748,7 @@ class Boolean(Value):
 		return Boolean(1 if self.value == 0 else 0).set_context(self.context), None
 
 	def copy(self):
+		if self.interned: return self
 		copy = Boolean(self.value)
 		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
@@ -2032,36 +2758,48 @@ class Boolean(Value):
 	def is_true(self):
 		return self.value != 0
 
+	def hash_key(self):
+		return self.value
+
 	def __repr__(self):
 		return f'{'false' if self.value == 0 else 'true'}'
 
+boolean_singletons[False] = Boolean(0).intern()
+boolean_singletons[True] = Boolean(1).intern()
+
 class NullType(Value):
+	def __new__(cls, value = None):
+		cached = null_singletons.get(value)
+		if cached is not None: return cached
+		return super().__new__(cls)
+
 	def __init__(self, value = None):
+		if self.interned: return
 		super().__init__()
 		self.value = value or 'null'
 		self._value = value
 		self.hidden = value is None
 
 	def get_comparison_eq(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, NullType, String, List)):
+		if isinstance(other, (Integer, Decimal, Boolean, NullType, String, List, Rational)):
 			return Boolean(0 if not isinstance(other, NullType) else 1).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '==', other)
 
 	def get_comparison_ne(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, NullType, String, List)):
+		if isinstance(other, (Integer, Decimal, Boolean, NullType, String, List, Rational)):
 			return Boolean(1 if not isinstance(other, NullType) else 0).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '!=', other)
 
 	def anded_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, NullType, Rational)):
 			return other.__class__(other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, 'and', other)
 
 	def ored_by(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, NullType)):
+		if isinstance(other, (Integer, Decimal, Boolean, NullType, Rational)):
 			return other.__class__(other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, 'or', other)
@@ -2070,6 +2808,7 @@ class NullType(Value):
 		return Boolean(1), None
 
 	def copy(self):
+		if self.interned: return self
 		copy = NullType(self._value)
 		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
@@ -2078,10 +2817,16 @@ class NullType(Value):
 
 	def is_true(self):
 		return False
-	
+
+	def hash_key(self):
+		return NullType
+
 	def __repr__(self):
 		return f'{self.value}'
 
+for value in (None, 'null', 'none', 'undefined'):
+	null_singletons[value] = NullType(value).intern()
+
 class String(Value):
 	def __init__(self, value):
 		super().__init__()
@@ -2109,42 +2854,46 @@ class String(Value):
 					'Character at this index could not be retrived from string because index is out of bounds',
 					self.context
 				)
+		elif isinstance(other, List):
+			slice_ = make_slice(other)
+			if slice_ is None: return None, slice_error(other, self.context)
+			return String(self.value[slice_]).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '_', other)
 
 	def get_comparison_eq(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value == other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value == other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '==', other)
 
 	def get_comparison_ne(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value != other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value != other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '!=', other)
 
 	def get_comparison_lt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value > other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value > other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>', other)
 
 	def get_comparison_gt(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value < other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value < other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<', other)
 
 	def get_comparison_lte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value >= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value >= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '>=', other)
 
 	def get_comparison_gte(self, other):
-		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType)):
-			return Boolean(int(self.value <= other.value)).set_context(self.context), None
+		if isinstance(other, (Integer, Decimal, Boolean, Complex, String, List, NullType, Rational)):
+			return Boolean(self.value <= other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '<=', other)
 		
@@ -2154,7 +2903,11 @@ class String(Value):
 	def is_true(self):
 		return len(self.value) > 0
 
+	def hash_key(self):
+		return self.value
+
 	def copy(self):
+		if self.interned: return self
 		copy = String(self.value)
 		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
@@ -2166,22 +2919,290 @@ class String(Value):
 	def __str__(self):
 		return self.value
 
+# Numbers the values that can be changed in place as they are created, so a memoized call can tell the values it
+# made itself from the ones it was given. Copies share their contents and so keep the number of the original
+creation_counter = itertools.count()
+
+class BuilderParts:
+	# The pieces of a string builder. A builder made with '+' shares the list of pieces with the builder it was made
+	# from and owns one more of them, so adding to the newest builder doesn't copy the pieces before it
+	def __init__(self, pieces, count):
+		self.pieces = pieces
+		self.count = count
+
+	def append(self, text):
+		if self.count < len(self.pieces):
+			# A builder made from this one with '+' already owns the next piece
+			self.pieces = self.pieces[:self.count]
+		self.pieces.append(text)
+		self.count += 1
+
+	def join(self):
+		if self.count > 1:
+			# Joined into a list of its own, since other builders may share the pieces
+			self.pieces = [''.join(self.pieces[:self.count])]
+			self.count = 1
+		return self.pieces[0]
+
+class StringBuilder(String):
+	# A String that append() adds to in place. The pieces are only joined when the value is read, so building a
+	# string piece by piece takes linear time instead of copying it every time. '+' leaves both operands alone like
+	# on any other String, and returns a new builder sharing the pieces, so 'b = b + s' in a loop is linear too
+	def __init__(self, value=''):
+		super().__init__(value)
+		self.created = next(creation_counter)
+
+	@property
+	def value(self):
+		return self.parts.join()
+
+	@value.setter
+	def value(self, value):
+		self.parts = BuilderParts([value], 1)
+
+	def append(self, text):
+		self.parts.append(text)
+
+	def added_to(self, other):
+		if isinstance(other, String):
+			builder = StringBuilder().set_context(self.context)
+			builder.parts = BuilderParts(self.parts.pieces, self.parts.count)
+			builder.append(other.value)
+			return builder, None
+		else:
+			return None, Value.illegal_operation(self, '+', other)
+
+	def copy(self):
+		# Like a List, a copy shares its contents, so appending through either one changes both
+		copy = StringBuilder()
+		copy.parts = self.parts
+		copy.created = self.created
+		copy.set_pos(self.pos_start, self.pos_end)
+		copy.set_context(self.context)
+		return copy
+
+class ValueFormatter(string.Formatter):
+	# Fills templates like "{} is {x:.2f}" with values, using the format spec on the number itself when one is given
+	def get_field(self, field_name, args, kwargs):
+		if '.' in field_name or '[' in field_name:
+			raise ValueError(f"'{field_name}' is not a field name")
+		return super().get_field(field_name, args, kwargs)
+
+	def format_field(self, value, format_spec):
+		if format_spec and isinstance(value, (Integer, Boolean, Decimal, Rational, Complex)):
+			return format(value.value, format_spec)
+		return format(str(value), format_spec)
+
+class PersistentVector:
+	# A 32-way trie with a tail, like Clojure's vectors: every update returns a new vector that shares all the nodes it didn't touch
+	bits = 5
+	width = 1 << bits
+	mask = width - 1
+
+	def __init__(self, count=0, shift=bits, root=(), tail=()):
+		self.count = count
+		self.shift = shift
+		self.root = root
+		self.tail = tail
+
+	@staticmethod
+	def from_iterable(values):
+		vector = PersistentVector()
+		for value in values:
+			vector = vector.conj(value)
+		return vector
+
+	def tail_offset(self):
+		return 0 if self.count < self.width else ((self.count - 1) >> self.bits) << self.bits
+
+	def leaf_for(self, i):
+		if i >= self.tail_offset():
+			return self.tail
+		node = self.root
+		for level in range(self.shift, 0, -self.bits):
+			node = node[(i >> level) & self.mask]
+		return node
+
+	def new_path(self, level, node):
+		for _ in range(level // self.bits):
+			node = (node,)
+		return node
+
+	def push_tail(self, level, parent, tail_node):
+		i = ((self.count - 1) >> level) & self.mask
+		if level == self.bits:
+			node = tail_node
+		elif i < len(parent):
+			node = self.push_tail(level - self.bits, parent[i], tail_node)
+		else:
+			node = self.new_path(level - self.bits, tail_node)
+		return parent[:i] + (node,) + parent[i + 1:]
+
+	def conj(self, value):
+		if self.count - self.tail_offset() < self.width:
+			return PersistentVector(self.count + 1, self.shift, self.root, self.tail + (value,))
+
+		if (self.count >> self.bits) > (1 << self.shift):
+			root = (self.root, self.new_path(self.shift, self.tail))
+			return PersistentVector(self.count + 1, self.shift + self.bits, root, (value,))
+		return PersistentVector(self.count + 1, self.shift, self.push_tail(self.shift, self.root, self.tail), (value,))
+
+	def assoc_in(self, level, node, i, value):
+		j = (i >> level) & self.mask
+		if level == 0:
+			return node[:j] + (value,) + node[j + 1:]
+		return node[:j] + (self.assoc_in(level - self.bits, node[j], i, value),) + node[j + 1:]
+
+	def assoc(self, i, value):
+		if i < 0: i += self.count
+		if not 0 <= i < self.count:
+			raise IndexError('persistent vector index out of range')
+
+		offset = self.tail_offset()
+		if i >= offset:
+			return PersistentVector(self.count, self.shift, self.root, self.tail[:i - offset] + (value,) + self.tail[i - offset + 1:])
+		return PersistentVector(self.count, self.shift, self.assoc_in(self.shift, self.root, i, value), self.tail)
+
+	def pop_tail(self, level, node):
+		i = ((self.count - 2) >> level) & self.mask
+		if level > self.bits:
+			child = self.pop_tail(level - self.bits, node[i])
+			if child is None and i == 0:
+				return None
+			return node[:i] + ((child,) if child is not None else ())
+		if i == 0:
+			return None
+		return node[:i]
+
+	def pop(self):
+		if self.count == 0:
+			raise IndexError('pop from empty persistent vector')
+		if self.count == 1:
+			return PersistentVector()
+		if self.count - self.tail_offset() > 1:
+			return PersistentVector(self.count - 1, self.shift, self.root, self.tail[:-1])
+
+		tail = self.leaf_for(self.count - 2)
+		root = self.pop_tail(self.shift, self.root) or ()
+		shift = self.shift
+		if shift > self.bits and len(root) == 1:
+			root = root[0]
+			shift -= self.bits
+		return PersistentVector(self.count - 1, shift, root, tail)
+
+	def __len__(self):
+		return self.count
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			return [self[j] for j in range(*i.indices(self.count))]
+		if i < 0: i += self.count
+		if not 0 <= i < self.count:
+			raise IndexError('persistent vector index out of range')
+		return self.leaf_for(i)[i & self.mask]
+
+	def __iter__(self):
+		for start in range(0, self.tail_offset(), self.width):
+			yield from self.leaf_for(start)
+		yield from self.tail
+
+	def __add__(self, other):
+		return list(self) + list(other)
+
+	def __radd__(self, other):
+		return list(other) + list(self)
+
+	def __mul__(self, times):
+		return list(self) * times
+
+# id of a sequence -> weak references to the SliceViews over it, so changing the sequence can detach them first.
+# A view unregisters itself once it is detached or gone, and the entry of a sequence goes with its last view
+slice_views = {}
+
+def forget_slice_view(key, reference):
+	references = slice_views.get(key)
+	if references is not None:
+		references.discard(reference)
+		if not references: del slice_views[key]
+
+def detach_slice_views(sequence):
+	for reference in slice_views.pop(id(sequence), ()):
+		view = reference()
+		if view is not None and view.base is sequence:
+			view.materialise()
+
+class SliceView(MutableSequence):
+	# A window over part of another sequence that shares its storage, until either of them is changed and the view copies it
+	def __init__(self, base, indices):
+		self.base = base
+		self.indices = indices
+
+		key = id(base)
+		self.reference = weakref.ref(self, lambda reference: forget_slice_view(key, reference))
+		slice_views.setdefault(key, set()).add(self.reference)
+
+	@staticmethod
+	def of(sequence, slice_):
+		if isinstance(sequence, SliceView) and sequence.indices is not None:
+			return SliceView(sequence.base, sequence.indices[slice_])
+		return SliceView(sequence, range(len(sequence))[slice_])
+
+	def materialise(self):
+		if self.indices is not None:
+			forget_slice_view(id(self.base), self.reference)
+			self.base = [self.base[i] for i in self.indices]
+			self.indices = None
+		return self.base
+
+	def __len__(self):
+		return len(self.base) if self.indices is None else len(self.indices)
+
+	def __getitem__(self, i):
+		if self.indices is None:
+			return self.base[i]
+		if isinstance(i, slice):
+			return [self.base[j] for j in self.indices[i]]
+		return self.base[self.indices[i]]
+
+	def __iter__(self):
+		if self.indices is None:
+			return iter(self.base)
+		return (self.base[i] for i in self.indices)
+
+	def __setitem__(self, i, value):
+		self.materialise()[i] = value
+
+	def __delitem__(self, i):
+		del self.materialise()[i]
+
+	def insert(self, i, value):
+		self.materialise().insert(i, value)
+
+	def __add__(self, other):
+		return list(self) + list(other)
+
+	def __radd__(self, other):
+		return list(other) + list(self)
+
+	def __mul__(self, times):
+		return list(self) * times
+
 class List(Value):
 	def __init__(self, elements):
 		super().__init__()
 		self.elements = elements
+		self.created = next(creation_counter)
 
+	# Copies share their elements, so operators build new element lists instead of changing them in place
 	def added_to(self, other):
 		if isinstance(other, List):
-			new_list = self.copy()
-			new_list.elements += other.elements
-			return new_list, None
+			return List(self.elements + other.elements).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '+', other)
 
 	def subbed_by(self, other):
 		if isinstance(other, (Integer, Boolean)):
-			new_list = self.copy()
+			new_list = List(self.elements[:]).set_context(self.context)
 			try:
 				new_list.elements.pop(other.value)
 				return new_list, None
@@ -2196,11 +3217,9 @@ class List(Value):
 
 	def multed_by(self, other):
 		if isinstance(other, List):
-			new_list = self.copy()
-			new_list.elements.extend(other.elements)
-			return new_list, None
+			return List(self.elements + other.elements).set_context(self.context), None
 		elif isinstance(other, Integer):
-			return List(self.copy().elements * other.value), None
+			return List(self.elements * other.value).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '*', other)
 
@@ -2214,6 +3233,10 @@ class List(Value):
 					'Element at this index could not be retrived from list because index is out of bounds',
 					self.context
 				)
+		elif isinstance(other, List):
+			slice_ = make_slice(other)
+			if slice_ is None: return None, slice_error(other, self.context)
+			return List(SliceView.of(self.elements, slice_)).set_context(self.context), None
 		else:
 			return None, Value.illegal_operation(self, '_', other)
 
@@ -2224,253 +3247,2298 @@ class List(Value):
 
 	def copy(self):
 		copy = List(self.elements)
+		copy.created = self.created
 		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
 
 		return copy
-	
-class BaseFunction(Value):
-	def __init__(self, name):
-		super().__init__()
-		self.name = name or '<anonymous>'
-	
-	def generate_new_context(self):
-		new_context = Context(self.name, self.context, self.pos_start)
-		new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
 
-		return new_context
+	def hash_key(self):
+		keys = tuple(element.hash_key() for element in self.elements)
+		return None if None in keys else keys
 	
-	def check_args(self, arg_names, args):
-		res = RTResult()
+class PersistentList(List):
+	# A List whose elements are a PersistentVector: "changing" it returns a new list sharing structure with this one
+	def __init__(self, elements):
+		super().__init__(elements if isinstance(elements, PersistentVector) else PersistentVector.from_iterable(elements))
 
-		if len(args) > len(arg_names):
-			return res.failure(RTError(
-				self.pos_start, self.pos_end,
-				f"{len(args) - len(arg_names)} too many args passed into '{self.name}'",
-				self.context
-			))
-		
-		if len(args) < len(arg_names):
-			return res.failure(RTError(
-				self.pos_start, self.pos_end,
-				f"{len(arg_names) - len(args)} too few args passed into '{self.name}'",
-				self.context
-			))
-		
-		return res.success(None)
-	
-	def populate_args(self, arg_names, args, exec_ctx):
-		for i in range(len(args[0])):
-			arg_name = arg_names[0][i]
-			arg_value = args[0][i]
-			if isinstance(arg_value, type(None)): arg_value = NullType()
-			arg_value.set_context(exec_ctx)
-			exec_ctx.symbol_table.set(arg_name, arg_value)
+	def conj_all(self, values):
+		elements = self.elements
+		for value in values:
+			elements = elements.conj(value)
+		return PersistentList(elements).set_context(self.context)
 
-		opt_arg_names = arg_names[1].copy()
+	def added_to(self, other):
+		if isinstance(other, List):
+			return self.conj_all(other.elements), None
+		else:
+			return None, Value.illegal_operation(self, '+', other)
 
-		for arg_name, arg_value in args[1].items():
-			if isinstance(arg_value, type(None)): arg_value = NullType()
-			arg_value.set_context(exec_ctx)
-			opt_arg_names[arg_name] = arg_value
+	def subbed_by(self, other):
+		if isinstance(other, (Integer, Boolean)):
+			if other.value in (-1, len(self.elements) - 1) and len(self.elements) > 0:
+				return PersistentList(self.elements.pop()).set_context(self.context), None
+			try:
+				elements = self.elements[:]
+				elements.pop(other.value)
+				return PersistentList(elements).set_context(self.context), None
+			except IndexError:
+				return None, RTError(
+					other.pos_start, other.pos_end,
+					'Element at this index could not be removed from list because index is out of bounds',
+					self.context
+				)
+		else:
+			return None, Value.illegal_operation(self, '-', other)
 
-		for arg_name, arg_value in opt_arg_names.items():
-			exec_ctx.symbol_table.set(arg_name, arg_value)
+	def multed_by(self, other):
+		if isinstance(other, List):
+			return self.conj_all(other.elements), None
+		elif isinstance(other, Integer):
+			return PersistentList(self.elements * other.value).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '*', other)
 
-		if debug_mode == debug_modes_list[3]:
-			print(f"Args passed to {self.name}: {exec_ctx.symbol_table}")
+	def copy(self):
+		copy = PersistentList(self.elements)
+		copy.set_pos(self.pos_start, self.pos_end)
+		copy.set_context(self.context)
 
-	def check_and_populate_args(self, arg_names, args, exec_ctx):
-		res = RTResult()
+		return copy
 
-		if debug_mode == debug_modes_list[3]:
-			print(f"Args of {self.name}: {exec_ctx.symbol_table}")
+class Map(Value):
+	def __init__(self, entries=None):
+		super().__init__()
+		# equality key -> (key, value), so keys that are equal with '==' share an entry
+		self.entries = entries if entries is not None else {}
+		self.created = next(creation_counter)
+
+	@staticmethod
+	def key_for(key):
+		hashed = equality_key(key)
+		if hashed is None:
+			return None, None
+		# Lists are copied so changing one later doesn't change the key it was stored under
+		if isinstance(key, List):
+			return hashed, List(list(key.elements))
+		if isinstance(key, StringBuilder):
+			return hashed, String(key.value)
+		return hashed, key
+
+	def key_error(self, key):
+		return RTError(
+			key.pos_start, key.pos_end,
+			f'Values of type {key.__class__.__name__} cannot be used as map keys',
+			self.context
+		)
 
-		res.register(self.check_args(arg_names[0], args[0]))
-		if res.should_return(): return res
-		self.populate_args(arg_names, args, exec_ctx)
+	def get(self, key):
+		hashed = equality_key(key)
+		entry = self.entries.get(hashed) if hashed is not None else None
+		return entry[1] if entry is not None else None
 
-		return res.success(None)
+	def set(self, key, value):
+		hashed, key = self.key_for(key)
+		if hashed is None: return False
+		self.entries[hashed] = (key, value)
+		return True
 
-class Function(BaseFunction):
-	def __init__(self, name, body_node, arg_names, should_auto_return):
-		super().__init__(name)
-		self.body_node = body_node
-		self.arg_names = arg_names
-		self.should_auto_return = should_auto_return
-	
-	def execute(self, args):
-		res = RTResult()
-		interpreter = Interpreter()
-		exec_ctx = self.generate_new_context()
+	def added_to(self, other):
+		if isinstance(other, Map):
+			return Map({**self.entries, **other.entries}).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '+', other)
 
-		res.register(self.check_and_populate_args(self.arg_names, args, exec_ctx))
-		if res.should_return(): return res
+	def subscred_by(self, other):
+		if equality_key(other) is None:
+			return None, self.key_error(other)
 
-		value = res.register(interpreter.visit(self.body_node, exec_ctx))
-		if res.should_return() and res.func_return_value is None: return res
+		value = self.get(other)
+		if value is None:
+			return None, RTError(
+				other.pos_start, other.pos_end,
+				f'Key {other!r} is not in the map',
+				self.context
+			)
+		return value, None
 
-		ret_value = (value if self.should_auto_return else None) or res.func_return_value or NullType()
-		return res.success(ret_value)
+	def get_comparison_eq(self, other):
+		if isinstance(other, Map):
+			return Boolean(self.entries_equal(other)).set_context(self.context), None
+		return Boolean(False).set_context(self.context), None
+
+	def get_comparison_ne(self, other):
+		if isinstance(other, Map):
+			return Boolean(not self.entries_equal(other)).set_context(self.context), None
+		return Boolean(True).set_context(self.context), None
+
+	def entries_equal(self, other):
+		if self.entries.keys() != other.entries.keys():
+			return False
+		return all(values_equal(value, other.entries[hashed][1]) for hashed, (_, value) in self.entries.items())
 
 	def copy(self):
-		copy = Function(self.name, self.body_node, self.arg_names, self.should_auto_return)
-		copy.set_context(self.context)
+		copy = Map(self.entries)
+		copy.created = self.created
 		copy.set_pos(self.pos_start, self.pos_end)
+		copy.set_context(self.context)
+
 		return copy
 
-	def __repr__(self):
-		return f"<function {self.name}>"
-	
-class BuiltInFunction(BaseFunction):
-	def __init__(self, name):
-		super().__init__(name)
-	
-	def execute(self, args):
-		res = RTResult()
-		exec_ctx = self.generate_new_context()
+	def is_true(self):
+		return len(self.entries) > 0
 
-		method_name = f'execute_{self.name}'
-		method = getattr(self, method_name, self.no_visit_method)
+	def __repr__(self):
+		return f"{{{', '.join(f'{key!r}: {value!r}' for key, value in self.entries.values())}}}"
+
+class Vector(Value):
+	broadcasts = True
+
+	operations = {
+		'+': operator.add,
+		'-': operator.sub,
+		'*': operator.mul,
+		'/': operator.truediv,
+		'^': operator.pow,
+		'==': operator.eq,
+		'!=': operator.ne,
+		'<': operator.lt,
+		'>': operator.gt,
+		'<=': operator.le,
+		'>=': operator.ge,
+		'and': lambda a, b: np.logical_and(a, b),
+		'or': lambda a, b: np.logical_or(a, b)
+	}
 
-		res.register(self.check_and_populate_args((method.positional_arg_names, method.optional_arg_names), args, exec_ctx))
-		if res.should_return(): return res
+	def __init__(self, value):
+		super().__init__()
+		self.value = value
 
-		return_value = res.register(method(exec_ctx))
-		if res.should_return(): return res
+	@staticmethod
+	def from_values(values, dtype=None):
+		if dtype == 'object':
+			return Vector(np.array([Vector.unbox(value, True) for value in values] or [], dtype=object))
+
+		items = [Vector.unbox(value, False) for value in values]
+		if dtype is None:
+			# Booleans only make a boolean Vector, so subscripting with it masks instead of indexing
+			if values and all(isinstance(value, Boolean) for value in values): dtype = 'bool'
+			elif any(isinstance(item, complex) for item in items): dtype = 'complex'
+			elif any(isinstance(item, float) for item in items): dtype = 'float'
+			elif all(-2**63 <= item < 2**63 for item in items): dtype = 'int'
+			else: return Vector.from_values(values, 'object')
+
+		return Vector(np.array(items, dtype={'bool': np.bool_, 'int': np.int64, 'float': np.float64, 'complex': np.complex128}[dtype]))
+
+	@staticmethod
+	def unbox(value, keep_precision):
+		if isinstance(value, (Integer, Boolean)):
+			return int(value.value)
+		if isinstance(value, (Decimal, Rational)):
+			return mpf(value.value) if keep_precision else float(value.value)
+		if isinstance(value, Complex):
+			return mpc(value.value) if keep_precision else complex(value.value)
+		raise TypeError(f'{value.__class__.__name__} is not a number')
+
+	@staticmethod
+	def box(item):
+		if isinstance(item, (bool, np.bool_)):
+			return Boolean(bool(item))
+		if isinstance(item, (int, np.integer)):
+			return Integer(int(item))
+		if isinstance(item, np.complexfloating):
+			# Doubles are boxed from their shortest representation so they don't show binary noise at high precision
+			return Complex(mpc(repr(float(item.real)), repr(float(item.imag))))
+		if isinstance(item, np.floating):
+			return Decimal(repr(float(item)))
+		if isinstance(item, (mpc, complex)):
+			return Complex(item)
+		return Decimal(item)
+
+	def operand(self, other):
+		if isinstance(other, Vector):
+			return other.value
+		if isinstance(other, (Integer, Boolean, Decimal, Rational, Complex)):
+			return self.unbox(other, self.value.dtype == object)
+		return None
+
+	@staticmethod
+	def magnitude(array):
+		# The largest absolute value in an integer array, as a Python int
+		array = np.asarray(array)
+		return max(abs(int(array.min())), abs(int(array.max()))) if array.size > 0 else 0
+
+	@staticmethod
+	def may_overflow(op, left, right):
+		# NumPy integer arithmetic wraps around silently, so operations that could leave the int64 range are done on Python ints
+		if op not in ('+', '-', '*', '^'): return False
+		if np.asarray(left).dtype.kind not in 'iub' or np.asarray(right).dtype.kind not in 'iub': return False
+
+		a, b = Vector.magnitude(left), Vector.magnitude(right)
+		if op in ('+', '-'): return a + b >= 2**63
+		if op == '*': return a * b >= 2**63
+		return a >= 2 and (b >= 63 or a ** b >= 2**63)
+
+	def operate(self, op, other, reflected=False):
+		operand = self.operand(other)
+		if operand is None:
+			return None, Value.illegal_operation(other, op, self) if reflected else Value.illegal_operation(self, op, other)
+
+		left, right = (operand, self.value) if reflected else (self.value, operand)
+
+		if op == '/' and np.any(np.asarray(right) == 0):
+			return None, RTError(
+				other.pos_start if not reflected else self.pos_start, other.pos_end if not reflected else self.pos_end,
+				"Division by zero (cause undefined, it approach -inf when we're approaching 0 from the negative and it approach +inf when we're approaching 0 from the positive)",
+				self.context
+			)
 
-		return res.success(return_value)
+		if op == '^' and np.asarray(left).dtype.kind in 'iub' and np.any(np.asarray(right) < 0):
+			# NumPy refuses negative integer powers of integer arrays
+			left = np.asarray(left, dtype=np.float64)
+
+		if self.may_overflow(op, left, right):
+			left, right = np.asarray(left).astype(object), np.asarray(right).astype(object)
+
+		operation = self.operations[op]
+		if op == '/' and self.value.dtype == object:
+			# Python integers would otherwise divide into doubles
+			operation = np.frompyfunc(lambda a, b: mpf(a) / b if isinstance(a, int) and isinstance(b, int) else a / b, 2, 1)
+
+		try:
+			result = operation(left, right)
+		except ValueError:
+			return None, RTError(
+				self.pos_start, other.pos_end,
+				f'Vectors of shapes {np.shape(left)} and {np.shape(right)} cannot be combined with "{op}"',
+				self.context
+			)
+
+		return Vector(np.asarray(result)).set_context(self.context), None
+
+	def reflected_operation(self, op_tok, other):
+		return self.operate(OPERATOR_SYMBOLS.get(op_tok.type, op_tok.value), other, reflected=True)
+
+	def added_to(self, other):
+		return self.operate('+', other)
+
+	def subbed_by(self, other):
+		return self.operate('-', other)
+
+	def multed_by(self, other):
+		return self.operate('*', other)
+
+	def dived_by(self, other):
+		return self.operate('/', other)
+
+	def powed_by(self, other):
+		return self.operate('^', other)
+
+	def subscred_by(self, other):
+		if isinstance(other, (Integer, Boolean)):
+			try:
+				return self.box(self.value[other.value]), None
+			except IndexError:
+				return None, RTError(
+					other.pos_start, other.pos_end,
+					'Element at this index could not be retrived from vector because index is out of bounds',
+					self.context
+				)
+		elif isinstance(other, List):
+			slice_ = make_slice(other)
+			if slice_ is None: return None, slice_error(other, self.context)
+			# Basic slicing of a NumPy array is a view, not a copy
+			return Vector(self.value[slice_]).set_context(self.context), None
+		elif isinstance(other, Vector) and other.value.dtype.kind in 'iub':
+			try:
+				return Vector(self.value[other.value]).set_context(self.context), None
+			except IndexError:
+				return None, RTError(
+					other.pos_start, other.pos_end,
+					'Elements could not be selected from vector because the indices or the mask do not match it',
+					self.context
+				)
+		else:
+			return None, Value.illegal_operation(self, '_', other)
+
+	def get_comparison_eq(self, other):
+		return self.operate('==', other)
+
+	def get_comparison_ne(self, other):
+		return self.operate('!=', other)
+
+	def get_comparison_lt(self, other):
+		return self.operate('<', other)
+
+	def get_comparison_gt(self, other):
+		return self.operate('>', other)
+
+	def get_comparison_lte(self, other):
+		return self.operate('<=', other)
+
+	def get_comparison_gte(self, other):
+		return self.operate('>=', other)
+
+	def anded_by(self, other):
+		return self.operate('and', other)
+
+	def ored_by(self, other):
+		return self.operate('or', other)
+
+	def notted(self):
+		return Vector(np.logical_not(self.value)).set_context(self.context), None
 
-	def no_visit_method(self, node, context):
-		raise NameError(f'No execute_{self.name} method defined')
-	
 	def copy(self):
-		copy = BuiltInFunction(self.name)
+		copy = Vector(self.value)
+		copy.set_pos(self.pos_start, self.pos_end)
 		copy.set_context(self.context)
+
+		return copy
+
+	def is_true(self):
+		return self.value.size > 0
+
+	def __repr__(self):
+		return f"vector({', '.join(repr(self.box(item)) for item in self.value)})"
+
+class Matrix(Value):
+	broadcasts = True
+
+	def __init__(self, value):
+		super().__init__()
+		# A NumPy array in 'fast' numeric mode, an mpmath matrix in 'precise' numeric mode
+		self.value = value
+
+	@staticmethod
+	def from_rows(rows):
+		if numeric_mode == 'fast':
+			array = np.array([[Vector.unbox(value, False) for value in row] for row in rows])
+			# Integers too large for int64 can't go through LAPACK
+			return Matrix(array.astype(np.float64) if array.dtype == object else array)
+		return Matrix(mp.matrix([[Vector.unbox(value, True) for value in row] for row in rows]))
+
+	@staticmethod
+	def identity(size):
+		if numeric_mode == 'fast':
+			return Matrix(np.eye(size, dtype=np.int64))
+		return Matrix(mp.eye(size))
+
+	@staticmethod
+	def box(item):
+		return make_number(item.item() if hasattr(item, 'item') else item)
+
+	@property
+	def precise(self):
+		return np is None or not isinstance(self.value, np.ndarray)
+
+	@property
+	def shape(self):
+		return (self.value.rows, self.value.cols) if self.precise else self.value.shape
+
+	@property
+	def is_square(self):
+		return self.shape[0] == self.shape[1]
+
+	def rows(self):
+		return self.value.tolist()
+
+	def shape_error(self, op, other):
+		return RTError(
+			self.pos_start, other.pos_end,
+			f'Matrices of shapes {self.shape} and {other.shape} cannot be combined with "{op}"',
+			self.context
+		)
+
+	def operate(self, op, other, reflected=False):
+		if isinstance(other, Matrix):
+			if op in ('+', '-') and self.shape != other.shape or op == '*' and self.shape[1] != other.shape[0]:
+				return None, self.shape_error(op, other)
+			if op == '+':
+				return Matrix(self.value + other.value).set_context(self.context), None
+			if op == '-':
+				return Matrix(self.value - other.value).set_context(self.context), None
+			if op == '*':
+				return Matrix(self.value * other.value if self.precise else self.value @ other.value).set_context(self.context), None
+		elif isinstance(other, Vector) and op == '*' and not reflected:
+			if self.shape[1] != other.value.shape[0]:
+				return None, self.shape_error(op, other)
+			if self.precise:
+				return Vector(np.array(self.rows(), dtype=object) @ other.value).set_context(self.context), None
+			return Vector(self.value @ other.value).set_context(self.context), None
+		elif isinstance(other, (Integer, Boolean, Decimal, Rational, Complex)):
+			scalar = Vector.unbox(other, self.precise)
+			if op == '*':
+				return Matrix(self.value * scalar).set_context(self.context), None
+			if op == '/' and not reflected:
+				if scalar == 0:
+					return None, RTError(
+						other.pos_start, other.pos_end,
+						"Division by zero (cause undefined, it approach -inf when we're approaching 0 from the negative and it approach +inf when we're approaching 0 from the positive)",
+						self.context
+					)
+				return Matrix(self.value / scalar).set_context(self.context), None
+
+		return None, Value.illegal_operation(other, op, self) if reflected else Value.illegal_operation(self, op, other)
+
+	def reflected_operation(self, op_tok, other):
+		return self.operate(OPERATOR_SYMBOLS.get(op_tok.type, op_tok.value), other, reflected=True)
+
+	def added_to(self, other):
+		return self.operate('+', other)
+
+	def subbed_by(self, other):
+		return self.operate('-', other)
+
+	def multed_by(self, other):
+		return self.operate('*', other)
+
+	def dived_by(self, other):
+		return self.operate('/', other)
+
+	def powed_by(self, other):
+		if not isinstance(other, Integer):
+			return None, Value.illegal_operation(self, '^', other)
+		if not self.is_square:
+			return None, RTError(
+				self.pos_start, self.pos_end,
+				f'Only square matrices can be raised to a power, not a matrix of shape {self.shape}',
+				self.context
+			)
+
+		try:
+			if self.precise:
+				return Matrix(self.value ** other.value).set_context(self.context), None
+			return Matrix(np.linalg.matrix_power(self.value, other.value)).set_context(self.context), None
+		except (ValueError, ZeroDivisionError):
+			return None, RTError(
+				self.pos_start, other.pos_end,
+				'Singular matrices cannot be raised to a negative power',
+				self.context
+			)
+
+	def subscred_by(self, other):
+		if isinstance(other, (Integer, Boolean)):
+			try:
+				return List([self.box(item) for item in self.rows()[other.value]]), None
+			except IndexError:
+				return None, RTError(
+					other.pos_start, other.pos_end,
+					'Row at this index could not be retrived from matrix because index is out of bounds',
+					self.context
+				)
+		elif isinstance(other, List):
+			slice_ = make_slice(other)
+			if slice_ is None: return None, slice_error(other, self.context)
+			if len(range(self.shape[0])[slice_]) == 0:
+				return None, RTError(
+					other.pos_start, other.pos_end,
+					'This slice selects no rows of the matrix',
+					self.context
+				)
+			return Matrix(self.value[slice_, :]).set_context(self.context), None
+		else:
+			return None, Value.illegal_operation(self, '_', other)
+
+	def get_comparison_eq(self, other):
+		if isinstance(other, Matrix):
+			return Boolean(self.rows() == other.rows()).set_context(self.context), None
+		return None, Value.illegal_operation(self, '==', other)
+
+	def get_comparison_ne(self, other):
+		if isinstance(other, Matrix):
+			return Boolean(self.rows() != other.rows()).set_context(self.context), None
+		return None, Value.illegal_operation(self, '!=', other)
+
+	def copy(self):
+		copy = Matrix(self.value)
 		copy.set_pos(self.pos_start, self.pos_end)
+		copy.set_context(self.context)
+
 		return copy
-	
+
+	def is_true(self):
+		return True
+
 	def __repr__(self):
-		return f'<built-in function {self.name}>'
-	
-	######################################################
+		return f"matrix({', '.join('(' + ', '.join(repr(self.box(item)) for item in row) + ')' for row in self.rows())})"
 
-	def execute_print(self, exec_ctx):
-		value = exec_ctx.symbol_table.get('value')
-		sep = exec_ctx.symbol_table.get('sep')
-		end_char = exec_ctx.symbol_table.get('end_char')
+class Range(Value):
+	# An arithmetic sequence whose elements are only computed when they are used, so it takes constant memory
+	def __init__(self, start, stop, step):
+		super().__init__()
+		self.start = start
+		self.stop = stop
+		self.step = step
+
+		if all(isinstance(value, int) for value in (start, stop, step)):
+			self.integers = range(start, stop, step)
+			# len() of a Python range fails past sys.maxsize elements
+			self.count = max(0, (stop - start + step - (1 if step > 0 else -1)) // step)
+		else:
+			self.integers = None
+			self.count = max(0, int(mp.ceil((mpf(stop) - start) / step)))
 
-		if isinstance(end_char, NullType):
-			end_char = '\n'
-		end_char = str(end_char)
+	def element(self, k):
+		if self.integers is not None:
+			return Integer(self.integers[k])
+		# Every element is computed from the start so the steps don't accumulate rounding errors
+		return make_number(self.start + k * self.step)
 
-		if isinstance(value, List) and not isinstance(sep, NullType):
-			print(str(sep).join(str(x) for x in value.elements), end=end_char)
+	def iterate(self):
+		if self.integers is not None:
+			return map(Integer, self.integers)
+		return map(self.element, range(self.count))
+
+	def subscred_by(self, other):
+		if isinstance(other, (Integer, Boolean)):
+			k = int(other.value)
+			if k < 0: k += self.count
+			if not 0 <= k < self.count:
+				return None, RTError(
+					other.pos_start, other.pos_end,
+					'Element at this index could not be retrived from range because index is out of bounds',
+					self.context
+				)
+			return self.element(k), None
+		elif isinstance(other, List):
+			slice_ = make_slice(other)
+			if slice_ is None: return None, slice_error(other, self.context)
+			if self.integers is not None:
+				integers = self.integers[slice_]
+				return Range(integers.start, integers.stop, integers.step).set_context(self.context), None
+			return List([self.element(k) for k in range(self.count)[slice_]]).set_context(self.context), None
 		else:
-			print(str(value), end=end_char)
+			return None, Value.illegal_operation(self, '_', other)
 
-		return RTResult().success(NullType())
-	execute_print.positional_arg_names = ["value"] # type: ignore
-	execute_print.optional_arg_names = {"sep": NullType(), "end_char": NullType()} # type: ignore
+	def copy(self):
+		copy = Range(self.start, self.stop, self.step)
+		copy.set_pos(self.pos_start, self.pos_end)
+		copy.set_context(self.context)
 
-	def execute_input(self, exec_ctx):
-		placeholder = exec_ctx.symbol_table.get('placeholder')
-		if isinstance(placeholder, NullType): text = input()
-		else: text = input(placeholder)
-		return RTResult().success(String(text))
-	execute_input.positional_arg_names = [] # type: ignore
-	execute_input.optional_arg_names = {"placeholder": NullType()} # type: ignore
+		return copy
 
-	def execute_clear(self, exec_ctx):
-		print('\033c')
-		return RTResult().success(NullType())
-	execute_clear.positional_arg_names = [] # type: ignore
-	execute_clear.optional_arg_names = {} # type: ignore
+	def is_true(self):
+		return self.count > 0
 
-	def execute_exit(self, exec_ctx):
-		code = exec_ctx.symbol_table.get('code')
-		if not isinstance(code, NullType):
-			print("Exited:", code)
-			sys.exit(code)
-		sys.exit()
-	execute_exit.positional_arg_names = [] # type: ignore
-	execute_exit.optional_arg_names = {"code": NullType()} # type: ignore
+	def __repr__(self):
+		start, stop, step = (repr(make_number(value)) for value in (self.start, self.stop, self.step))
+		return f"range({start}, {stop})" if self.step == 1 else f"range({start}, {stop}, increment={step})"
 
-	def execute_type(self, exec_ctx):
-		obj = exec_ctx.symbol_table.get('obj')
-		return RTResult().success(String(obj.__class__.__name__))
-	execute_type.positional_arg_names = ["obj"] # type: ignore
-	execute_type.optional_arg_names = {} # type: ignore
+class Generator(Value):
+	# A lazy sequence that can be consumed once, computing each element when it is asked for
+	def __init__(self, name, iterator):
+		super().__init__()
+		self.name = name
+		self.iterator = iterator
 
-	def execute_sin(self, exec_ctx):
-		theta = exec_ctx.symbol_table.get('theta')
-		e = global_symbol_table.get('e')
-		return RTResult().success(Complex((e.value ** (1j * theta.value) - e.value ** (-1j * theta.value)) / 2j))
-	execute_sin.positional_arg_names = ["theta"] # type: ignore
-	execute_sin.optional_arg_names = {} # type: ignore
+	def copy(self):
+		copy = Generator(self.name, self.iterator)
+		copy.set_pos(self.pos_start, self.pos_end)
+		copy.set_context(self.context)
 
-	def execute_cos(self, exec_ctx):
-		theta = exec_ctx.symbol_table.get('theta')
-		e = global_symbol_table.get('e')
-		return RTResult().success(Complex((e.value ** (1j * theta.value) + e.value ** (-1j * theta.value)) / 2))
-	execute_cos.positional_arg_names = ["theta"] # type: ignore
-	execute_cos.optional_arg_names = {} # type: ignore
+		return copy
 
-	def execute_exec(self, exec_ctx):
-		code_or_filename = exec_ctx.symbol_table.get('code_or_filename')
+	def is_true(self):
+		return True
+
+	def __repr__(self):
+		return f"<generator {self.name}>"
+
+class BaseFunction(Value):
+	def __init__(self, name):
+		super().__init__()
+		self.name = name or '<anonymous>'
+	
+	def generate_new_context(self):
+		new_context = Context(self.name, self.context, self.pos_start)
+		new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
+
+		return new_context
+	
+	def check_args(self, arg_names, args):
+		res = RTResult()
+
+		if len(args) > len(arg_names):
+			return res.failure(RTError(
+				self.pos_start, self.pos_end,
+				f"{len(args) - len(arg_names)} too many args passed into '{self.name}'",
+				self.context
+			))
 		
-		if not isinstance(code_or_filename, String):
-			return RTResult.failure(RTError(
+		if len(args) < len(arg_names):
+			return res.failure(RTError(
 				self.pos_start, self.pos_end,
-				"Argument code_or_filename must be a String.",
-				exec_ctx
+				f"{len(arg_names) - len(args)} too few args passed into '{self.name}'",
+				self.context
 			))
-
-		code_or_filename = code_or_filename.value
-		is_filename = re.match(r'((^([a-z]|[A-Z]):(?=\\(?![\0-\37<>:"/\\|?*])|\/(?![\0-\37<>:"/\\|?*])|$)|^\\(?=[\\\/][^\0-\37<>:"/\\|?*]+)|^(?=(\\|\/)$)|^\.(?=(\\|\/)$)|^\.\.(?=(\\|\/)$)|^(?=(\\|\/)[^\0-\37<>:"/\\|?*]+)|^\.(?=(\\|\/)[^\0-\37<>:"/\\|?*]+)|^\.\.(?=(\\|\/)[^\0-\37<>:"/\\|?*]+))((\\|\/)[^\0-\37<>:"/\\|?*]+|(\\|\/)$)*()$)|(^\/$|(^(?=\/)|^\.|^\.\.)(\/(?=[^/\0])[^/\0]+)*\/?$)', code_or_filename)
-		filename = code_or_filename if is_filename else '<code>'
 		
-		if is_filename:
-			try:
-				with open(filename, 'r') as file:
-					code = file.read()
-			except Exception as e:
-				return RTResult().failure(RTError(
-					self.pos_start, self.pos_end,
-					f'Failed to open file "{filename}" because of the following exception:\n{e}',
-					exec_ctx
-				))
-		else:
-			code = code_or_filename
+		return res.success(None)
+	
+	def populate_args(self, arg_names, args, exec_ctx):
+		for i in range(len(args[0])):
+			arg_name = arg_names[0][i]
+			arg_value = args[0][i]
+			if isinstance(arg_value, type(None)): arg_value = NullType()
+			arg_value.set_context(exec_ctx)
+			exec_ctx.symbol_table.set(arg_name, arg_value)
+
+		opt_arg_names = arg_names[1].copy()
+
+		for arg_name, arg_value in args[1].items():
+			if isinstance(arg_value, type(None)): arg_value = NullType()
+			arg_value.set_context(exec_ctx)
+			opt_arg_names[arg_name] = arg_value
+
+		for arg_name, arg_value in opt_arg_names.items():
+			exec_ctx.symbol_table.set(arg_name, arg_value)
+
+		if debug_mode == debug_modes_list[3]:
+			print(f"Args passed to {self.name}: {exec_ctx.symbol_table}")
+
+	def check_and_populate_args(self, arg_names, args, exec_ctx):
+		res = RTResult()
+
+		if debug_mode == debug_modes_list[3]:
+			print(f"Args of {self.name}: {exec_ctx.symbol_table}")
+
+		res.register(self.check_args(arg_names[0], args[0]))
+		if res.should_return(): return res
+		self.populate_args(arg_names, args, exec_ctx)
+
+		return res.success(None)
+
+class Function(BaseFunction):
+	def __init__(self, name, body_node, arg_names, should_auto_return):
+		super().__init__(name)
+		self.body_node = body_node
+		self.arg_names = arg_names
+		self.should_auto_return = should_auto_return
+		self.memo_cache = None
+		self.persistent = False
+		# Worked out once by persist(), since hashing the source on every call is wasted work
+		self.persistent_source_hash = None
+		self.is_generator = False
+	
+	def execute(self, args):
+		res = RTResult()
+		key = persistent_key = None
+
+		if self.is_generator:
+			exec_ctx = self.generate_new_context()
+			res.register(self.check_and_populate_args(self.arg_names, args, exec_ctx))
+			if res.should_return(): return res
+
+			# The body only starts running when the first element is asked for
+			return res.success(Generator(self.name, generate(self.body_node, exec_ctx)))
+
+		if self.memo_cache is not None:
+			key = self.memo_cache.make_key(args)
+			if key is not None:
+				found, cached_value = self.memo_cache.get(key)
+				if found: return res.success(cached_value)
+
+		if self.persistent:
+			persistent_key = PersistentCache.make_key(self.persistent_source_hash, args)
+			if persistent_key is not None:
+				found, cached_value = get_persistent_cache().get(persistent_key)
+				if found:
+					if key is not None: self.memo_cache.put(key, cached_value)
+					return res.success(cached_value)
+
+		interpreter = Interpreter()
+		exec_ctx = self.generate_new_context()
+		if self.memo_cache is not None or self.persistent:
+			exec_ctx.memoized_function = self.name
+			exec_ctx.memoized_since = next(creation_counter)
+
+		res.register(self.check_and_populate_args(self.arg_names, args, exec_ctx))
+		if res.should_return(): return res
+
+		value = res.register(interpreter.visit(self.body_node, exec_ctx))
+		if res.should_return() and res.func_return_value is None: return res
+
+		ret_value = (value if self.should_auto_return else None) or res.func_return_value or NullType()
+
+		if key is not None:
+			self.memo_cache.put(key, ret_value)
+		if persistent_key is not None:
+			get_persistent_cache().put(persistent_key, self.persistent_source_hash, ret_value)
+
+		return res.success(ret_value)
+
+	def source_hash(self):
+		ftxt = self.body_node.pos_start.ftxt
+		source = ftxt[self.body_node.pos_start.idx:self.body_node.pos_end.idx]
+		return hashlib.sha256(repr((self.name, self.arg_names, self.should_auto_return, source)).encode()).hexdigest()
+
+	def copy(self):
+		copy = Function(self.name, self.body_node, self.arg_names, self.should_auto_return)
+		copy.memo_cache = self.memo_cache
+		copy.persistent = self.persistent
+		copy.is_generator = self.is_generator
+		copy.persistent_source_hash = self.persistent_source_hash
+		copy.set_context(self.context)
+		copy.set_pos(self.pos_start, self.pos_end)
+		return copy
+
+	def __repr__(self):
+		return f"<function {self.name}>"
+	
+class BuiltInFunction(BaseFunction):
+	def __init__(self, name):
+		super().__init__(name)
+	
+	def execute(self, args):
+		res = RTResult()
+		exec_ctx = self.generate_new_context()
+
+		method_name = f'execute_{self.name}'
+		method = getattr(self, method_name, self.no_visit_method)
+
+		memoized_ctx = exec_ctx.parent
+		while memoized_ctx and memoized_ctx.memoized_function is None:
+			memoized_ctx = memoized_ctx.parent
+
+		if memoized_ctx and getattr(method, 'impure', False):
+			return res.failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Cannot call '{self.name}' inside memoized function '{memoized_ctx.memoized_function}' because it has side effects",
+				exec_ctx
+			))
+
+		res.register(self.check_and_populate_args((method.positional_arg_names, method.optional_arg_names), args, exec_ctx))
+		if res.should_return(): return res
+
+		if memoized_ctx and hasattr(method, 'mutates'):
+			# Changing a value the call created itself is invisible from outside, unlike changing an argument or a
+			# value from an outer scope, which a cached result would skip
+			changed = exec_ctx.symbol_table.get(method.mutates)
+			if getattr(changed, 'created', memoized_ctx.memoized_since) < memoized_ctx.memoized_since:
+				return res.failure(RTError(
+					self.pos_start, self.pos_end,
+					f"Cannot call '{self.name}' inside memoized function '{memoized_ctx.memoized_function}' on a value the call didn't create",
+					exec_ctx
+				))
+
+		try:
+			return_value = res.register(method(exec_ctx))
+		except IterationError as e:
+			return res.failure(e.error)
+		if res.should_return(): return res
+
+		return res.success(return_value)
+
+	def no_visit_method(self, node, context):
+		raise NameError(f'No execute_{self.name} method defined')
+
+	def apply_math_function(self, exec_ctx, arg_names, mp_function, math_function, cmath_function, numpy_name, real_only=False):
+		args = [exec_ctx.symbol_table.get(arg_name) for arg_name in arg_names]
+
+		if any(isinstance(arg, Vector) for arg in args):
+			return self.apply_vector_math_function(exec_ctx, args, mp_function, math_function, numpy_name)
+
+		for arg_name, arg in zip(arg_names, args):
+			if real_only and isinstance(arg, Complex):
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					f"Argument {arg_name} must be a real number.",
+					exec_ctx
+				))
+			if not isinstance(arg, (Integer, Decimal, Boolean, Complex, Rational)):
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					f"Argument {arg_name} must be a number.",
+					exec_ctx
+				))
+
+		values = [arg.value for arg in args]
+
+		try:
+			if numeric_mode != 'fast':
+				result = mp_function(*values)
+			elif any(isinstance(value, complex) for value in values):
+				result = cmath_function(*values) if cmath_function is not None else complex(mp_function(*values))
+			else:
+				try:
+					result = math_function(*values)
+				except ValueError:
+					# Real arguments outside the real domain (sqrt(-1), log(-1), ...) have complex results
+					if cmath_function is None: raise
+					result = cmath_function(*values)
+		except (ValueError, TypeError, ZeroDivisionError, OverflowError):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Math domain error in '{self.name}'",
+				exec_ctx
+			))
+
+		if isinstance(result, (mpc, complex)):
+			return RTResult().success(Complex(result))
+		return RTResult().success(Decimal(result))
+
+	def apply_vector_math_function(self, exec_ctx, args, mp_function, math_function, numpy_name):
+		arrays = []
+		for arg in args:
+			if isinstance(arg, Vector):
+				arrays.append(arg.value)
+			elif isinstance(arg, (Integer, Decimal, Boolean, Complex, Rational)):
+				arrays.append(Vector.unbox(arg, False))
+			else:
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					"Arguments must be numbers or Vectors.",
+					exec_ctx
+				))
+
+		try:
+			if any(np.asarray(array).dtype == object for array in arrays):
+				result = np.frompyfunc(mp_function, len(arrays), 1)(*arrays)
+			elif numpy_name is None:
+				result = np.frompyfunc(math_function, len(arrays), 1)(*arrays).astype(np.float64)
+			elif hasattr(np.emath, numpy_name):
+				# np.emath switches to complex results outside the real domain, like the scalar built-ins
+				result = getattr(np.emath, numpy_name)(*arrays)
+			else:
+				result = getattr(np, numpy_name)(*arrays)
+		except (ValueError, TypeError, ZeroDivisionError, OverflowError):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Math domain error in '{self.name}'",
+				exec_ctx
+			))
+
+		return RTResult().success(Vector(np.asarray(result)))
+	
+	def copy(self):
+		copy = BuiltInFunction(self.name)
+		copy.set_context(self.context)
+		copy.set_pos(self.pos_start, self.pos_end)
+		return copy
+	
+	def __repr__(self):
+		return f'<built-in function {self.name}>'
+	
+	######################################################
+
+	def execute_print(self, exec_ctx):
+		value = exec_ctx.symbol_table.get('value')
+		sep = exec_ctx.symbol_table.get('sep')
+		end_char = exec_ctx.symbol_table.get('end_char')
+
+		if isinstance(end_char, NullType):
+			end_char = '\n'
+		end_char = str(end_char)
+
+		if isinstance(value, List) and not isinstance(sep, NullType):
+			print(str(sep).join(str(x) for x in value.elements), end=end_char)
+		else:
+			print(str(value), end=end_char)
+
+		return RTResult().success(NullType())
+	execute_print.positional_arg_names = ["value"] # type: ignore
+	execute_print.optional_arg_names = {"sep": NullType(), "end_char": NullType()} # type: ignore
+	execute_print.impure = True # type: ignore
+
+	def execute_input(self, exec_ctx):
+		placeholder = exec_ctx.symbol_table.get('placeholder')
+		if isinstance(placeholder, NullType): text = input()
+		else: text = input(placeholder)
+		return RTResult().success(String(text))
+	execute_input.positional_arg_names = [] # type: ignore
+	execute_input.optional_arg_names = {"placeholder": NullType()} # type: ignore
+	execute_input.impure = True # type: ignore
+
+	def execute_clear(self, exec_ctx):
+		print('\033c')
+		return RTResult().success(NullType())
+	execute_clear.positional_arg_names = [] # type: ignore
+	execute_clear.optional_arg_names = {} # type: ignore
+	execute_clear.impure = True # type: ignore
+
+	def execute_exit(self, exec_ctx):
+		code = exec_ctx.symbol_table.get('code')
+		if not isinstance(code, NullType):
+			print("Exited:", code)
+			sys.exit(code)
+		sys.exit()
+	execute_exit.positional_arg_names = [] # type: ignore
+	execute_exit.optional_arg_names = {"code": NullType()} # type: ignore
+	execute_exit.impure = True # type: ignore
+
+	def execute_type(self, exec_ctx):
+		obj = exec_ctx.symbol_table.get('obj')
+		return RTResult().success(String(obj.__class__.__name__))
+	execute_type.positional_arg_names = ["obj"] # type: ignore
+	execute_type.optional_arg_names = {} # type: ignore
+
+	def execute_sin(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["theta"], mp.sin, math.sin, cmath.sin, "sin")
+	execute_sin.positional_arg_names = ["theta"] # type: ignore
+	execute_sin.optional_arg_names = {} # type: ignore
+
+	def execute_cos(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["theta"], mp.cos, math.cos, cmath.cos, "cos")
+	execute_cos.positional_arg_names = ["theta"] # type: ignore
+	execute_cos.optional_arg_names = {} # type: ignore
+
+	def execute_tan(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["theta"], mp.tan, math.tan, cmath.tan, "tan")
+	execute_tan.positional_arg_names = ["theta"] # type: ignore
+	execute_tan.optional_arg_names = {} # type: ignore
+
+	def execute_asin(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.asin, math.asin, cmath.asin, "arcsin")
+	execute_asin.positional_arg_names = ["x"] # type: ignore
+	execute_asin.optional_arg_names = {} # type: ignore
+
+	def execute_acos(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.acos, math.acos, cmath.acos, "arccos")
+	execute_acos.positional_arg_names = ["x"] # type: ignore
+	execute_acos.optional_arg_names = {} # type: ignore
+
+	def execute_atan(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.atan, math.atan, cmath.atan, "arctan")
+	execute_atan.positional_arg_names = ["x"] # type: ignore
+	execute_atan.optional_arg_names = {} # type: ignore
+
+	def execute_atan2(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["y", "x"], mp.atan2, math.atan2, None, "arctan2", real_only=True)
+	execute_atan2.positional_arg_names = ["y", "x"] # type: ignore
+	execute_atan2.optional_arg_names = {} # type: ignore
+
+	def execute_sinh(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.sinh, math.sinh, cmath.sinh, "sinh")
+	execute_sinh.positional_arg_names = ["x"] # type: ignore
+	execute_sinh.optional_arg_names = {} # type: ignore
+
+	def execute_cosh(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.cosh, math.cosh, cmath.cosh, "cosh")
+	execute_cosh.positional_arg_names = ["x"] # type: ignore
+	execute_cosh.optional_arg_names = {} # type: ignore
+
+	def execute_tanh(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.tanh, math.tanh, cmath.tanh, "tanh")
+	execute_tanh.positional_arg_names = ["x"] # type: ignore
+	execute_tanh.optional_arg_names = {} # type: ignore
+
+	def execute_exp(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.exp, math.exp, cmath.exp, "exp")
+	execute_exp.positional_arg_names = ["x"] # type: ignore
+	execute_exp.optional_arg_names = {} # type: ignore
+
+	def execute_log(self, exec_ctx):
+		if isinstance(exec_ctx.symbol_table.get('base'), NullType):
+			return self.apply_math_function(exec_ctx, ["x"], mp.log, math.log, cmath.log, "log")
+		return self.apply_math_function(exec_ctx, ["x", "base"], mp.log, math.log, cmath.log, None)
+	execute_log.positional_arg_names = ["x"] # type: ignore
+	execute_log.optional_arg_names = {"base": NullType()} # type: ignore
+
+	def execute_sqrt(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.sqrt, math.sqrt, cmath.sqrt, "sqrt")
+	execute_sqrt.positional_arg_names = ["x"] # type: ignore
+	execute_sqrt.optional_arg_names = {} # type: ignore
+
+	def execute_gamma(self, exec_ctx):
+		return self.apply_math_function(exec_ctx, ["x"], mp.gamma, math.gamma, None, None)
+	execute_gamma.positional_arg_names = ["x"] # type: ignore
+	execute_gamma.optional_arg_names = {} # type: ignore
+
+	def execute_exec(self, exec_ctx):
+		code_or_filename = exec_ctx.symbol_table.get('code_or_filename')
+		
+		if not isinstance(code_or_filename, String):
+			return RTResult.failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument code_or_filename must be a String.",
+				exec_ctx
+			))
+
+		code_or_filename = code_or_filename.value
+		is_filename = re.match(r'((^([a-z]|[A-Z]):(?=\\(?![\0-\37<>:"/\\|?*])|\/(?![\0-\37<>:"/\\|?*])|$)|^\\(?=[\\\/][^\0-\37<>:"/\\|?*]+)|^(?=(\\|\/)$)|^\.(?=(\\|\/)$)|^\.\.(?=(\\|\/)$)|^(?=(\\|\/)[^\0-\37<>:"/\\|?*]+)|^\.(?=(\\|\/)[^\0-\37<>:"/\\|?*]+)|^\.\.(?=(\\|\/)[^\0-\37<>:"/\\|?*]+))((\\|\/)[^\0-\37<>:"/\\|?*]+|(\\|\/)$)*()$)|(^\/$|(^(?=\/)|^\.|^\.\.)(\/(?=[^/\0])[^/\0]+)*\/?$)', code_or_filename)
+		filename = code_or_filename if is_filename else '<code>'
+		
+		if is_filename:
+			try:
+				with open(filename, 'r') as file:
+					code = file.read()
+			except Exception as e:
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					f'Failed to open file "{filename}" because of the following exception:\n{e}',
+					exec_ctx
+				))
+		else:
+			code = code_or_filename
+
+		_, error = run(filename, code, discard_result=True)
+
+		if error:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f'Failed to run "{filename}" because of the following exception:\n{error}',
+				exec_ctx
+			))
+		
+		return RTResult().success(NullType())
+	execute_exec.positional_arg_names = ["code_or_filename"] # type: ignore
+	execute_exec.optional_arg_names = {} # type: ignore
+	execute_exec.impure = True # type: ignore
+
+	def execute_length(self, exec_ctx):
+		iterable = exec_ctx.symbol_table.get('iterable')
+
+		if isinstance(iterable, Map):
+			return RTResult().success(Integer(len(iterable.entries)))
+		if isinstance(iterable, Range):
+			return RTResult().success(Integer(iterable.count))
+		if not isinstance(iterable, (List, String, Vector)):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String, a Vector, a Map or a range.",
+				exec_ctx
+			))
+
+		return RTResult().success(Integer(
+			len(iterable.elements if isinstance(iterable, List) else iterable.value)
+		))
+	execute_length.positional_arg_names = ["iterable"] # type: ignore
+	execute_length.optional_arg_names = {} # type: ignore
+
+	def numbers_argument(self, exec_ctx, arg_name, allow_complex=True):
+		iterable = exec_ctx.symbol_table.get(arg_name)
+		number_types = (Integer, Boolean, Decimal, Rational, Complex) if allow_complex else (Integer, Boolean, Decimal, Rational)
+		message = f"Argument {arg_name} must be a Vector or a List, a range or a generator of {'numbers' if allow_complex else 'real numbers'}."
+
+		if isinstance(iterable, Vector):
+			if not allow_complex and iterable.value.dtype.kind == 'c':
+				return None, RTError(
+					self.pos_start, self.pos_end,
+					f"Argument {arg_name} must not contain complex numbers.",
+					exec_ctx
+				)
+			return iterable, None
+		if isinstance(iterable, Range):
+			return iterable, None
+		if isinstance(iterable, Generator):
+			# Generated elements can only be checked as they are produced
+			def checked():
+				for element in iterable.iterator:
+					if not isinstance(element, number_types):
+						raise IterationError(RTError(self.pos_start, self.pos_end, message, exec_ctx))
+					yield element
+			return checked(), None
+		if not isinstance(iterable, List) or not all(isinstance(element, number_types) for element in iterable.elements):
+			return None, RTError(
+				self.pos_start, self.pos_end,
+				message,
+				exec_ctx
+			)
+		return iterable.elements, None
+
+	def execute_sum(self, exec_ctx):
+		numbers, error = self.numbers_argument(exec_ctx, 'iterable')
+		if error: return RTResult().failure(error)
+
+		if isinstance(numbers, Vector):
+			if numbers.value.dtype == object:
+				return RTResult().success(sum_numbers([Vector.box(item) for item in numbers.value]))
+			if numbers.value.dtype.kind in 'iub' and Vector.magnitude(numbers.value) * len(numbers.value) >= 2**63:
+				# The int64 sum could wrap around
+				return RTResult().success(Integer(sum(numbers.value.tolist())))
+			return RTResult().success(Vector.box(np.sum(numbers.value)))
+		if isinstance(numbers, Range):
+			if numbers.integers is not None:
+				# Arithmetic series, so summing a range takes constant time
+				integers = numbers.integers
+				return RTResult().success(Integer((integers[0] + integers[-1]) * numbers.count // 2 if numbers.count else 0))
+			numbers = numbers.iterate()
+		return RTResult().success(sum_numbers(numbers))
+	execute_sum.positional_arg_names = ["iterable"] # type: ignore
+	execute_sum.optional_arg_names = {} # type: ignore
+
+	def execute_prod(self, exec_ctx):
+		numbers, error = self.numbers_argument(exec_ctx, 'iterable')
+		if error: return RTResult().failure(error)
+
+		if isinstance(numbers, Vector):
+			if numbers.value.dtype == object:
+				return RTResult().success(multiply_numbers([Vector.box(item) for item in numbers.value]))
+			if numbers.value.dtype.kind in 'iub':
+				# Products of integers overflow int64 quickly, so they are taken on Python ints
+				return RTResult().success(Integer(math.prod(numbers.value.tolist())))
+			return RTResult().success(Vector.box(np.prod(numbers.value)))
+		if isinstance(numbers, Range):
+			numbers = numbers.iterate()
+		return RTResult().success(multiply_numbers(numbers))
+	execute_prod.positional_arg_names = ["iterable"] # type: ignore
+	execute_prod.optional_arg_names = {} # type: ignore
+
+	def extreme(self, exec_ctx, function):
+		numbers, error = self.numbers_argument(exec_ctx, 'iterable', allow_complex=False)
+		if error: return RTResult().failure(error)
+
+		try:
+			if isinstance(numbers, Vector):
+				return RTResult().success(Vector.box(function(numbers.value) if numbers.value.dtype == object else (np.min if function is min else np.max)(numbers.value)))
+			if isinstance(numbers, Range):
+				if numbers.integers is not None:
+					if numbers.count == 0: raise ValueError
+					integers = numbers.integers
+					return RTResult().success(Integer(function(integers[0], integers[-1])))
+				numbers = numbers.iterate()
+			# min and max consume iterators one element at a time
+			return RTResult().success(function(numbers, key=lambda number: number.value))
+		except (ValueError, IndexError):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must not be empty.",
+				exec_ctx
+			))
+
+	def execute_min(self, exec_ctx):
+		return self.extreme(exec_ctx, min)
+	execute_min.positional_arg_names = ["iterable"] # type: ignore
+	execute_min.optional_arg_names = {} # type: ignore
+
+	def execute_max(self, exec_ctx):
+		return self.extreme(exec_ctx, max)
+	execute_max.positional_arg_names = ["iterable"] # type: ignore
+	execute_max.optional_arg_names = {} # type: ignore
+
+	def execute_mean(self, exec_ctx):
+		numbers, error = self.numbers_argument(exec_ctx, 'iterable')
+		if error: return RTResult().failure(error)
+
+		if isinstance(numbers, Vector):
+			if len(numbers.value) == 0: numbers = []
+			elif numbers.value.dtype == object:
+				return RTResult().success(Matrix.box(mp.fsum(numbers.value) / len(numbers.value)))
+			else:
+				return RTResult().success(Vector.box(np.mean(numbers.value)))
+		elif isinstance(numbers, Range):
+			if numbers.integers is not None and numbers.count > 0:
+				return RTResult().success(divide_integers(numbers.integers[0] + numbers.integers[-1], 2))
+			numbers = numbers.iterate()
+
+		count = 0
+		def counted():
+			nonlocal count
+			for number in numbers:
+				count += 1
+				yield number
+		total = sum_numbers(counted())
+
+		if count == 0:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must not be empty.",
+				exec_ctx
+			))
+		if isinstance(total, Integer):
+			return RTResult().success(divide_integers(total.value, count))
+		return RTResult().success(make_number(total.value / count))
+	execute_mean.positional_arg_names = ["iterable"] # type: ignore
+	execute_mean.optional_arg_names = {} # type: ignore
+
+	def execute_range(self, exec_ctx):
+		start = exec_ctx.symbol_table.get('start')
+		stop = exec_ctx.symbol_table.get('stop')
+		increment = exec_ctx.symbol_table.get('increment')
+
+		for arg_name, arg in (('start', start), ('stop', stop), ('increment', increment)):
+			if not isinstance(arg, (Integer, Boolean, Decimal, Rational)):
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					f"Argument {arg_name} must be a real number.",
+					exec_ctx
+				))
+		if increment.value == 0:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Cannot iterate over sequence with step of zero.",
+				exec_ctx
+			))
+
+		return RTResult().success(Range(start.value, stop.value, increment.value))
+	execute_range.positional_arg_names = ["start", "stop"] # type: ignore
+	execute_range.optional_arg_names = {"increment": Integer(1)} # type: ignore
+
+	def function_and_elements(self, exec_ctx):
+		function = exec_ctx.symbol_table.get('function')
+		iterable = exec_ctx.symbol_table.get('iterable')
+		elements = iterate(iterable)
+
+		if not isinstance(function, BaseFunction):
+			return None, None, False, RTError(
+				self.pos_start, self.pos_end,
+				"Argument function must be a function.",
+				exec_ctx
+			)
+		if elements is None:
+			return None, None, False, RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String, a Vector, a Map, a range or a generator.",
+				exec_ctx
+			)
+		return function, elements, isinstance(iterable, (Range, Generator)), None
+
+	@staticmethod
+	def call_each(function, elements):
+		for element in elements:
+			res = function.execute(([element], {}))
+			if res.error: raise IterationError(res.error)
+			yield element, res.value
+
+	def execute_map(self, exec_ctx):
+		function, elements, lazy, error = self.function_and_elements(exec_ctx)
+		if error: return RTResult().failure(error)
+
+		results = (result for _, result in self.call_each(function, elements))
+		# Lazy inputs give lazy results, so pipelines never build the intermediate lists
+		return RTResult().success(Generator('map', results) if lazy else List(list(results)))
+	execute_map.positional_arg_names = ["function", "iterable"] # type: ignore
+	execute_map.optional_arg_names = {} # type: ignore
+
+	def execute_filter(self, exec_ctx):
+		function, elements, lazy, error = self.function_and_elements(exec_ctx)
+		if error: return RTResult().failure(error)
+
+		results = (element for element, keep in self.call_each(function, elements) if keep.is_true())
+		return RTResult().success(Generator('filter', results) if lazy else List(list(results)))
+	execute_filter.positional_arg_names = ["function", "iterable"] # type: ignore
+	execute_filter.optional_arg_names = {} # type: ignore
+
+	def execute_reduce(self, exec_ctx):
+		res = RTResult()
+		function, elements, _, error = self.function_and_elements(exec_ctx)
+		if error: return res.failure(error)
+		accumulator = exec_ctx.symbol_table.get('initial')
+
+		if isinstance(accumulator, NullType):
+			accumulator = next(elements, NO_ELEMENT)
+			if accumulator is NO_ELEMENT:
+				return res.failure(RTError(
+					self.pos_start, self.pos_end,
+					"Cannot reduce an empty iterable without an initial value.",
+					exec_ctx
+				))
+
+		for element in elements:
+			accumulator = res.register(function.execute(([accumulator, element], {})))
+			if res.should_return(): return res
+
+		return res.success(accumulator)
+	execute_reduce.positional_arg_names = ["function", "iterable"] # type: ignore
+	execute_reduce.optional_arg_names = {"initial": NullType()} # type: ignore
+
+	def execute_zip(self, exec_ctx):
+		first = exec_ctx.symbol_table.get('first')
+		second = exec_ctx.symbol_table.get('second')
+
+		for arg_name, arg in (('first', first), ('second', second)):
+			if iterate(arg) is None:
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					f"Argument {arg_name} must be a List, a String, a Vector, a Map, a range or a generator.",
+					exec_ctx
+				))
+
+		pairs = (List([a, b]) for a, b in zip(iterate(first), iterate(second)))
+		lazy = isinstance(first, (Range, Generator)) or isinstance(second, (Range, Generator))
+		return RTResult().success(Generator('zip', pairs) if lazy else List(list(pairs)))
+	execute_zip.positional_arg_names = ["first", "second"] # type: ignore
+	execute_zip.optional_arg_names = {} # type: ignore
+
+	def execute_enumerate(self, exec_ctx):
+		iterable = exec_ctx.symbol_table.get('iterable')
+		elements = iterate(iterable)
+		start = exec_ctx.symbol_table.get('start')
+
+		if elements is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String, a Vector, a Map, a range or a generator.",
+				exec_ctx
+			))
+		if not isinstance(start, Integer):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument start must be an Integer.",
+				exec_ctx
+			))
+
+		pairs = (List([Integer(i), element]) for i, element in enumerate(elements, start.value))
+		return RTResult().success(Generator('enumerate', pairs) if isinstance(iterable, (Range, Generator)) else List(list(pairs)))
+	execute_enumerate.positional_arg_names = ["iterable"] # type: ignore
+	execute_enumerate.optional_arg_names = {"start": Integer(0)} # type: ignore
+
+	def sort_elements(self, exec_ctx, elements):
+		res = RTResult()
+		function = exec_ctx.symbol_table.get('key')
+		reverse = exec_ctx.symbol_table.get('reverse')
+
+		if not isinstance(function, (BaseFunction, NullType)):
+			return res.failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument key must be a function.",
+				exec_ctx
+			))
+
+		keys = []
+		for element in elements:
+			if isinstance(function, NullType):
+				keys.append(sort_key(element))
+			else:
+				keys.append(sort_key(res.register(function.execute(([element], {})))))
+				if res.should_return(): return res
+
+		if None in keys or len({key[0] for key in keys}) > 1:
+			return res.failure(RTError(
+				self.pos_start, self.pos_end,
+				"Only real numbers or only Strings can be sorted.",
+				exec_ctx
+			))
+
+		# Timsort is stable, so elements with equal keys keep their order
+		order = sorted(range(len(elements)), key=lambda i: keys[i][1], reverse=reverse.is_true())
+		return res.success([elements[i] for i in order])
+
+	def mutable_list_argument(self, exec_ctx):
+		list_ = exec_ctx.symbol_table.get('list')
+
+		if isinstance(list_, PersistentList):
+			return None, RTError(
+				self.pos_start, self.pos_end,
+				"Persistent lists can't be changed in place, use conj, assoc or the + and - operators instead.",
+				exec_ctx
+			)
+		if not isinstance(list_, List):
+			return None, RTError(
+				self.pos_start, self.pos_end,
+				"Argument list must be a List.",
+				exec_ctx
+			)
+
+		detach_slice_views(list_.elements)
+		return list_, None
+
+	def execute_append(self, exec_ctx):
+		list_ = exec_ctx.symbol_table.get('list')
+
+		if isinstance(list_, StringBuilder):
+			value = exec_ctx.symbol_table.get('value')
+			if not isinstance(value, String):
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					"Only Strings can be appended to a string builder.",
+					exec_ctx
+				))
+			list_.append(value.value)
+			return RTResult().success(NullType())
+
+		list_, error = self.mutable_list_argument(exec_ctx)
+		if error: return RTResult().failure(error)
+
+		list_.elements.append(exec_ctx.symbol_table.get('value'))
+		return RTResult().success(NullType())
+	execute_append.positional_arg_names = ["list", "value"] # type: ignore
+	execute_append.optional_arg_names = {} # type: ignore
+	execute_append.mutates = "list" # type: ignore
+
+	def execute_extend(self, exec_ctx):
+		list_, error = self.mutable_list_argument(exec_ctx)
+		if error: return RTResult().failure(error)
+		elements = iterable_elements(exec_ctx.symbol_table.get('iterable'))
+
+		if elements is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String or a Vector.",
+				exec_ctx
+			))
+
+		list_.elements.extend(elements)
+		return RTResult().success(NullType())
+	execute_extend.positional_arg_names = ["list", "iterable"] # type: ignore
+	execute_extend.optional_arg_names = {} # type: ignore
+	execute_extend.mutates = "list" # type: ignore
+
+	def execute_set_at(self, exec_ctx):
+		list_, error = self.mutable_list_argument(exec_ctx)
+		if error: return RTResult().failure(error)
+		index = exec_ctx.symbol_table.get('index')
+
+		if not isinstance(index, Integer):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument index must be an Integer.",
+				exec_ctx
+			))
+
+		try:
+			list_.elements[index.value] = exec_ctx.symbol_table.get('value')
+		except IndexError:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				'Element at this index could not be set because index is out of bounds',
+				exec_ctx
+			))
+		return RTResult().success(NullType())
+	execute_set_at.positional_arg_names = ["list", "index", "value"] # type: ignore
+	execute_set_at.optional_arg_names = {} # type: ignore
+	execute_set_at.mutates = "list" # type: ignore
+
+	def execute_insert(self, exec_ctx):
+		list_, error = self.mutable_list_argument(exec_ctx)
+		if error: return RTResult().failure(error)
+		index = exec_ctx.symbol_table.get('index')
+
+		if not isinstance(index, Integer):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument index must be an Integer.",
+				exec_ctx
+			))
+
+		list_.elements.insert(index.value, exec_ctx.symbol_table.get('value'))
+		return RTResult().success(NullType())
+	execute_insert.positional_arg_names = ["list", "index", "value"] # type: ignore
+	execute_insert.optional_arg_names = {} # type: ignore
+	execute_insert.mutates = "list" # type: ignore
+
+	def execute_pop(self, exec_ctx):
+		list_, error = self.mutable_list_argument(exec_ctx)
+		if error: return RTResult().failure(error)
+		index = exec_ctx.symbol_table.get('index')
+
+		if not isinstance(index, Integer):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument index must be an Integer.",
+				exec_ctx
+			))
+
+		try:
+			return RTResult().success(list_.elements.pop(index.value))
+		except IndexError:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				'Element at this index could not be removed from list because index is out of bounds',
+				exec_ctx
+			))
+	execute_pop.positional_arg_names = ["list"] # type: ignore
+	execute_pop.optional_arg_names = {"index": Integer(-1)} # type: ignore
+	execute_pop.mutates = "list" # type: ignore
+
+	def execute_copy(self, exec_ctx):
+		value = exec_ctx.symbol_table.get('value')
+
+		if isinstance(value, PersistentList):
+			return RTResult().success(value)
+		if isinstance(value, List):
+			return RTResult().success(List(value.elements[:]))
+		if isinstance(value, Vector):
+			return RTResult().success(Vector(value.value.copy()))
+		if isinstance(value, StringBuilder):
+			return RTResult().success(StringBuilder(value.value))
+		return RTResult().success(value.copy())
+	execute_copy.positional_arg_names = ["value"] # type: ignore
+	execute_copy.optional_arg_names = {} # type: ignore
+
+	def execute_persistent(self, exec_ctx):
+		elements = iterable_elements(exec_ctx.symbol_table.get('iterable'))
+
+		if elements is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String or a Vector.",
+				exec_ctx
+			))
+
+		return RTResult().success(PersistentList(elements))
+	execute_persistent.positional_arg_names = ["iterable"] # type: ignore
+	execute_persistent.optional_arg_names = {} # type: ignore
+
+	def persistent_list_argument(self, exec_ctx):
+		list_ = exec_ctx.symbol_table.get('list')
+
+		if not isinstance(list_, PersistentList):
+			return None, RTError(
+				self.pos_start, self.pos_end,
+				"Argument list must be a persistent List.",
+				exec_ctx
+			)
+		return list_, None
+
+	def execute_conj(self, exec_ctx):
+		list_, error = self.persistent_list_argument(exec_ctx)
+		if error: return RTResult().failure(error)
+
+		return RTResult().success(PersistentList(list_.elements.conj(exec_ctx.symbol_table.get('value'))))
+	execute_conj.positional_arg_names = ["list", "value"] # type: ignore
+	execute_conj.optional_arg_names = {} # type: ignore
+
+	def execute_assoc(self, exec_ctx):
+		list_, error = self.persistent_list_argument(exec_ctx)
+		if error: return RTResult().failure(error)
+		index = exec_ctx.symbol_table.get('index')
+
+		if not isinstance(index, Integer):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument index must be an Integer.",
+				exec_ctx
+			))
+
+		try:
+			return RTResult().success(PersistentList(list_.elements.assoc(index.value, exec_ctx.symbol_table.get('value'))))
+		except IndexError:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				'Element at this index could not be set because index is out of bounds',
+				exec_ctx
+			))
+	execute_assoc.positional_arg_names = ["list", "index", "value"] # type: ignore
+	execute_assoc.optional_arg_names = {} # type: ignore
+
+	def execute_sort(self, exec_ctx):
+		res = RTResult()
+		list_, error = self.mutable_list_argument(exec_ctx)
+		if error: return res.failure(error)
+
+		elements = res.register(self.sort_elements(exec_ctx, list_.elements))
+		if res.should_return(): return res
+
+		list_.elements[:] = elements
+		return res.success(NullType())
+	execute_sort.positional_arg_names = ["list"] # type: ignore
+	execute_sort.optional_arg_names = {"key": NullType(), "reverse": Boolean(0)} # type: ignore
+	execute_sort.mutates = "list" # type: ignore
+
+	def execute_sorted(self, exec_ctx):
+		res = RTResult()
+		iterable = exec_ctx.symbol_table.get('iterable')
+
+		if isinstance(iterable, Vector) and isinstance(exec_ctx.symbol_table.get('key'), NullType) and iterable.value.dtype.kind != 'c':
+			result = np.sort(iterable.value)
+			return res.success(Vector(result[::-1] if exec_ctx.symbol_table.get('reverse').is_true() else result))
+
+		elements = iterable_elements(iterable)
+		if elements is None:
+			return res.failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String or a Vector.",
+				exec_ctx
+			))
+
+		elements = res.register(self.sort_elements(exec_ctx, elements))
+		if res.should_return(): return res
+
+		return res.success(List(elements))
+	execute_sorted.positional_arg_names = ["iterable"] # type: ignore
+	execute_sorted.optional_arg_names = {"key": NullType(), "reverse": Boolean(0)} # type: ignore
+
+	def execute_index_of(self, exec_ctx):
+		elements = iterable_elements(exec_ctx.symbol_table.get('iterable'))
+		value = exec_ctx.symbol_table.get('value')
+
+		if elements is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String or a Vector.",
+				exec_ctx
+			))
+
+		key = equality_key(value)
+		for i, element in enumerate(elements):
+			if (element is value) if key is None else (equality_key(element) == key):
+				return RTResult().success(Integer(i))
+
+		return RTResult().success(Integer(-1))
+	execute_index_of.positional_arg_names = ["iterable", "value"] # type: ignore
+	execute_index_of.optional_arg_names = {} # type: ignore
+
+	def execute_binary_search(self, exec_ctx):
+		list_ = exec_ctx.symbol_table.get('list')
+		value = exec_ctx.symbol_table.get('value')
+
+		if not isinstance(list_, List):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument list must be a sorted List.",
+				exec_ctx
+			))
+
+		key = sort_key(value)
+		if key is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument value must be a real number or a String.",
+				exec_ctx
+			))
+
+		try:
+			i = bisect.bisect_left(list_.elements, key, key=sort_key)
+		except TypeError:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Only Lists of real numbers or of Strings can be searched.",
+				exec_ctx
+			))
+
+		# Missing values give -(insertion index) - 1, so the result is negative only when the value isn't there
+		if i < len(list_.elements) and sort_key(list_.elements[i]) == key:
+			return RTResult().success(Integer(i))
+		return RTResult().success(Integer(-i - 1))
+	execute_binary_search.positional_arg_names = ["list", "value"] # type: ignore
+	execute_binary_search.optional_arg_names = {} # type: ignore
+
+	def execute_unique(self, exec_ctx):
+		elements = iterable_elements(exec_ctx.symbol_table.get('iterable'))
+
+		if elements is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String or a Vector.",
+				exec_ctx
+			))
+
+		seen = set()
+		results = []
+		for element in elements:
+			key = equality_key(element)
+			if key is None:
+				results.append(element)
+			elif key not in seen:
+				seen.add(key)
+				results.append(element)
+
+		return RTResult().success(List(results))
+	execute_unique.positional_arg_names = ["iterable"] # type: ignore
+	execute_unique.optional_arg_names = {} # type: ignore
+
+	def map_and_key(self, exec_ctx):
+		map_ = exec_ctx.symbol_table.get('map')
+		key = exec_ctx.symbol_table.get('key')
+
+		if not isinstance(map_, Map):
+			return None, None, RTError(
+				self.pos_start, self.pos_end,
+				"Argument map must be a Map.",
+				exec_ctx
+			)
+		if equality_key(key) is None:
+			return None, None, RTError(
+				self.pos_start, self.pos_end,
+				f"Values of type {key.__class__.__name__} cannot be used as map keys.",
+				exec_ctx
+			)
+		return map_, key, None
+
+	def execute_get(self, exec_ctx):
+		map_, key, error = self.map_and_key(exec_ctx)
+		if error: return RTResult().failure(error)
+
+		value = map_.get(key)
+		return RTResult().success(value if value is not None else exec_ctx.symbol_table.get('default'))
+	execute_get.positional_arg_names = ["map", "key"] # type: ignore
+	execute_get.optional_arg_names = {"default": NullType()} # type: ignore
+
+	def execute_set(self, exec_ctx):
+		map_, key, error = self.map_and_key(exec_ctx)
+		if error: return RTResult().failure(error)
+
+		map_.set(key, exec_ctx.symbol_table.get('value'))
+		return RTResult().success(NullType())
+	execute_set.positional_arg_names = ["map", "key", "value"] # type: ignore
+	execute_set.optional_arg_names = {} # type: ignore
+	execute_set.mutates = "map" # type: ignore
+
+	def execute_has(self, exec_ctx):
+		map_, key, error = self.map_and_key(exec_ctx)
+		if error: return RTResult().failure(error)
+
+		return RTResult().success(Boolean(equality_key(key) in map_.entries))
+	execute_has.positional_arg_names = ["map", "key"] # type: ignore
+	execute_has.optional_arg_names = {} # type: ignore
+
+	def execute_keys(self, exec_ctx):
+		map_ = exec_ctx.symbol_table.get('map')
+
+		if not isinstance(map_, Map):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument map must be a Map.",
+				exec_ctx
+			))
+
+		return RTResult().success(List([key for key, _ in map_.entries.values()]))
+	execute_keys.positional_arg_names = ["map"] # type: ignore
+	execute_keys.optional_arg_names = {} # type: ignore
+
+	def execute_values(self, exec_ctx):
+		map_ = exec_ctx.symbol_table.get('map')
+
+		if not isinstance(map_, Map):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument map must be a Map.",
+				exec_ctx
+			))
+
+		return RTResult().success(List([value for _, value in map_.entries.values()]))
+	execute_values.positional_arg_names = ["map"] # type: ignore
+	execute_values.optional_arg_names = {} # type: ignore
+
+	def execute_items(self, exec_ctx):
+		map_ = exec_ctx.symbol_table.get('map')
+
+		if not isinstance(map_, Map):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument map must be a Map.",
+				exec_ctx
+			))
+
+		return RTResult().success(List([List([key, value]) for key, value in map_.entries.values()]))
+	execute_items.positional_arg_names = ["map"] # type: ignore
+	execute_items.optional_arg_names = {} # type: ignore
+
+	def string_arguments(self, exec_ctx, *arg_names):
+		texts = []
+		for arg_name in arg_names:
+			value = exec_ctx.symbol_table.get(arg_name)
+			if not isinstance(value, String):
+				return None, RTError(
+					self.pos_start, self.pos_end,
+					f"Argument {arg_name} must be a String.",
+					exec_ctx
+				)
+			texts.append(value.value)
+		return texts, None
+
+	def execute_string_builder(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'initial')
+		if error: return RTResult().failure(error)
+
+		return RTResult().success(StringBuilder(texts[0]))
+	execute_string_builder.positional_arg_names = [] # type: ignore
+	execute_string_builder.optional_arg_names = {"initial": String('')} # type: ignore
+
+	def execute_to_string(self, exec_ctx):
+		return RTResult().success(String(str(exec_ctx.symbol_table.get('value'))))
+	execute_to_string.positional_arg_names = ["value"] # type: ignore
+	execute_to_string.optional_arg_names = {} # type: ignore
+
+	def execute_split(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'string')
+		if error: return RTResult().failure(error)
+		separator = exec_ctx.symbol_table.get('separator')
+
+		if isinstance(separator, NullType):
+			parts = texts[0].split()
+		elif isinstance(separator, String) and separator.value:
+			parts = texts[0].split(separator.value)
+		else:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument separator must be a non-empty String.",
+				exec_ctx
+			))
+
+		return RTResult().success(List([String(part) for part in parts]))
+	execute_split.positional_arg_names = ["string"] # type: ignore
+	execute_split.optional_arg_names = {"separator": NullType()} # type: ignore
+
+	def execute_join(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'separator')
+		if error: return RTResult().failure(error)
+
+		elements = iterate(exec_ctx.symbol_table.get('iterable'))
+		if elements is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument iterable must be a List, a String, a range or a generator.",
+				exec_ctx
+			))
+
+		parts = []
+		for element in elements:
+			if not isinstance(element, String):
+				return RTResult().failure(RTError(
+					self.pos_start, self.pos_end,
+					"Only Strings can be joined.",
+					exec_ctx
+				))
+			parts.append(element.value)
+
+		return RTResult().success(String(texts[0].join(parts)))
+	execute_join.positional_arg_names = ["iterable"] # type: ignore
+	execute_join.optional_arg_names = {"separator": String('')} # type: ignore
+
+	def execute_replace(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'string', 'old', 'new')
+		if error: return RTResult().failure(error)
+
+		text, old, new = texts
+		return RTResult().success(String(text.replace(old, new)))
+	execute_replace.positional_arg_names = ["string", "old", "new"] # type: ignore
+	execute_replace.optional_arg_names = {} # type: ignore
+
+	def execute_find(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'string', 'substring')
+		if error: return RTResult().failure(error)
+		start = exec_ctx.symbol_table.get('start')
+
+		if not isinstance(start, (Integer, Boolean)):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument start must be an Integer.",
+				exec_ctx
+			))
+
+		text, substring = texts
+		return RTResult().success(Integer(text.find(substring, int(start.value))))
+	execute_find.positional_arg_names = ["string", "substring"] # type: ignore
+	execute_find.optional_arg_names = {"start": Integer(0)} # type: ignore
+
+	def execute_upper(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'string')
+		if error: return RTResult().failure(error)
+
+		return RTResult().success(String(texts[0].upper()))
+	execute_upper.positional_arg_names = ["string"] # type: ignore
+	execute_upper.optional_arg_names = {} # type: ignore
+
+	def execute_lower(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'string')
+		if error: return RTResult().failure(error)
+
+		return RTResult().success(String(texts[0].lower()))
+	execute_lower.positional_arg_names = ["string"] # type: ignore
+	execute_lower.optional_arg_names = {} # type: ignore
+
+	def execute_strip(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'string')
+		if error: return RTResult().failure(error)
+		characters = exec_ctx.symbol_table.get('characters')
+
+		if not isinstance(characters, (String, NullType)):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument characters must be a String.",
+				exec_ctx
+			))
+
+		return RTResult().success(String(texts[0].strip(None if isinstance(characters, NullType) else characters.value)))
+	execute_strip.positional_arg_names = ["string"] # type: ignore
+	execute_strip.optional_arg_names = {"characters": NullType()} # type: ignore
+
+	def execute_format(self, exec_ctx):
+		texts, error = self.string_arguments(exec_ctx, 'template')
+		if error: return RTResult().failure(error)
+		values = exec_ctx.symbol_table.get('values')
+
+		args, kwargs = [], {}
+		if isinstance(values, Map):
+			for key, value in values.entries.values():
+				if not isinstance(key, String):
+					return RTResult().failure(RTError(
+						self.pos_start, self.pos_end,
+						"The keys of argument values must be Strings.",
+						exec_ctx
+					))
+				kwargs[key.value] = value
+		elif isinstance(values, List):
+			args = list(values.elements)
+		elif not isinstance(values, NullType):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument values must be a List or a Map.",
+				exec_ctx
+			))
+
+		try:
+			return RTResult().success(String(ValueFormatter().vformat(texts[0], args, kwargs)))
+		except (KeyError, IndexError, ValueError, TypeError) as e:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Template could not be formatted: {e}",
+				exec_ctx
+			))
+	execute_format.positional_arg_names = ["template"] # type: ignore
+	execute_format.optional_arg_names = {"values": NullType()} # type: ignore
+
+	def execute_vector(self, exec_ctx):
+		elements = exec_ctx.symbol_table.get('elements')
+		dtype = exec_ctx.symbol_table.get('dtype')
+
+		if np is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Vectors require NumPy, which is not installed.",
+				exec_ctx
+			))
+
+		if not isinstance(dtype, NullType) and (not isinstance(dtype, String) or dtype.value not in ('bool', 'int', 'float', 'complex', 'object')):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument dtype must be 'bool', 'int', 'float', 'complex' or 'object'.",
+				exec_ctx
+			))
+		dtype = None if isinstance(dtype, NullType) else dtype.value
+
+		if isinstance(elements, Vector):
+			values = [Vector.box(item) for item in elements.value]
+		elif isinstance(elements, (List, Range, Generator)):
+			values = iterable_elements(elements)
+		else:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument elements must be a List, a Vector, a range or a generator.",
+				exec_ctx
+			))
+
+		try:
+			return RTResult().success(Vector.from_values(values, dtype))
+		except (TypeError, OverflowError) as e:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Vector elements must be numbers that fit the requested dtype ({e}).",
+				exec_ctx
+			))
+	execute_vector.positional_arg_names = ["elements"] # type: ignore
+	execute_vector.optional_arg_names = {"dtype": NullType()} # type: ignore
+
+	def execute_to_list(self, exec_ctx):
+		value = exec_ctx.symbol_table.get('value')
+
+		if isinstance(value, Matrix):
+			return RTResult().success(List([List([Matrix.box(item) for item in row]) for row in value.rows()]))
+		if isinstance(value, PersistentList):
+			return RTResult().success(List(list(value.elements)))
+		if isinstance(value, (Range, Generator)):
+			return RTResult().success(List(iterable_elements(value)))
+		if not isinstance(value, Vector):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument value must be a Vector, a Matrix, a persistent List, a range or a generator.",
+				exec_ctx
+			))
+
+		return RTResult().success(List([Vector.box(item) for item in value.value]))
+	execute_to_list.positional_arg_names = ["value"] # type: ignore
+	execute_to_list.optional_arg_names = {} # type: ignore
+
+	def matrix_argument_error(self, exec_ctx, arg_name, square=False):
+		matrix = exec_ctx.symbol_table.get(arg_name)
+
+		if not isinstance(matrix, Matrix):
+			return RTError(
+				self.pos_start, self.pos_end,
+				f"Argument {arg_name} must be a Matrix.",
+				exec_ctx
+			)
+		if square and not matrix.is_square:
+			return RTError(
+				self.pos_start, self.pos_end,
+				f"Argument {arg_name} must be a square Matrix, not a matrix of shape {matrix.shape}.",
+				exec_ctx
+			)
+		return None
+
+	def execute_matrix(self, exec_ctx):
+		rows = exec_ctx.symbol_table.get('rows')
+
+		if numeric_mode == 'fast' and np is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Matrices require NumPy in 'fast' numeric mode, which is not installed.",
+				exec_ctx
+			))
+
+		if not isinstance(rows, List) or len(rows.elements) == 0 or not all(isinstance(row, (List, Vector)) for row in rows.elements):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument rows must be a non-empty List of Lists or Vectors.",
+				exec_ctx
+			))
+
+		rows = [row.elements if isinstance(row, List) else [Vector.box(item) for item in row.value] for row in rows.elements]
+		if len(rows[0]) == 0 or any(len(row) != len(rows[0]) for row in rows):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Every row of a Matrix must have the same non-zero length.",
+				exec_ctx
+			))
+
+		try:
+			return RTResult().success(Matrix.from_rows(rows))
+		except (TypeError, OverflowError) as e:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Matrix elements must be numbers ({e}).",
+				exec_ctx
+			))
+	execute_matrix.positional_arg_names = ["rows"] # type: ignore
+	execute_matrix.optional_arg_names = {} # type: ignore
+
+	def execute_identity(self, exec_ctx):
+		size = exec_ctx.symbol_table.get('size')
+
+		if not isinstance(size, Integer) or size.value <= 0:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument size must be a positive Integer.",
+				exec_ctx
+			))
+		if numeric_mode == 'fast' and np is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Matrices require NumPy in 'fast' numeric mode, which is not installed.",
+				exec_ctx
+			))
+
+		return RTResult().success(Matrix.identity(size.value))
+	execute_identity.positional_arg_names = ["size"] # type: ignore
+	execute_identity.optional_arg_names = {} # type: ignore
+
+	def execute_transpose(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix')
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+
+		return RTResult().success(Matrix(matrix.value.T))
+	execute_transpose.positional_arg_names = ["matrix"] # type: ignore
+	execute_transpose.optional_arg_names = {} # type: ignore
+
+	def execute_inverse(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix', square=True)
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+
+		try:
+			return RTResult().success(Matrix(mp.inverse(matrix.value) if matrix.precise else np.linalg.inv(matrix.value)))
+		except (ValueError, ZeroDivisionError):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument matrix is singular, so it has no inverse.",
+				exec_ctx
+			))
+	execute_inverse.positional_arg_names = ["matrix"] # type: ignore
+	execute_inverse.optional_arg_names = {} # type: ignore
+
+	def execute_det(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix', square=True)
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+
+		return RTResult().success(Matrix.box(mp.det(matrix.value) if matrix.precise else np.linalg.det(matrix.value)))
+	execute_det.positional_arg_names = ["matrix"] # type: ignore
+	execute_det.optional_arg_names = {} # type: ignore
+
+	def execute_solve(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix', square=True)
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+		b = exec_ctx.symbol_table.get('b')
+
+		if isinstance(b, Matrix):
+			columns = b.value
+		elif isinstance(b, Vector):
+			columns = b.value
+		elif isinstance(b, List) and all(isinstance(element, (Integer, Boolean, Decimal, Rational, Complex)) for element in b.elements):
+			columns = [Vector.unbox(element, matrix.precise) for element in b.elements]
+		else:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument b must be a Matrix, a Vector or a List of numbers.",
+				exec_ctx
+			))
+
+		size = b.shape[0] if isinstance(b, Matrix) else len(columns)
+		if size != matrix.shape[0]:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Argument b must have {matrix.shape[0]} rows to be solved against a matrix of shape {matrix.shape}.",
+				exec_ctx
+			))
+
+		try:
+			if not matrix.precise:
+				solution = np.linalg.solve(matrix.value, np.asarray(columns))
+			elif isinstance(b, Matrix):
+				# mpmath solves one right-hand side at a time
+				solution = mp.matrix([mp.lu_solve(matrix.value, b.value.column(j)).T.tolist()[0] for j in range(b.shape[1])]).T
+			else:
+				solution = [item for row in mp.lu_solve(matrix.value, mp.matrix(list(columns))).tolist() for item in row]
+		except (ValueError, ZeroDivisionError):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument matrix is singular, so the system has no unique solution.",
+				exec_ctx
+			))
+
+		if isinstance(b, Matrix):
+			return RTResult().success(Matrix(solution))
+		if isinstance(b, Vector):
+			return RTResult().success(Vector(np.asarray(solution, dtype=object if matrix.precise else None)))
+		return RTResult().success(List([Matrix.box(item) for item in solution]))
+	execute_solve.positional_arg_names = ["matrix", "b"] # type: ignore
+	execute_solve.optional_arg_names = {} # type: ignore
+
+	def execute_eigenvalues(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix', square=True)
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+
+		if matrix.precise:
+			eigenvalues = mp.eig(matrix.value, left=False, right=False)
+		else:
+			eigenvalues = np.real_if_close(np.linalg.eigvals(matrix.value))
+
+		return RTResult().success(List([Matrix.box(item) for item in eigenvalues]))
+	execute_eigenvalues.positional_arg_names = ["matrix"] # type: ignore
+	execute_eigenvalues.optional_arg_names = {} # type: ignore
+
+	def execute_qr(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix')
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+
+		if matrix.shape[0] < matrix.shape[1]:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				f"Argument matrix must have at least as many rows as columns, not shape {matrix.shape}.",
+				exec_ctx
+			))
+
+		q, r = mp.qr(matrix.value) if matrix.precise else np.linalg.qr(matrix.value)
+		return RTResult().success(List([Matrix(q), Matrix(r)]))
+	execute_qr.positional_arg_names = ["matrix"] # type: ignore
+	execute_qr.optional_arg_names = {} # type: ignore
+
+	def execute_cholesky(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix', square=True)
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+
+		try:
+			return RTResult().success(Matrix(mp.cholesky(matrix.value) if matrix.precise else np.linalg.cholesky(matrix.value)))
+		except (ValueError, ZeroDivisionError):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument matrix must be symmetric and positive-definite.",
+				exec_ctx
+			))
+	execute_cholesky.positional_arg_names = ["matrix"] # type: ignore
+	execute_cholesky.optional_arg_names = {} # type: ignore
+
+	def execute_svd(self, exec_ctx):
+		error = self.matrix_argument_error(exec_ctx, 'matrix')
+		if error: return RTResult().failure(error)
+		matrix = exec_ctx.symbol_table.get('matrix')
+
+		if matrix.precise:
+			u, s, v = mp.svd(matrix.value)
+		else:
+			u, s, v = np.linalg.svd(matrix.value, full_matrices=False)
+
+		# matrix = u * diag(s) * v
+		return RTResult().success(List([Matrix(u), List([Matrix.box(item) for item in s]), Matrix(v)]))
+	execute_svd.positional_arg_names = ["matrix"] # type: ignore
+	execute_svd.optional_arg_names = {} # type: ignore
+
+	def execute_memo(self, exec_ctx):
+		function = exec_ctx.symbol_table.get('function')
+		size = exec_ctx.symbol_table.get('size')
+
+		if not isinstance(function, Function):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument function must be a user-defined Function.",
+				exec_ctx
+			))
+
+		if not isinstance(size, (Integer, NullType)) or (isinstance(size, Integer) and size.value <= 0):
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument size must be a positive Integer or null (unbounded).",
+				exec_ctx
+			))
+
+		memoized = function.copy()
+		memoized.memo_cache = MemoCache(size.value if isinstance(size, Integer) else None)
+		return RTResult().success(memoized)
+	execute_memo.positional_arg_names = ["function"] # type: ignore
+	execute_memo.optional_arg_names = {"size": Integer(128)} # type: ignore
+
+	def execute_memo_info(self, exec_ctx):
+		function = exec_ctx.symbol_table.get('function')
+
+		if not isinstance(function, Function) or function.memo_cache is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument function must be a memoized Function.",
+				exec_ctx
+			))
+
+		cache = function.memo_cache
+		return RTResult().success(List([
+			Integer(cache.hits),
+			Integer(cache.misses),
+			Integer(len(cache.entries)),
+			Integer(cache.max_size) if cache.max_size is not None else NullType('null')
+		]))
+	execute_memo_info.positional_arg_names = ["function"] # type: ignore
+	execute_memo_info.optional_arg_names = {} # type: ignore
+
+	def execute_memo_clear(self, exec_ctx):
+		function = exec_ctx.symbol_table.get('function')
+
+		if not isinstance(function, Function) or function.memo_cache is None:
+			return RTResult().failure(RTError(
+				self.pos_start, self.pos_end,
+				"Argument function must be a memoized Function.",
+				exec_ctx
+			))
+
+		function.memo_cache.clear()
+		return RTResult().success(NullType())
+	execute_memo_clear.positional_arg_names = ["function"] # type: ignore
+	execute_memo_clear.optional_arg_names = {} # type: ignore
 
-		_, error = run(filename, code)
+	def execute_persist(self, exec_ctx):
+		function = exec_ctx.symbol_table.get('function')
 
-		if error:
+		if not isinstance(function, Function):
 			return RTResult().failure(RTError(
 				self.pos_start, self.pos_end,
-				f'Failed to run "{filename}" because of the following exception:\n{error}',
+				"Argument function must be a user-defined Function.",
 				exec_ctx
 			))
-		
-		return RTResult().success(NullType())
-	execute_exec.positional_arg_names = ["code_or_filename"] # type: ignore
-	execute_exec.optional_arg_names = {} # type: ignore
 
-	def execute_length(self, exec_ctx):
-		iterable = exec_ctx.symbol_table.get('iterable')
+		persisted = function.copy()
+		persisted.persistent = True
+		persisted.persistent_source_hash = persisted.source_hash()
+		return RTResult().success(persisted)
+	execute_persist.positional_arg_names = ["function"] # type: ignore
+	execute_persist.optional_arg_names = {} # type: ignore
+
+	def execute_persist_clear(self, exec_ctx):
+		function = exec_ctx.symbol_table.get('function')
 
-		if not isinstance(iterable, (List, String)):
+		if not isinstance(function, Function) or not function.persistent:
 			return RTResult().failure(RTError(
 				self.pos_start, self.pos_end,
-				"Argument iterable must be a List or a String.",
+				"Argument function must be a persisted Function.",
 				exec_ctx
 			))
 
-		return RTResult().success(Integer(
-			len(iterable.elements if isinstance(iterable, List) else iterable.value)
-		))
-	execute_length.positional_arg_names = ["iterable"] # type: ignore
-	execute_length.optional_arg_names = {} # type: ignore
+		get_persistent_cache().clear(function.persistent_source_hash)
+		return RTResult().success(NullType())
+	execute_persist_clear.positional_arg_names = ["function"] # type: ignore
+	execute_persist_clear.optional_arg_names = {} # type: ignore
 
 ##########################################################
 # CONTEXT
@@ -2482,6 +5550,8 @@ class Context:
 		self.parent = parent
 		self.parent_entry_pos = parent_entry_pos
 		self.symbol_table = None
+		self.memoized_function = None
+		self.memoized_since = None
 
 ##########################################################
 # SYMBOL TABLE
@@ -2507,6 +5577,220 @@ class SymbolTable:
 	def __repr__(self):
 		return f'SymbolTable{self.symbols}'
 
+##########################################################
+# MEMOIZATION
+##########################################################
+
+class MemoCache:
+	def __init__(self, max_size=128):
+		self.max_size = max_size
+		self.entries = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def make_key(self, args):
+		pos_args, opt_args = args
+		keys = []
+
+		for arg_value in pos_args:
+			key = self.value_key(arg_value)
+			if key is None: return None
+			keys.append(key)
+
+		for arg_name in sorted(opt_args):
+			key = self.value_key(opt_args[arg_name])
+			if key is None: return None
+			keys.append((arg_name, key))
+
+		return (mp.prec, numeric_mode, tuple(keys))
+
+	@staticmethod
+	def value_key(value):
+		if isinstance(value, List):
+			keys = tuple(MemoCache.value_key(element) for element in value.elements)
+			return None if None in keys else (List, keys)
+
+		if not isinstance(value, (Integer, Decimal, Complex, Rational, Boolean, String, NullType)):
+			return None
+
+		return (value.__class__, value.hash_key())
+
+	@staticmethod
+	def detach(value):
+		# Lists, Maps and string builders can be changed in place, so the cache stores and hands out copies of them
+		if isinstance(value, PersistentList):
+			return value
+		if isinstance(value, List):
+			return List([MemoCache.detach(element) for element in value.elements])
+		if isinstance(value, Map):
+			return Map({hashed: (key, MemoCache.detach(entry)) for hashed, (key, entry) in value.entries.items()})
+		if isinstance(value, StringBuilder):
+			return StringBuilder(value.value)
+		return value
+
+	def get(self, key):
+		if key in self.entries:
+			self.entries.move_to_end(key)
+			self.hits += 1
+			return True, self.detach(self.entries[key])
+
+		self.misses += 1
+		return False, None
+
+	def put(self, key, value):
+		self.entries[key] = self.detach(value)
+		self.entries.move_to_end(key)
+
+		if self.max_size is not None and len(self.entries) > self.max_size:
+			self.entries.popitem(last=False)
+
+	def clear(self):
+		self.entries.clear()
+		self.hits = 0
+		self.misses = 0
+
+class PersistentCache:
+	def __init__(self, path, max_entries):
+		self.path = path
+		self.max_entries = max_entries
+		self.connection = sqlite3.connect(path)
+		self.connection.execute(
+			'CREATE TABLE IF NOT EXISTS results ('
+			'key TEXT PRIMARY KEY, source_hash TEXT NOT NULL, value TEXT NOT NULL, last_used REAL NOT NULL)'
+		)
+		self.connection.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+		self.connection.commit()
+		self.entry_count = self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+		# Hits only update last_used in memory, and are written out with the next commit so a hit costs no fsync
+		self.pending_touches = {}
+		atexit.register(self.flush)
+
+	@staticmethod
+	def make_key(source_hash, args):
+		pos_args, opt_args = args
+		encoded_args = []
+
+		for arg_value in pos_args:
+			encoded = PersistentCache.encode_value(arg_value)
+			if encoded is None: return None
+			encoded_args.append(encoded)
+
+		for arg_name in sorted(opt_args):
+			encoded = PersistentCache.encode_value(opt_args[arg_name])
+			if encoded is None: return None
+			encoded_args.append((arg_name, encoded))
+
+		return hashlib.sha256(repr((source_hash, mp.dps, numeric_mode, encoded_args)).encode()).hexdigest()
+
+	@staticmethod
+	def encode_value(value):
+		# Only numbers, strings, nulls and Lists and Maps of them are persisted, other results are always recomputed
+		if isinstance(value, Integer):
+			return ('Integer', value.value)
+		if isinstance(value, Decimal):
+			return ('Decimal', mpf(value.value)._mpf_)
+		if isinstance(value, Complex):
+			return ('Complex', mpc(value.value)._mpc_)
+		if isinstance(value, Rational):
+			return ('Rational', (value.value.numerator, value.value.denominator))
+		if isinstance(value, Boolean):
+			return ('Boolean', value.value)
+		if isinstance(value, String):
+			return ('String', value.value)
+		if isinstance(value, NullType):
+			return ('NullType', value._value)
+		if isinstance(value, List):
+			elements = [PersistentCache.encode_value(element) for element in value.elements]
+			return None if None in elements else ('List', elements)
+		if isinstance(value, Map):
+			entries = [(PersistentCache.encode_value(key), PersistentCache.encode_value(entry)) for key, entry in value.entries.values()]
+			return None if any(None in pair for pair in entries) else ('Map', entries)
+		return None
+
+	@staticmethod
+	def decode_value(encoded):
+		type_name, data = encoded
+
+		if type_name == 'Integer': return Integer(data)
+		if type_name == 'Decimal': return Decimal(mpf(data))
+		if type_name == 'Complex': return Complex(mpc(mpf(data[0]), mpf(data[1])))
+		if type_name == 'Rational': return Rational(Fraction(*data))
+		if type_name == 'Boolean': return Boolean(data)
+		if type_name == 'String': return String(data)
+		if type_name == 'NullType': return NullType(data)
+		if type_name == 'Map':
+			map_ = Map()
+			for key, entry in data:
+				map_.set(PersistentCache.decode_value(key), PersistentCache.decode_value(entry))
+			return map_
+		return List([PersistentCache.decode_value(element) for element in data])
+
+	def get(self, key):
+		row = self.connection.execute('SELECT value FROM results WHERE key = ?', (key, )).fetchone()
+		if row is None: return False, None
+
+		self.pending_touches[key] = time.time()
+		if len(self.pending_touches) >= 1024: self.flush()
+		return True, self.decode_value(ast.literal_eval(row[0]))
+
+	def write_touches(self):
+		if not self.pending_touches: return
+		self.connection.executemany(
+			'UPDATE results SET last_used = ? WHERE key = ?',
+			[(last_used, key) for key, last_used in self.pending_touches.items()]
+		)
+		self.pending_touches.clear()
+
+	def flush(self):
+		self.write_touches()
+		self.connection.commit()
+
+	def put(self, key, source_hash, value):
+		encoded = self.encode_value(value)
+		if encoded is None: return
+
+		self.write_touches()
+
+		# Replacing a row reports a rowcount of 1 like inserting one, so only a key that wasn't stored yet is counted
+		existed = self.connection.execute('SELECT 1 FROM results WHERE key = ?', (key, )).fetchone() is not None
+		self.connection.execute(
+			'INSERT OR REPLACE INTO results (key, source_hash, value, last_used) VALUES (?, ?, ?, ?)',
+			(key, source_hash, repr(encoded), time.time())
+		)
+		if not existed: self.entry_count += 1
+
+		if self.max_entries is not None and self.entry_count > self.max_entries:
+			# Recounted first, since other processes can share the cache file
+			self.entry_count = self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+		if self.max_entries is not None and self.entry_count > self.max_entries:
+			# Evict the least recently used tenth at once so eviction is not paid on every insert
+			evict_count = self.entry_count - self.max_entries + self.max_entries // 10
+			self.connection.execute(
+				'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)',
+				(evict_count, )
+			)
+			self.entry_count = self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+		self.connection.commit()
+
+	def clear(self, source_hash):
+		self.write_touches()
+		self.connection.execute('DELETE FROM results WHERE source_hash = ?', (source_hash, ))
+		self.connection.commit()
+		self.entry_count = self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+persistent_cache = None
+
+def get_persistent_cache():
+	global persistent_cache
+
+	if persistent_cache is None or persistent_cache.path != persistent_cache_file:
+		if persistent_cache is not None: persistent_cache.flush()
+		persistent_cache = PersistentCache(persistent_cache_file, persistent_cache_max_entries)
+	persistent_cache.max_entries = persistent_cache_max_entries
+
+	return persistent_cache
+
 ##########################################################
 # INTERPRETER
 ##########################################################
@@ -2520,39 +5804,70 @@ class Interpreter:
 	def no_visit_method(self, node, context):
 		raise Exception(f'No "visit_{type(node).__name__}" method defined')
 
+	def locate_error(self, error, node, context):
+		# Errors raised by interned operands have no position or context of their own
+		if error.pos_start is None or error.pos_end is None:
+			error.pos_start, error.pos_end = node.pos_start, node.pos_end
+		if error.context is None:
+			error.context = context
+		return error
+
 	######################################################
 
 	def visit_IntegerNode(self, node, context):
-		return RTResult().success(
-			Integer(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
-		)
+		return RTResult().success(node.value)
 
 	def visit_DecimalNode(self, node, context):
-		return RTResult().success(
-			Decimal(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
-		)
+		value_key = (mp.prec, numeric_mode)
+		if node.value_key != value_key:
+			node.value = Decimal(node.tok.value).intern()
+			node.value_key = value_key
+		return RTResult().success(node.value)
 
 	def visit_ComplexNode(self, node, context):
-		return RTResult().success(
-			Complex(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
-		)
+		value_key = (mp.prec, numeric_mode)
+		if node.value_key != value_key:
+			node.value = Complex(mpc(0, node.tok.value)).intern()
+			node.value_key = value_key
+		return RTResult().success(node.value)
 
 	def visit_ListNode(self, node, context):
 		res = RTResult()
 		elements = []
 
 		for element_node in node.element_nodes:
-			elements.append(res.register(self.visit(element_node, context)))
+			value = res.register(self.visit(element_node, context))
 			if res.should_return(): return res
+			if not node.should_return_null: elements.append(value)
 
+		if node.should_return_null: return res.success(None)
 		return res.success(
 			List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
 		)
 
-	def visit_StringNode(self, node, context):
-		return RTResult().success(
-			String(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
+	def visit_MapNode(self, node, context):
+		res = RTResult()
+		map_ = Map()
+
+		for key_node, value_node in node.pair_nodes:
+			key = res.register(self.visit(key_node, context))
+			if res.should_return(): return res
+			value = res.register(self.visit(value_node, context))
+			if res.should_return(): return res
+
+			if not map_.set(key, value):
+				return res.failure(RTError(
+					key_node.pos_start, key_node.pos_end,
+					f'Values of type {key.__class__.__name__} cannot be used as map keys',
+					context
+				))
+
+		return res.success(
+			map_.set_context(context).set_pos(node.pos_start, node.pos_end)
 		)
+
+	def visit_StringNode(self, node, context):
+		return RTResult().success(node.value)
 	
 	def visit_PassNode(self, node, context):
 		return RTResult().success(NullType())
@@ -2586,40 +5901,66 @@ class Interpreter:
 		res = RTResult()
 		left = res.register(self.visit(node.left_node, context))
 		if res.should_return(): return res
+
+		if (
+			node.op_tok.type == TT_KEYWORD and isinstance(left, (Integer, Decimal, Rational, Complex, Boolean))
+			and not isinstance(node.right_node, (IntegerNode, DecimalNode, ComplexNode, StringNode, VarAccessNode))
+		):
+			# A false left side decides 'and' and a true one decides 'or', so a right side that has to be computed
+			# isn't evaluated and the result is the left operand. Literals and variables cost nothing to read, so they
+			# still go through anded_by/ored_by and keep their result classes, like '0 and null' giving null
+			if left.is_true() == (node.op_tok.value == 'or'):
+				return res.success(left.copy().set_pos(node.pos_start, node.pos_end))
+
 		right = res.register(self.visit(node.right_node, context))
 		if res.should_return(): return res
 
-		if node.op_tok.type == TT_PLUS:
-			result, error = left.added_to(right)
-		elif node.op_tok.type == TT_MINUS:
-			result, error = left.subbed_by(right)
-		elif node.op_tok.type == TT_MUL:
-			result, error = left.multed_by(right)
-		elif node.op_tok.type == TT_DIV:
-			result, error = left.dived_by(right)
-		elif node.op_tok.type == TT_POW:
-			result, error = left.powed_by(right)
-		elif node.op_tok.type == TT_SUBSCRIPT:
-			result, error = left.subscred_by(right)
-		elif node.op_tok.type == TT_EE:
-			result, error = left.get_comparison_eq(right)
-		elif node.op_tok.type == TT_NE:
-			result, error = left.get_comparison_ne(right)
-		elif node.op_tok.type == TT_LT:
-			result, error = left.get_comparison_lt(right)
-		elif node.op_tok.type == TT_GT:
-			result, error = left.get_comparison_gt(right)
-		elif node.op_tok.type == TT_LTE:
-			result, error = left.get_comparison_lte(right)
-		elif node.op_tok.type == TT_GTE:
-			result, error = left.get_comparison_gte(right)
-		elif node.op_tok.matches(TT_KEYWORD, 'and'):
-			result, error = left.anded_by(right)
-		elif node.op_tok.matches(TT_KEYWORD, 'or'):
-			result, error = left.ored_by(right)
+		try:
+			if right.broadcasts and not left.broadcasts and node.op_tok.type != TT_SUBSCRIPT:
+				result, error = right.reflected_operation(node.op_tok, left)
+			elif node.op_tok.type == TT_PLUS:
+				result, error = left.added_to(right)
+			elif node.op_tok.type == TT_MINUS:
+				result, error = left.subbed_by(right)
+			elif node.op_tok.type == TT_MUL:
+				result, error = left.multed_by(right)
+			elif node.op_tok.type == TT_DIV:
+				result, error = left.dived_by(right)
+			elif node.op_tok.type == TT_POW:
+				result, error = left.powed_by(right)
+			elif node.op_tok.type == TT_SUBSCRIPT:
+				result, error = left.subscred_by(right)
+			elif node.op_tok.type == TT_EE:
+				result, error = left.get_comparison_eq(right)
+			elif node.op_tok.type == TT_NE:
+				result, error = left.get_comparison_ne(right)
+			elif node.op_tok.type == TT_LT:
+				result, error = left.get_comparison_lt(right)
+			elif node.op_tok.type == TT_GT:
+				result, error = left.get_comparison_gt(right)
+			elif node.op_tok.type == TT_LTE:
+				result, error = left.get_comparison_lte(right)
+			elif node.op_tok.type == TT_GTE:
+				result, error = left.get_comparison_gte(right)
+			elif node.op_tok.matches(TT_KEYWORD, 'and'):
+				result, error = left.anded_by(right)
+			elif node.op_tok.matches(TT_KEYWORD, 'or'):
+				result, error = left.ored_by(right)
+		except OverflowError:
+			return res.failure(RTError(
+				node.pos_start, node.pos_end,
+				f"Result is too large to be represented in '{numeric_mode}' numeric mode",
+				context
+			))
+		except ZeroDivisionError:
+			return res.failure(RTError(
+				node.right_node.pos_start, node.right_node.pos_end,
+				"Division by zero (cause undefined, it approach -inf when we're approaching 0 from the negative and it approach +inf when we're approaching 0 from the positive)",
+				context
+			))
 
 		if error:
-			return res.failure(error)
+			return res.failure(self.locate_error(error, node, context))
 		else:
 			return res.success(result.set_pos(node.pos_start, node.pos_end))
 
@@ -2642,7 +5983,7 @@ class Interpreter:
 			number, error = number.notted()
 
 		if error:
-			return res.failure(error)
+			return res.failure(self.locate_error(error, node, context))
 		else:
 			return res.success(number.set_pos(node.pos_start, node.pos_end))
 
@@ -2666,9 +6007,9 @@ class Interpreter:
 
 		return res.success(None)
 	
-	def visit_ForNode(self, node, context):
+	def for_range(self, node, context):
+		# The counters of a numeric for loop, and the function boxing one into a value
 		res = RTResult()
-		elements = []
 
 		start_value = res.register(self.visit(node.start_value_node, context))
 		if res.should_return(): return res
@@ -2682,24 +6023,90 @@ class Interpreter:
 		else:
 			step_value = Integer(1)
 
-		i = start_value.value
-
-		if step_value.value > 0:
-			condition = lambda: i < end_value.value
-		elif step_value.value == 0:
+		if step_value.value == 0:
 			return res.failure(RTError(
 				node.end_value_node.pos_end.copy().advance(), node.step_value_node.pos_end,
 				'Cannot iterate over sequence with step of zero.', context
 			))
+
+		if node.body_reads_counter is None:
+			node.body_reads_counter = may_read_variable(node.body_node, node.var_name_tok.value)
+
+		if all(isinstance(value, Integer) for value in (start_value, end_value, step_value)):
+			# The counter stays a native int and is only boxed when the body can see it
+			return res.success((range(start_value.value, end_value.value, step_value.value), Integer))
+
+		start, step = start_value.value, step_value.value
+		if step > 0:
+			count = max(0, int(mp.ceil((end_value.value - start) / step)))
 		else:
-			condition = lambda: i > end_value.value
-		
-		while condition():
-			if isinstance(step_value, Integer):
-				context.symbol_table.set(node.var_name_tok.value, Integer(i))
-			elif isinstance(step_value, Decimal):
-				context.symbol_table.set(node.var_name_tok.value, Decimal(i))
-			i += step_value.value
+			count = max(0, int(mp.ceil((start - end_value.value) / -step)))
+		# Every counter is computed from the start so the steps don't accumulate rounding errors
+		counters = (start + k * step for k in range(count))
+		return res.success((counters, make_number))
+
+	def visit_ForNode(self, node, context):
+		res = RTResult()
+		elements = []
+
+		counters, boxed = res.register(self.for_range(node, context)) or (None, None)
+		if res.should_return(): return res
+
+		var_name = node.var_name_tok.value
+		symbol_table = context.symbol_table
+
+		i = None
+		for i in counters:
+			if node.body_reads_counter: symbol_table.set(var_name, boxed(i))
+
+			value = res.register(self.visit(node.body_node, context))
+			if res.should_return() and res.loop_should_continue == False and res.loop_should_break == False: return res
+
+			if res.loop_should_continue:
+				continue
+
+			if res.loop_should_break:
+				break
+
+			if not node.should_return_null: elements.append(value or NullType())
+
+		if not node.body_reads_counter and i is not None:
+			symbol_table.set(var_name, boxed(i))
+
+		return res.success(
+			None if node.should_return_null else 
+			List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+		)
+
+	def for_in_iterator(self, node, context):
+		res = RTResult()
+
+		iterable = res.register(self.visit(node.iterable_node, context))
+		if res.should_return(): return res
+
+		iterator = iterate(iterable)
+		if iterator is None:
+			return res.failure(RTError(
+				node.iterable_node.pos_start, node.iterable_node.pos_end,
+				f'{type(iterable).__name__} is not iterable.', context
+			))
+		return res.success(iterator)
+
+	def visit_ForInNode(self, node, context):
+		res = RTResult()
+		elements = []
+
+		iterator = res.register(self.for_in_iterator(node, context))
+		if res.should_return(): return res
+
+		while True:
+			try:
+				element = next(iterator, NO_ELEMENT)
+			except IterationError as e:
+				return res.failure(e.error)
+			if element is NO_ELEMENT: break
+
+			context.symbol_table.set(node.var_name_tok.value, element)
 
 			value = res.register(self.visit(node.body_node, context))
 			if res.should_return() and res.loop_should_continue == False and res.loop_should_break == False: return res
@@ -2710,7 +6117,7 @@ class Interpreter:
 			if res.loop_should_break:
 				break
 
-			elements.append(value or NullType())
+			if not node.should_return_null: elements.append(value or NullType())
 
 		return res.success(
 			None if node.should_return_null else 
@@ -2736,13 +6143,42 @@ class Interpreter:
 			if res.loop_should_break:
 				break
 
-			elements.append(value or NullType())
+			if not node.should_return_null: elements.append(value or NullType())
 
 		return res.success(
 			None if node.should_return_null else 
 			List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
 		)
 
+	def precision_digits(self, node, context):
+		res = RTResult()
+
+		digits = res.register(self.visit(node.digits_node, context))
+		if res.should_return(): return res
+
+		if not isinstance(digits, Integer) or digits.value <= 0:
+			return res.failure(RTError(
+				node.digits_node.pos_start, node.digits_node.pos_end,
+				'Precision must be a positive Integer number of digits.', context
+			))
+		return res.success(digits.value)
+
+	def visit_PrecisionNode(self, node, context):
+		res = RTResult()
+
+		digits = res.register(self.precision_digits(node, context))
+		if res.should_return(): return res
+
+		if node.body_node is None:
+			mp.dps = digits
+			return res.success(None)
+
+		with mp.workdps(digits):
+			value = res.register(self.visit(node.body_node, context))
+		if res.should_return(): return res
+
+		return res.success(None if node.should_return_null else value)
+
 	def visit_FuncDefNode(self, node, context):
 		res = RTResult()
 
@@ -2753,11 +6189,14 @@ class Interpreter:
 	   			self.visit(arg[1], context).value if not isinstance(arg[1], Token) else arg[1].value
 				for arg in node.arg_name_toks if not isinstance(arg, Token)})
 		func_value = Function(func_name, body_node, arg_names, node.should_auto_return).set_context(context).set_pos(node.pos_start, node.pos_end)
+		func_value.is_generator = node.is_generator
 
 		if node.var_name_tok is not None:
 			context.symbol_table.set(func_name, func_value)
+			return res.success(None)
 
-		return res.success(None)
+		# Anonymous functions are values, so they can be assigned or passed to map, filter, ...
+		return res.success(func_value)
 
 	def visit_CallNode(self, node, context):
 		res = RTResult()
@@ -2777,7 +6216,10 @@ class Interpreter:
 			if res.should_return(): return res
 
 		return_value = res.register(value_to_call.execute((pos_args, opt_args)))
-		if res.should_return(): return res
+		if res.should_return():
+			# Interned values and built-ins can't always tell where they were called from
+			if res.error: res.error = self.locate_error(res.error, node, context)
+			return res
 		return_value = return_value.copy().set_pos(node.pos_start, node.pos_end).set_context(context) if return_value is not None else None
 		return res.success(return_value)
 	
@@ -2798,10 +6240,199 @@ class Interpreter:
 	def visit_BreakNode(self, node, context):
 		return RTResult().success_break()
 
+##########################################################
+# GENERATORS
+##########################################################
+
+class GeneratorInterpreter(Interpreter):
+	# Runs the body of a generator function as a Python generator: the nodes that can reach a 'yield' are visited
+	# by yield_* methods that yield each value produced and return their RTResult, everything else is visited as usual
+	def visit_yielding(self, node, context):
+		if not contains_yield(node):
+			return self.visit(node, context)
+		return (yield from getattr(self, f'yield_{type(node).__name__}')(node, context))
+
+	def yield_YieldNode(self, node, context):
+		res = RTResult()
+		value = res.register(self.visit(node.node_to_yield, context))
+		if res.should_return(): return res
+
+		# An if without an else that runs no branch has no value
+		yield value if value is not None else NullType()
+		return res.success(NullType())
+
+	def yield_ListNode(self, node, context):
+		res = RTResult()
+		elements = []
+
+		for element_node in node.element_nodes:
+			value = res.register((yield from self.visit_yielding(element_node, context)))
+			if res.should_return(): return res
+			if not node.should_return_null: elements.append(value)
+
+		if node.should_return_null: return res.success(None)
+		return res.success(
+			List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+		)
+
+	def yield_IfNode(self, node, context):
+		res = RTResult()
+
+		for condition, expr, should_return_null in node.cases:
+			condition_value = res.register(self.visit(condition, context))
+			if res.should_return(): return res
+
+			if condition_value.is_true():
+				expr_value = res.register((yield from self.visit_yielding(expr, context)))
+				if res.should_return(): return res
+				return res.success(None if should_return_null else expr_value)
+
+		if node.else_case:
+			expr, should_return_null = node.else_case
+			else_value = res.register((yield from self.visit_yielding(expr, context)))
+			if res.should_return(): return res
+			return res.success(None if should_return_null else else_value)
+
+		return res.success(None)
+
+	def yield_ForNode(self, node, context):
+		res = RTResult()
+		elements = []
+
+		counters, boxed = res.register(self.for_range(node, context)) or (None, None)
+		if res.should_return(): return res
+
+		var_name = node.var_name_tok.value
+		symbol_table = context.symbol_table
+
+		i = None
+		for i in counters:
+			if node.body_reads_counter: symbol_table.set(var_name, boxed(i))
+
+			value = res.register((yield from self.visit_yielding(node.body_node, context)))
+			if res.should_return() and res.loop_should_continue == False and res.loop_should_break == False: return res
+
+			if res.loop_should_continue:
+				continue
+
+			if res.loop_should_break:
+				break
+
+			if not node.should_return_null: elements.append(value or NullType())
+
+		if not node.body_reads_counter and i is not None:
+			symbol_table.set(var_name, boxed(i))
+
+		return res.success(
+			None if node.should_return_null else 
+			List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+		)
+
+	def yield_ForInNode(self, node, context):
+		res = RTResult()
+		elements = []
+
+		iterator = res.register(self.for_in_iterator(node, context))
+		if res.should_return(): return res
+
+		while True:
+			try:
+				element = next(iterator, NO_ELEMENT)
+			except IterationError as e:
+				return res.failure(e.error)
+			if element is NO_ELEMENT: break
+
+			context.symbol_table.set(node.var_name_tok.value, element)
+
+			value = res.register((yield from self.visit_yielding(node.body_node, context)))
+			if res.should_return() and res.loop_should_continue == False and res.loop_should_break == False: return res
+
+			if res.loop_should_continue:
+				continue
+
+			if res.loop_should_break:
+				break
+
+			if not node.should_return_null: elements.append(value or NullType())
+
+		return res.success(
+			None if node.should_return_null else 
+			List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+		)
+
+	def yield_WhileNode(self, node, context):
+		res = RTResult()
+		elements = []
+
+		while True:
+			condition = res.register(self.visit(node.condition_node, context))
+			if res.should_return(): return res
+
+			if not condition.is_true(): break
+
+			value = res.register((yield from self.visit_yielding(node.body_node, context)))
+			if res.should_return() and res.loop_should_continue == False and res.loop_should_break == False: return res
+
+			if res.loop_should_continue:
+				continue
+
+			if res.loop_should_break:
+				break
+
+			if not node.should_return_null: elements.append(value or NullType())
+
+		return res.success(
+			None if node.should_return_null else 
+			List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+		)
+
+	def yield_PrecisionNode(self, node, context):
+		res = RTResult()
+
+		digits = res.register(self.precision_digits(node, context))
+		if res.should_return(): return res
+
+		with mp.workdps(digits):
+			value = res.register((yield from self.visit_yielding(node.body_node, context)))
+		if res.should_return(): return res
+
+		return res.success(None if node.should_return_null else value)
+
+def generate(body_node, exec_ctx):
+	# The elements of a generator, computed when they are asked for. The body keeps its own precision while it is
+	# suspended, so a 'precision' around a 'yield' doesn't change the precision of the code consuming the generator
+	body = GeneratorInterpreter().visit_yielding(body_node, exec_ctx)
+	body_prec = mp.prec
+
+	def resume(step):
+		nonlocal body_prec
+		consumer_prec = mp.prec
+		mp.prec = body_prec
+		try:
+			return step()
+		finally:
+			body_prec = mp.prec
+			mp.prec = consumer_prec
+
+	try:
+		while True:
+			try:
+				value = resume(lambda: next(body))
+			except StopIteration as stop:
+				if stop.value.error: raise IterationError(stop.value.error)
+				return
+			yield value
+	finally:
+		# Unwinds the body when the consumer stops early
+		resume(body.close)
+
 ##########################################################
 # RUN
 ##########################################################
 
+constant_pi = Constant(mp.pi, math.pi)
+constant_e = Constant(mp.e, math.e)
+
 global_symbol_table = SymbolTable()
 global_symbol_table.set('version', String(f'v{version_str}'))
 global_symbol_table.set('null', NullType('null'))
@@ -2818,12 +6449,99 @@ global_symbol_table.set('exit', BuiltInFunction('exit'))
 global_symbol_table.set('type', BuiltInFunction('type'))
 global_symbol_table.set('sin', BuiltInFunction('sin'))
 global_symbol_table.set('cos', BuiltInFunction('cos'))
+global_symbol_table.set('tan', BuiltInFunction('tan'))
+global_symbol_table.set('asin', BuiltInFunction('asin'))
+global_symbol_table.set('acos', BuiltInFunction('acos'))
+global_symbol_table.set('atan', BuiltInFunction('atan'))
+global_symbol_table.set('atan2', BuiltInFunction('atan2'))
+global_symbol_table.set('sinh', BuiltInFunction('sinh'))
+global_symbol_table.set('cosh', BuiltInFunction('cosh'))
+global_symbol_table.set('tanh', BuiltInFunction('tanh'))
+global_symbol_table.set('exp', BuiltInFunction('exp'))
+global_symbol_table.set('log', BuiltInFunction('log'))
+global_symbol_table.set('sqrt', BuiltInFunction('sqrt'))
+global_symbol_table.set('gamma', BuiltInFunction('gamma'))
 global_symbol_table.set('exec', BuiltInFunction('exec'))
 global_symbol_table.set('length', BuiltInFunction('length'))
-global_symbol_table.set('pi', Decimal(3.14159265358979323846264338327950288419716939937510582097494459230781640628620899862803482534211706798214808651328230664709384460955058223172535940812848111745028410270193852110555964462294895493038196442881097566593344612847564823378678316527120190914564856692346034861045432664821339360726024914127372458700660631558817488152092096282925409171536436789259036001133053054882046652138414695194151160943305727036575959195309218611738193261179310511854807446237996274956735188575272489122793818301194912983367336244065664308602139494639522473719070217986094370277053921717629317675238467481846766940513200056812714526356082778577134275778960917363717872146844090122495343014654958537105079227968925892354201995611212902196086403441815981362977477130996051870721134999999837297804995105973173281609631859502445945534690830264252230825334468503526193118817101000313783875288658753320838142061717766914730359825349042875546873115956286388235378759375195778185778053217122680661300192787661119590921642019893809525720106548586327886593615338182796823030195203530185296899577362259941389124972177528347913151557485724245415069595082953311686172785588907509838175463746493931925506040092770167113900984882401285836160356370766010471018194295559619894676783744944825537977472684710404753464620804668425906949129331367702898915210475216205696602405803815019351125338243003558764024749647326391419927260426992279678235478163600934172164121992458631503028618297455570674983850549458858692699569092721079750930295532116534498720275596023648066549911988183479775356636980742654252786255181841757467289097777279380008164706001614524919217321721477235014144197356854816136115735255213347574184946843852332390739414333454776241686251898356948556209921922218427255025425688767179049460165346680498862723279178608578438382796797668145410095388378636095068006422512520511739298489608412848862694560424196528502221066118630674427862203919494504712371378696095636437191728746776465757396241389086583264599581339047802758995))
-global_symbol_table.set('e', Decimal(2.71828182845904523536028747135266249775724709369995957496696762772407663035354759457138217852516642742746639193200305992181741359662904357290033429526059563073813232862794349076323382988075319525101901157383418793070215408914993488416750924476146066808226480016847741185374234544243710753907774499206955170276183860626133138458300075204493382656029760673711320070932870912744374704723069697720931014169283681902551510865746377211125238978442505695369677078544996996794686445490598793163688923009879312773617821542499922957635148220826989519366803318252886939849646510582093923982948879332036250944311730123819706841614039701983767932068328237646480429531180232878250981945581530175671736133206981125099618188159304169035159888851934580727386673858942287922849989208680582574927961048419844436346324496848756023362482704197862320900216099023530436994184914631409343173814364054625315209618369088870701676839642437814059271456354906130310720851038375051011574770417189861068739696552126715468895703503540212340784981933432106817012100562788023519303322474501585390473041995777709350366041699732972508868769664035557071622684471625607988265178713419512466520103059212366771943252786753985589448969709640975459185695638023637016211204774272283648961342251644507818244235294863637214174023889344124796357437026375529444833799801612549227850925778256209262264832627793338656648162772516401910590049164499828931505660472580277863186415519565324425869829469593080191529872117255634754639644791014590409058629849679128740687050489585867174798546677575732056812884592054133405392200011378630094556068816674001698420558040336379537645203040243225661352783695117788386387443966253224985065499588623428189970773327617178392803494650143455889707194258639877275471096295374152111513683506275260232648472870392076431005958411661205452970302364725492966693811513732275364509888903136020572481765851180630364428123149655070475102544650117272115551948668508003685322818315219600373562527944951582841882947876108526398144))
-
-def run(fn, text):
+global_symbol_table.set('sum', BuiltInFunction('sum'))
+global_symbol_table.set('prod', BuiltInFunction('prod'))
+global_symbol_table.set('min', BuiltInFunction('min'))
+global_symbol_table.set('max', BuiltInFunction('max'))
+global_symbol_table.set('mean', BuiltInFunction('mean'))
+global_symbol_table.set('range', BuiltInFunction('range'))
+global_symbol_table.set('map', BuiltInFunction('map'))
+global_symbol_table.set('filter', BuiltInFunction('filter'))
+global_symbol_table.set('reduce', BuiltInFunction('reduce'))
+global_symbol_table.set('zip', BuiltInFunction('zip'))
+global_symbol_table.set('enumerate', BuiltInFunction('enumerate'))
+global_symbol_table.set('append', BuiltInFunction('append'))
+global_symbol_table.set('extend', BuiltInFunction('extend'))
+global_symbol_table.set('set_at', BuiltInFunction('set_at'))
+global_symbol_table.set('insert', BuiltInFunction('insert'))
+global_symbol_table.set('pop', BuiltInFunction('pop'))
+global_symbol_table.set('copy', BuiltInFunction('copy'))
+global_symbol_table.set('persistent', BuiltInFunction('persistent'))
+global_symbol_table.set('conj', BuiltInFunction('conj'))
+global_symbol_table.set('assoc', BuiltInFunction('assoc'))
+global_symbol_table.set('sort', BuiltInFunction('sort'))
+global_symbol_table.set('sorted', BuiltInFunction('sorted'))
+global_symbol_table.set('index_of', BuiltInFunction('index_of'))
+global_symbol_table.set('binary_search', BuiltInFunction('binary_search'))
+global_symbol_table.set('unique', BuiltInFunction('unique'))
+global_symbol_table.set('get', BuiltInFunction('get'))
+global_symbol_table.set('set', BuiltInFunction('set'))
+global_symbol_table.set('has', BuiltInFunction('has'))
+global_symbol_table.set('keys', BuiltInFunction('keys'))
+global_symbol_table.set('values', BuiltInFunction('values'))
+global_symbol_table.set('items', BuiltInFunction('items'))
+global_symbol_table.set('string_builder', BuiltInFunction('string_builder'))
+global_symbol_table.set('to_string', BuiltInFunction('to_string'))
+global_symbol_table.set('split', BuiltInFunction('split'))
+global_symbol_table.set('join', BuiltInFunction('join'))
+global_symbol_table.set('replace', BuiltInFunction('replace'))
+global_symbol_table.set('find', BuiltInFunction('find'))
+global_symbol_table.set('upper', BuiltInFunction('upper'))
+global_symbol_table.set('lower', BuiltInFunction('lower'))
+global_symbol_table.set('strip', BuiltInFunction('strip'))
+global_symbol_table.set('format', BuiltInFunction('format'))
+global_symbol_table.set('vector', BuiltInFunction('vector'))
+global_symbol_table.set('to_list', BuiltInFunction('to_list'))
+global_symbol_table.set('matrix', BuiltInFunction('matrix'))
+global_symbol_table.set('identity', BuiltInFunction('identity'))
+global_symbol_table.set('transpose', BuiltInFunction('transpose'))
+global_symbol_table.set('inverse', BuiltInFunction('inverse'))
+global_symbol_table.set('det', BuiltInFunction('det'))
+global_symbol_table.set('solve', BuiltInFunction('solve'))
+global_symbol_table.set('eigenvalues', BuiltInFunction('eigenvalues'))
+global_symbol_table.set('qr', BuiltInFunction('qr'))
+global_symbol_table.set('cholesky', BuiltInFunction('cholesky'))
+global_symbol_table.set('svd', BuiltInFunction('svd'))
+global_symbol_table.set('memo', BuiltInFunction('memo'))
+global_symbol_table.set('memo_info', BuiltInFunction('memo_info'))
+global_symbol_table.set('memo_clear', BuiltInFunction('memo_clear'))
+global_symbol_table.set('persist', BuiltInFunction('persist'))
+global_symbol_table.set('persist_clear', BuiltInFunction('persist_clear'))
+global_symbol_table.set('pi', constant_pi)
+global_symbol_table.set('e', constant_e)
+
+def run(fn, text, precision=None, fast=None, exact=None, discard_result=False, keep_settings=False):
+	global numeric_mode, exact_division
+
+	# The precision and modes set by the arguments or by a 'precision' statement only last for this run, unless
+	# keep_settings is set, like the shell does so that a 'precision' typed at the prompt applies to the following lines
+	saved_settings = (mp.dps, numeric_mode, exact_division)
+
+	try:
+		if precision is not None: mp.dps = precision
+		if fast is not None: numeric_mode = 'fast' if fast else 'precise'
+		if exact is not None: exact_division = exact
+
+		return run_program(fn, text, discard_result)
+	finally:
+		if not keep_settings:
+			mp.dps, numeric_mode, exact_division = saved_settings
+
+def run_program(fn, text, discard_result):
 	# Generate tokens
 	lexer = Lexer(fn, text)
 	tokens, error = lexer.make_tokens()
@@ -2847,6 +6565,8 @@ def run(fn, text):
 	
 	if ast.error: return None, ast.error
 
+	mark_unused_results(ast.node, not discard_result)
+
 	# Run program
 	interpreter = Interpreter()
 	context = Context('<program>')
@@ -15,6 +15,11 @@ def main():
 	arg_group1.add_argument("-h", "--help", action="help", help="Show this help message and exit.")
 	arg_group1.add_argument("-V", "--version", action="store_true", help=f"Display the version information of {mathscript.product_name}.")
 	arg_group2.add_argument("--debug", help=f"Enable debug mode. Choose one of {mathscript.debug_modes_list_str}.", metavar="debug_mode")
+	arg_group2.add_argument("-p", "--precision", type=int, help=f"Number of significant digits used for decimals and complexes (default: {mathscript.default_precision}).", metavar="digits")
+	arg_group2.add_argument("--numeric-mode", choices=mathscript.numeric_modes_list, help=f"Numeric backend for decimals and complexes: 'precise' uses mpmath, 'fast' uses native floats (default: '{mathscript.numeric_mode}').", metavar="mode")
+	arg_group2.add_argument("--exact-division", action="store_true", help="Keep inexact integer divisions and negative integer powers as exact rationals instead of decimals.")
+	arg_group2.add_argument("--cache-file", help=f"File used to store the results of persisted functions (default: '{mathscript.persistent_cache_file}').", metavar="path")
+	arg_group2.add_argument("--cache-size", type=int, help=f"Maximum number of results kept in the persistent cache (default: {mathscript.persistent_cache_max_entries}).", metavar="entries")
 	arg_group2.add_argument("file", help=f"Execute a .mscr file", nargs='?')
 	arg_parser._positionals.title = "Positional arguments"
 	arg_parser._optionals.title = "Optional arguments"
@@ -39,12 +44,31 @@ def main():
 			print(f"Invalid debug mode specified: '{args.debug}'.{f" Did you mean '{suggest[0]}'?" if len(suggest) > 0 else ''}\nChoose from: \n\t- {'\n\t- '.join(mathscript.debug_modes_list)}")
 			sys.exit()
 
+	if args.precision is not None:
+		if args.precision <= 0:
+			arg_parser.error(f"argument -p/--precision: must be a positive integer")
+		mathscript.mp.dps = args.precision
+
+	if args.numeric_mode:
+		mathscript.numeric_mode = args.numeric_mode
+
+	if args.exact_division:
+		mathscript.exact_division = True
+
+	if args.cache_file:
+		mathscript.persistent_cache_file = args.cache_file
+
+	if args.cache_size is not None:
+		if args.cache_size <= 0:
+			arg_parser.error(f"argument --cache-size: must be a positive integer")
+		mathscript.persistent_cache_max_entries = args.cache_size
+
 	if args.file:
 		text = ''
 		with open(args.file, 'r') as f:
 			text = f.read()
 		try:
-			result, error = mathscript.run(args.file, text)
+			result, error = mathscript.run(args.file, text, discard_result=True)
 			if error: print(error.as_string())
 		except KeyboardInterrupt:
 			sys.exit()
@@ -58,7 +82,7 @@ def main():
 				print()
 				sys.exit()
 			
-			result, error = mathscript.run("<stdin>", text)
+			result, error = mathscript.run("<stdin>", text, keep_settings=True)
 
 			if error: print(error.as_string())
 			elif result is not None:
@@ -0,0 +1,358 @@
+import gc
+import os
+import tempfile
+import unittest
+
+import mathscript
+
+
+def run(text, **kwargs):
+	return mathscript.run('<test>', text, **kwargs)
+
+class MemoTests(unittest.TestCase):
+	def test_memo_info_counts_hits_misses_and_entries(self):
+		result, error = run('func f(n) => n * 2\ng = memo(f, size=2)\ng(1)\ng(1)\ng(2)\ng(3)\nmemo_info(g)')
+		self.assertEqual(repr(result.elements[2:5]), '[2, 2, 4]')
+		self.assertEqual(repr(result.elements[-1]), '(1, 3, 2, 2)')
+
+	def test_sorting_a_memoized_result_leaves_the_cache_alone(self):
+		result, error = run('func mk(n) => (n, 1)\nmk = memo(mk)\na = mk(3)\nsort(a)\nmk(3)')
+		self.assertEqual(repr(result.elements[-1]), '(3, 1)')
+
+	def test_memoized_functions_can_sort_their_own_lists(self):
+		result, error = run('func f(n)\n\txs = (n, 1)\n\tsort(xs)\n\treturn xs\nend\nf = memo(f)\nf(3)\nf(3)')
+		self.assertIsNone(error)
+		self.assertEqual(repr(result.elements[-2:]), '[(1, 3), (1, 3)]')
+
+	def test_memoized_functions_cannot_sort_outer_lists(self):
+		result, error = run('ys = (2, 1)\nfunc f(n)\n\tsort(ys)\n\treturn n\nend\nf = memo(f)\nf(1)')
+		self.assertIsNone(result)
+		self.assertIn("Cannot call 'sort' inside memoized function 'f'", error.details)
+
+	def test_mutating_a_memoized_result_leaves_the_cache_alone(self):
+		result, error = run('func mk(n) => (n, n)\nmk = memo(mk)\na = mk(1)\nappend(a, 99)\nmk(1)')
+		self.assertEqual(repr(result.elements[-1]), '(1, 1)')
+
+	def test_memoized_functions_can_change_their_own_lists(self):
+		result, error = run('func f(n)\n\txs = ()\n\tappend(xs, n)\n\treturn xs\nend\nf = memo(f)\nf(1)\nf(1)')
+		self.assertIsNone(error)
+		self.assertEqual(repr(result.elements[-2:]), '[(1,), (1,)]')
+
+	def test_memoized_functions_cannot_change_outer_lists(self):
+		for text in ('ys = (1,)\nfunc f(n)\n\tappend(ys, n)\n\treturn n\nend\nf = memo(f)\nf(1)', 'func f(xs)\n\tappend(xs, 1)\n\treturn xs\nend\nf = memo(f)\nf((1, 2))'):
+			result, error = run(text)
+			self.assertIsNone(result)
+			self.assertIn("Cannot call 'append' inside memoized function 'f'", error.details)
+
+class PersistentCacheTests(unittest.TestCase):
+	def test_replacing_a_key_does_not_grow_the_count(self):
+		with tempfile.TemporaryDirectory() as directory:
+			cache = mathscript.PersistentCache(os.path.join(directory, 'cache.db'), 10)
+			for i in range(30):
+				cache.put('key', 'source', mathscript.Integer(i))
+			self.assertEqual(cache.entry_count, 1)
+			found, value = cache.get('key')
+			self.assertTrue(found)
+			self.assertEqual(value.value, 29)
+			cache.flush()
+
+	def test_results_survive_reopening_the_cache(self):
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, 'cache.db')
+			cache = mathscript.PersistentCache(path, 10)
+			cache.put('key', 'source', mathscript.String('value'))
+			cache.flush()
+			reopened = mathscript.PersistentCache(path, 10)
+			found, value = reopened.get('key')
+			self.assertTrue(found)
+			self.assertEqual(value.value, 'value')
+			reopened.flush()
+
+class PrecisionTests(unittest.TestCase):
+	def test_precision_argument_only_lasts_for_the_run(self):
+		dps = mathscript.mp.dps
+		result, error = run('1/3', precision=5)
+		self.assertEqual(mathscript.mp.dps, dps)
+		self.assertEqual(repr(result.elements[0]), repr(run('precision 5 then 1/3')[0].elements[0]))
+		self.assertNotEqual(repr(result.elements[0]), repr(run('1/3')[0].elements[0]))
+
+class FastModeTests(unittest.TestCase):
+	def test_fast_mode_uses_native_numbers(self):
+		result, error = run('1/3\n1.5 * 3\n(-1)^0.5', fast=True)
+		self.assertEqual([type(value.value).__name__ for value in result.elements], ['float', 'float', 'complex'])
+
+	def test_fast_mode_only_lasts_for_the_run(self):
+		run('1.5 * 3', fast=True)
+		result, error = run('1.5 * 3')
+		self.assertEqual(type(result.elements[0].value).__name__, 'mpf')
+
+class NumberTests(unittest.TestCase):
+	def test_decimal_and_complex_results(self):
+		result, error = run('0.1 + 0.2\n1.5 * 2\n2i * 2i')
+		self.assertEqual(repr(result.elements), '[0.3, 3.0, (-4+0i)]')
+
+class ConstantTests(unittest.TestCase):
+	def test_pi_follows_the_precision(self):
+		low, error = run('pi', precision=30)
+		high, error = run('pi', precision=60)
+		self.assertTrue(repr(low.elements[0]).startswith('3.14159265358979323846264338327'))
+		self.assertTrue(repr(high.elements[0]).startswith('3.14159265358979323846264338327950288419716939937'))
+		self.assertNotEqual(repr(low.elements[0]), repr(high.elements[0]))
+
+class MathFunctionTests(unittest.TestCase):
+	def test_sin_and_cos(self):
+		result, error = run('sin(0)\ncos(0)')
+		self.assertEqual(repr(result.elements), '[0.0, 1.0]')
+
+	def test_atan2_refuses_complex_arguments(self):
+		for fast in (False, True):
+			for text in ('atan2(1i, 1)', 'atan2(1, 1i)'):
+				result, error = run(text, fast=fast)
+				self.assertIsNone(result)
+				self.assertIn('must be a real number', error.as_string())
+
+class ErrorPositionTests(unittest.TestCase):
+	def assert_call_error(self, text, type_name):
+		result, error = run(text)
+		self.assertIsNone(result)
+		self.assertIsNotNone(error.pos_start)
+		self.assertIn(f'Illegal operation "call" for {type_name}', error.as_string())
+
+	def test_calling_an_interned_integer(self):
+		self.assert_call_error('5()', 'Integer')
+
+	def test_calling_interned_booleans_and_null(self):
+		self.assert_call_error('true()', 'Boolean')
+		self.assert_call_error('null()', 'NullType')
+
+	def test_calling_pooled_literals(self):
+		self.assert_call_error('"abc"()', 'String')
+		self.assert_call_error('1.5()', 'Decimal')
+		self.assert_call_error('2i()', 'Complex')
+
+	def test_indexing_with_a_pooled_literal(self):
+		result, error = run('"abc"_(10)')
+		self.assertIsNotNone(error.pos_start)
+		self.assertIn('index is out of bounds', error.as_string())
+
+class ExactTests(unittest.TestCase):
+	def test_exact_division_gives_rationals(self):
+		result, error = run('1/3 + 1/6', exact=True)
+		self.assertEqual(repr(result.elements[0]), '1/2')
+
+	def test_integer_powers_stay_exact(self):
+		result, error = run('2^100')
+		self.assertEqual(result.elements[0].value, 2**100)
+
+class VectorTests(unittest.TestCase):
+	def test_elementwise_operators(self):
+		result, error = run('vector((1, 2)) + vector((3, 4))\nvector((1, 2)) * 3')
+		self.assertEqual(repr(result.elements), '[vector(4, 6), vector(3, 6)]')
+
+	def test_integer_overflow_falls_back_to_python_ints(self):
+		result, error = run('vector((4611686018427387904, 2)) * 4')
+		self.assertEqual(repr(result.elements[0]), 'vector(18446744073709551616, 8)')
+
+	def test_sum_does_not_wrap_around(self):
+		result, error = run('sum(vector((9223372036854775807, 9223372036854775807)))')
+		self.assertEqual(result.elements[0].value, 2 * (2**63 - 1))
+
+	def test_boolean_vectors_mask(self):
+		result, error = run('v = vector((10, 20, 30))\n(v)_(vector((true, false, true)))')
+		self.assertEqual(repr(result.elements[-1]), 'vector(10, 30)')
+
+class MatrixTests(unittest.TestCase):
+	def test_product_transpose_and_determinant(self):
+		result, error = run('m = matrix(((1, 2), (3, 4)))\nm * m\ntranspose(m)\ndet(m)')
+		self.assertEqual(repr(result.elements[1:]), '[matrix((7.0, 10.0), (15.0, 22.0)), matrix((1.0, 3.0), (2.0, 4.0)), -2.0]')
+
+class AggregateTests(unittest.TestCase):
+	def test_aggregates_of_a_list(self):
+		result, error = run('sum((1, 2, 3))\nprod((1, 2, 3))\nmin((3, 1))\nmax((3, 1))\nmean((1, 2))')
+		self.assertEqual(repr(result.elements), '[6, 6, 1, 3, 1.5]')
+
+class FunctionalTests(unittest.TestCase):
+	def test_map_filter_and_reduce(self):
+		result, error = run('func sq(x) => x * x\nfunc big(x) => x > 1\nfunc add(a, b) => a + b\nmap(sq, (1, 2, 3))\nfilter(big, (1, 2, 3))\nreduce(add, (1, 2, 3))')
+		self.assertEqual(repr(result.elements[3:]), '[(1, 4, 9), (2, 3), 6]')
+
+	def test_zip_and_enumerate(self):
+		result, error = run('zip((1, 2), (3, 4))\nenumerate((5, 6))')
+		self.assertEqual(repr(result.elements), '[((1, 3), (2, 4)), ((0, 5), (1, 6))]')
+
+class SortTests(unittest.TestCase):
+	def test_sorted_leaves_the_list_alone(self):
+		result, error = run('xs = (3, 1, 2)\nsorted(xs)\n(xs)_(0)\nsort(xs)\nxs')
+		self.assertEqual(repr(result.elements[1:]), '[(1, 2, 3), 3, null, (1, 2, 3)]')
+
+	def test_searching(self):
+		result, error = run('unique((1, 1, 2))\nindex_of((1, 2, 3), 2)\nbinary_search((1, 2, 3), 3)')
+		self.assertEqual(repr(result.elements), '[(1, 2), 1, 2]')
+
+class ListMutationTests(unittest.TestCase):
+	def test_mutators_change_the_list(self):
+		result, error = run('xs = (1, 2)\nappend(xs, 3)\ninsert(xs, 0, 0)\npop(xs)\nxs')
+		self.assertEqual(repr(result.elements[3:]), '[3, (0, 1, 2)]')
+
+	def test_copy_is_independent(self):
+		result, error = run('xs = (1, 2)\nys = copy(xs)\nappend(ys, 3)\nxs')
+		self.assertEqual(repr(result.elements[-1]), '(1, 2)')
+
+class PersistentListTests(unittest.TestCase):
+	def test_updates_leave_the_original_alone(self):
+		result, error = run('p = persistent((1, 2, 3))\nconj(p, 4)\nassoc(p, 0, 9)\np')
+		self.assertEqual(repr(result.elements[1:]), '[(1, 2, 3, 4), (9, 2, 3), (1, 2, 3)]')
+
+	def test_persistent_lists_cannot_be_changed_in_place(self):
+		result, error = run('p = persistent((1, 2))\nappend(p, 3)')
+		self.assertIsNone(result)
+		self.assertIn("Persistent lists can't be changed in place", error.details)
+
+class SliceTests(unittest.TestCase):
+	def test_changing_the_base_list_detaches_its_slices(self):
+		result, error = run('xs = (1, 2, 3, 4)\nw = (xs)_(0, 2)\ninsert(xs, 0, 99)\nw')
+		self.assertEqual(repr(result.elements[-1]), '(1, 2)')
+
+	def test_shrinking_the_base_list_keeps_its_slices_readable(self):
+		result, error = run('xs = (1, 2, 3)\nw = (xs)_(1, 3)\npop(xs)\npop(xs)\nsum(w)')
+		self.assertIsNone(error)
+		self.assertEqual(result.elements[-1].value, 5)
+
+	def test_slice_registry_drops_dead_views(self):
+		gc.collect()
+		registered = len(mathscript.slice_views)
+		result, error = run('func f(n)\n\tys = (1, 2, 3)\n\tw = (ys)_(0, 2)\n\treturn sum(w)\nend\nfor i = 0 to 100 then f(i)')
+		self.assertIsNone(error)
+		del result
+		gc.collect()
+		self.assertEqual(len(mathscript.slice_views), registered)
+
+class MapTests(unittest.TestCase):
+	def test_literal_and_lookups(self):
+		result, error = run('m = {1: 2, "a": 3}\nget(m, "a")\nhas(m, 2)')
+		self.assertEqual(repr(result.elements[1:]), '[3, false]')
+
+	def test_nested_maps_compare_equal(self):
+		result, error = run('{1: {2: 3}} == {1: {2: 3}}')
+		self.assertTrue(result.elements[0].is_true())
+
+	def test_nested_maps_with_different_values_differ(self):
+		result, error = run('{1: {2: 3}} == {1: {2: 4}}')
+		self.assertFalse(result.elements[0].is_true())
+
+	def test_rational_keys_match_equal_decimals(self):
+		result, error = run('1/10 == 0.1\nhas({0.1: 1}, 1/10)\nhas({(1/10, 2): 1}, (0.1, 2))', exact=True)
+		self.assertEqual(repr(result.elements), '[true, true, true]')
+
+class GeneratorTests(unittest.TestCase):
+	def test_yield_in_loops_and_branches(self):
+		result, error = run('func g(n)\n\tfor i = 0 to n then\n\t\tif i < 3 or i == 6 then yield i\n\tend\nend\nto_list(g(7))')
+		self.assertEqual(repr(result.elements[-1]), '(0, 1, 2, 6)')
+
+	def test_generator_precision_does_not_leak(self):
+		result, error = run('func g()\n\tprecision 5 then\n\t\tyield 1\n\t\tyield 2\n\tend\nend\nfunc third(x) => 1/3\nto_list(map(third, g()))')
+		self.assertEqual(repr(result.elements[-1]), repr(run('(1/3, 1/3)')[0].elements[0]))
+
+	def test_error_inside_a_generator(self):
+		result, error = run('func g()\n\tyield 1\n\tyield missing\nend\nsum(g())')
+		self.assertIsNone(result)
+		self.assertIn("'missing' is not defined", error.as_string())
+
+	def test_stopping_early(self):
+		result, error = run('func g()\n\twhile true then yield 1\nend\nto_list(zip(g(), (1, 2)))')
+		self.assertEqual(repr(result.elements[-1]), '((1, 1), (1, 2))')
+
+	def test_yield_inside_an_expression_is_a_syntax_error(self):
+		for body in ('y = if true then yield 1', 'return if true then yield 1', 'print(if true then yield 1)'):
+			result, error = run(f'func g()\n\t{body}\nend')
+			self.assertIsNone(result)
+			self.assertIn("'yield' can only be used as a statement", error.as_string())
+
+	def test_yielding_an_if_without_a_value_gives_null(self):
+		result, error = run('func g()\n\tyield 1\n\tyield if false then 5\n\tyield 3\nend\nto_list(g())')
+		self.assertEqual(repr(result.elements[-1]), '(1, null, 3)')
+
+	def test_for_in_over_a_generator_yielding_null(self):
+		result, error = run('func g()\n\tyield 1\n\tyield if false then 5\n\tyield 3\nend\nfor x in g() then x')
+		self.assertEqual(repr(result.elements[-1]), '(1, null, 3)')
+
+class RangeTests(unittest.TestCase):
+	def test_ranges_longer_than_sys_maxsize(self):
+		result, error = run('sum(range(0, 10^20))\nlength(range(0, 10^20, increment=3))\nmax(range(0, 10^20))')
+		self.assertIsNone(error)
+		self.assertEqual([value.value for value in result.elements], [10**20 * (10**20 - 1) // 2, 33333333333333333334, 10**20 - 1])
+
+	def test_length_of_a_descending_range(self):
+		result, error = run('length(range(10, 0, increment=-3))')
+		self.assertEqual(result.elements[0].value, 4)
+
+	def test_for_in_over_a_huge_range(self):
+		result, error = run('for i in range(0, 10^20) then if i == 2 then break else i')
+		self.assertIsNone(error)
+		self.assertEqual(repr(result.elements[0]), '(0, 1)')
+
+class UnusedResultTests(unittest.TestCase):
+	def test_discarded_results(self):
+		result, error = run('1 + 1', discard_result=True)
+		self.assertIsNone(result)
+		self.assertIsNone(error)
+
+	def test_loop_values_that_are_used_are_kept(self):
+		result, error = run('func f(n) => for i = 0 to n then i\nfunc g(n)\n\tys = for i = 0 to n then i * 2\n\treturn ys\nend\nf(3)\ng(3)')
+		self.assertEqual(repr(result.elements[2:]), '[(0, 1, 2), (0, 2, 4)]')
+
+class ForInTests(unittest.TestCase):
+	def test_iterables(self):
+		result, error = run('for x in (5, 6) then x\nfor c in "ab" then c\nfor k in {1: 2, 3: 4} then k\nfor i in range(0, 3) then i')
+		self.assertEqual(repr(result.elements), "[(5, 6), ('a', 'b'), (1, 3), (0, 1, 2)]")
+
+class ForLoopTests(unittest.TestCase):
+	def test_counter_keeps_its_last_value(self):
+		result, error = run('for i = 0 to 5 then 1\ni')
+		self.assertEqual(result.elements[-1].value, 4)
+
+	def test_rational_steps_keep_rational_counters(self):
+		result, error = run('for i = 0 to 1 step 1/3 then i', exact=True)
+		counters = result.elements[0].elements
+		self.assertEqual(repr(result.elements[0]), '(0, 1/3, 2/3)')
+		self.assertEqual([type(i).__name__ for i in counters[1:]], ['Rational', 'Rational'])
+
+	def test_decimal_steps_keep_decimal_counters(self):
+		result, error = run('for i = 0 to 1 step 0.25 then i')
+		self.assertEqual(repr(result.elements[0]), '(0.0, 0.25, 0.5, 0.75)')
+
+class ShortCircuitTests(unittest.TestCase):
+	def test_literal_right_sides_keep_their_result_classes(self):
+		result, error = run('0 and null\n0 and 1.5\n1 or false')
+		self.assertEqual([type(value).__name__ for value in result.elements], ['NullType', 'Decimal', 'Boolean'])
+
+	def test_computed_right_sides_are_skipped(self):
+		result, error = run('func f() => undefined\nfalse and f()\ntrue or f()')
+		self.assertIsNone(error)
+		self.assertEqual(repr(result.elements[1:]), '[false, true]')
+
+class StringBuilderTests(unittest.TestCase):
+	def test_adding_to_a_builder_leaves_it_alone(self):
+		result, error = run('b = string_builder(initial="ab")\nc = b + "cd"\n(b, c)')
+		self.assertEqual(str(result.elements[-1].elements[0]), 'ab')
+		self.assertEqual(str(result.elements[-1].elements[1]), 'abcd')
+
+	def test_append_changes_the_builder(self):
+		result, error = run('b = string_builder(initial="ab")\nappend(b, "cd")\nb')
+		self.assertEqual(str(result.elements[-1]), 'abcd')
+
+	def test_builders_made_with_plus_share_pieces_safely(self):
+		result, error = run('b = string_builder(initial="ab")\nc = b + "cd"\nd = b + "xy"\nappend(b, "!")\n(b, c, d, c + "?")')
+		self.assertEqual([str(value) for value in result.elements[-1].elements], ['ab!', 'abcd', 'abxy', 'abcd?'])
+
+class StringFunctionTests(unittest.TestCase):
+	def test_split_join_and_replace(self):
+		result, error = run('split("a b  c")\nsplit("a,b", separator=",")\njoin(("a", "b"), separator="-")\nreplace("aXa", "X", "y")')
+		self.assertEqual(repr(result.elements), "[('a', 'b', 'c'), ('a', 'b'), 'a-b', 'aya']")
+
+	def test_format(self):
+		result, error = run('format("{} and {}", values=(1, "b"))\nformat("{x:.2f}", values={"x": 1.5})')
+		self.assertEqual([str(value) for value in result.elements], ['1 and b', '1.50'])
+
+if __name__ == '__main__':
+	unittest.main()